@@ -83,4 +83,30 @@ document.addEventListener("DOMContentLoaded", function () {
       this.classList.add("active");
     });
   });
+
+  // Build-Manifest (py/build_artifacts.py) als Tabelle anzeigen, falls vorhanden
+  function renderManifest(manifest) {
+    const container = document.getElementById("artifact-manifest");
+    if (!container || !manifest || !manifest.methods) return;
+    const table = document.createElement("table");
+    table.innerHTML = "<tr><th>Method</th><th>Status</th><th>Built</th><th>Outputs</th><th>Summary</th></tr>";
+    Object.entries(manifest.methods).forEach(([method, entry]) => {
+      const row = table.insertRow();
+      row.insertCell().innerHTML = `<a href="${entry.script}"><code>${method}</code></a>`;
+      row.insertCell().innerHTML = entry.status === "ok" ? "✓" : `✗ ${entry.error || ""}`;
+      row.insertCell().textContent = entry.built;
+      row.insertCell().innerHTML = entry.outputs.map(o => `<a href="${o.path}">${o.path.replace("img/", "")}</a>`).join("<br>");
+      row.insertCell().innerHTML = Object.entries(entry.summary).map(([key, value]) =>
+        `${key} = ${typeof value === "number" ? Number(value.toPrecision(6)) : value}`).join("<br>");
+    });
+    container.appendChild(table);
+    const note = document.createElement("p");
+    note.textContent = `Manifest generated ${manifest.generated}.`;
+    container.appendChild(note);
+  }
+
+  fetch("img/manifest.json")
+    .then(response => (response.ok ? response.json() : null))
+    .then(renderManifest)
+    .catch(() => {});
 });
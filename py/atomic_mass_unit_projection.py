@@ -15,30 +15,36 @@
 #   - Print relative deviation (%)
 # ========================================================
 
-import numpy as np
-
-print("=== Atomic Mass Unit Projection Configuration ===")
-try:
-    m_p = float(input("Enter proton mass m_p (kg) [default 1.67262192369e-27]: ") or 1.67262192369e-27)
-    m_n = float(input("Enter neutron mass m_n (kg) [default 1.67492749804e-27]: ") or 1.67492749804e-27)
-    m_e = float(input("Enter electron mass m_e (kg) [default 9.1093837015e-31]: ") or 9.1093837015e-31)
-    if m_p <= 0 or m_n <= 0 or m_e <= 0:
-        raise ValueError("All masses must be positive.")
-except ValueError as e:
-    print(f"Invalid input: {e}. Using default values.")
-    m_p = 1.67262192369e-27
-    m_n = 1.67492749804e-27
-    m_e = 9.1093837015e-31
-
-# Calculate atomic mass unit
-m_C12 = 6 * (m_p + m_n + m_e)
-m_u = m_C12 / 12
-m_u_official = 1.66053906660e-27  # kg
-
-# Relative deviation
-rel_dev = (m_u - m_u_official) / m_u_official * 100
-
-print("=== Atomic Mass Unit Results ===")
-print(f"Projected m_u: {m_u:.8e} kg")
-print(f"Official m_u: {m_u_official:.8e} kg")
-print(f"Relative deviation: {rel_dev:.5f}%")
\ No newline at end of file
+M_U_OFFICIAL = 1.66053906660e-27  # kg
+
+
+def atomic_mass_unit(m_p, m_n, m_e):
+    m_C12 = 6 * (m_p + m_n + m_e)
+    return m_C12 / 12
+
+
+if __name__ == "__main__":
+    print("=== Atomic Mass Unit Projection Configuration ===")
+    try:
+        m_p = float(input("Enter proton mass m_p (kg) [default 1.67262192369e-27]: ") or 1.67262192369e-27)
+        m_n = float(input("Enter neutron mass m_n (kg) [default 1.67492749804e-27]: ") or 1.67492749804e-27)
+        m_e = float(input("Enter electron mass m_e (kg) [default 9.1093837015e-31]: ") or 9.1093837015e-31)
+        if m_p <= 0 or m_n <= 0 or m_e <= 0:
+            raise ValueError("All masses must be positive.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        m_p = 1.67262192369e-27
+        m_n = 1.67492749804e-27
+        m_e = 9.1093837015e-31
+
+    # Calculate atomic mass unit
+    m_u = atomic_mass_unit(m_p, m_n, m_e)
+    m_u_official = M_U_OFFICIAL
+
+    # Relative deviation
+    rel_dev = (m_u - m_u_official) / m_u_official * 100
+
+    print("=== Atomic Mass Unit Results ===")
+    print(f"Projected m_u: {m_u:.8e} kg")
+    print(f"Official m_u: {m_u_official:.8e} kg")
+    print(f"Relative deviation: {rel_dev:.5f}%")
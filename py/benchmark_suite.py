@@ -0,0 +1,365 @@
+# ========================================================
+# File: benchmark_suite.py
+# Purpose: Reproducible performance benchmarks of the compute kernel of every method
+# Method:
+#   - One kernel per method script, built from its importable functions with a fixed
+#     seed and a parameterized problem size (module imports and input generation are
+#     done in setup and not timed)
+#   - Wall time: best of several repeats; cheap kernels are looped (timeit autorange)
+#     so each measurement lasts at least 0.2 s
+#   - Peak memory: one extra run under tracemalloc (NumPy buffers included)
+#   - Throughput: work units of the kernel (grid-cell updates, samples, flows, ...)
+#     per second of the best wall time
+#   - Results are written as JSON; compare mode matches entries by method and size
+#     and flags time or memory growth beyond a tolerance as regressions
+# Inputs:
+# - mode: run or compare (default: run)
+# - Run: methods (default: all), preset quick/full (default: quick), repeats (default: 5),
+#   seed (default: 42), output JSON path, optional baseline JSON
+# - Compare: result and baseline JSON paths, tolerance in percent (default: 10)
+# Output:
+#   - Table of wall time, peak memory and throughput per method and size
+#   - JSON report; compare mode lists regressions and exits with status 1 if any
+# ========================================================
+
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+
+import numpy as np
+
+
+def _projection(node):
+    # Constant projection formula evaluated on sampled CODATA inputs
+    def setup(size, seed):
+        from projection_chain import NODES, evaluate_chain, sample_inputs
+        func, deps, _, _ = NODES[node]
+        values = evaluate_chain(sample_inputs(size, np.random.default_rng(seed)), deps)
+        args = [values[d] for d in deps]
+        return lambda: func(*args), size
+    return setup
+
+
+def _curvature(size, seed):
+    # size: power of z in the default entropy S = e^t + sin²x + cos y + z^n
+    import sympy as sp
+    from sympy.core.cache import clear_cache
+    from discrete_curvature_projection import einstein_tensor
+    t, x, y, z = coords = sp.symbols('t x y z')
+    S_expr = sp.exp(t) + sp.sin(x)**2 + sp.cos(y) + z**size
+
+    def kernel():
+        clear_cache()
+        return einstein_tensor(S_expr, list(coords))
+    return kernel, 4**4
+
+
+def _vector_field(size, seed):
+    from entropy_vector_field_visualization import entropy_vector_field
+    return lambda: entropy_vector_field(2.74309, 0.05894, size, seed=seed), size
+
+
+def _ray_tracing(size, seed, steps=200):
+    # size: rays through the 2D analytic profile, one RK4 step per 1/steps of the box
+    from entropic_ray_tracing import GaussianProfile, launch, trace
+    field = GaussianProfile(2)
+    r, _ = launch(field, size, np.random.default_rng(seed))
+    return lambda: trace(field, r, 0.01, 4 / steps, 4 * steps), size
+
+
+def _hessian_scale(size, seed, Ntau=10):
+    # size: cubic grid edge; Ntau meta-time steps of the stencil loop
+    from hessian_scale_analysis import evolve_entropy_field
+    return lambda: evolve_entropy_field(size, size, size, Ntau, 0.1, 0.01, 0.02, 0.04, seed=seed), \
+        size**3 * (Ntau - 1)
+
+
+def _hessian_ensemble(size, seed, n=12, Ntau=10):
+    # size: ensemble members on an n^3 grid, advanced together
+    from hessian_scale_analysis import run_ensemble
+    seeds = list(range(seed, seed + size))
+    return lambda: run_ensemble(n, n, n, Ntau, 0.1, 0.01, 0.02, 0.04, seeds, every=Ntau), \
+        size * n**3 * (Ntau - 1)
+
+
+def _lagrangian(size, seed, repeats=100):
+    from lagrangian_density_simulation import lagrangian_density
+    return lambda: lagrangian_density(2.74309, 0.05894, size, repeats, seed=seed), size * repeats
+
+
+def _lattice(size, seed, sweeps=2):
+    # size: lattice edge L; heat-bath sweeps over all 4 L^4 links
+    from lattice_yang_mills import SU2Lattice
+    lattice = SU2Lattice(size, seed=seed)
+    return lambda: [lattice.sweep() for _ in range(sweeps)], 4 * size**4 * sweeps
+
+
+def _lie_branching(size, seed):
+    # size: E8 highest weight; a fresh algebra per call so no character is memoized
+    from lie_group_branching_e8_su321 import LieAlgebra
+    algebra = LieAlgebra("E8")
+    return lambda: LieAlgebra("E8").weight_system(size), algebra.dim(size)
+
+
+def _lorentz(size, seed):
+    from lorentz_signature_detection import random_hessian_eigenvalues, signature_counts
+    return lambda: signature_counts(random_hessian_eigenvalues(size, 0.1, seed=seed)), size
+
+
+def _lensing(size, seed):
+    from montecarlo_structural_simulation import entropic_lensing
+    return lambda: entropic_lensing(size, seed=seed), size
+
+
+def _rg_landscape(size, seed):
+    # size: points per axis of the six-parameter grid around the MSSM values
+    from rg_stability_landscape_mapping import rg_landscape_scan
+    centers = (59.0, 29.6, 8.5, 6.6, 1.0, -3.0)
+    axes = [np.linspace(v - 0.05 * abs(v), v + 0.05 * abs(v), size) for v in centers]
+    return lambda: rg_landscape_scan(axes), size**6
+
+
+def _rgflow(size, seed):
+    # size: number of two-loop scenarios integrated as one batched system; the batched
+    # solution is checked once against separate one-scenario solves
+    from rgflow_ode_solver import solve_two_loop, two_loop_alpha_inv
+    rng = np.random.RandomState(seed)
+    alpha_inv0 = np.array([59.0, 29.6, 8.5]) * (1 + 0.02 * rng.randn(size, 3))
+    b = np.broadcast_to([6.6, 1.0, -3.0], (size, 3))
+    mu = np.logspace(2, 17, 50)
+    batched = two_loop_alpha_inv(*solve_two_loop(alpha_inv0, b), mu)
+    separate = np.stack([two_loop_alpha_inv(*solve_two_loop(a, b[0]), mu)[0] for a in alpha_inv0])
+    deviation = np.abs(batched - separate).max()
+    if deviation > 1e-5:
+        raise RuntimeError(f"Batched two-loop solve deviates from separate solves by {deviation:.2e}.")
+    return lambda: solve_two_loop(alpha_inv0, b), size
+
+
+def _susy(size, seed):
+    from susy_parameter_variation import susy_mass_histogram
+    return lambda: susy_mass_histogram(0.1, 0.5, 0.0, size, seed=seed), size
+
+
+def _top_yukawa(size, seed):
+    # size: number of starting values y_t(M_Z) integrated together
+    from top_yukawa_flow import solve_top_yukawa
+    y_t0 = np.linspace(0.5, 1.2, size)
+    return lambda: solve_top_yukawa(y_t0), size
+
+
+def _topological(size, seed):
+    from lorentz_signature_detection import random_hessian_eigenvalues
+    from topological_invariant_testing import invariant_count
+    return lambda: invariant_count(random_hessian_eigenvalues(size, 0.1, seed=seed)), size
+
+
+def _yang_mills(size, seed):
+    from yang_mills_field_dynamics import yang_mills_energy_density
+    return lambda: yang_mills_energy_density(2.74309, 0.05894, size, seed=seed), size
+
+
+def _yukawa_matrix(size, seed):
+    # size: number of complex 3×3 Yukawa matrices flowed together, with singular tracking
+    from yukawa_matrix_eigenflow import M_Z, solve_yukawa_matrix, track_singular_system, yukawa_matrix_stack
+    rng = np.random.RandomState(seed)
+    Y0 = np.diag([0.01, 0.04, 0.99]) + 0.01 * (rng.randn(size, 3, 3) + 1j * rng.randn(size, 3, 3))
+    t_eval = np.linspace(np.log(173 / M_Z), np.log(2.04e16 / M_Z), 100)
+    B = 4.5 / (16 * np.pi**2)
+
+    def kernel():
+        sol = solve_yukawa_matrix(Y0, 0.5, B, (t_eval[0], t_eval[-1]))
+        return track_singular_system(yukawa_matrix_stack(sol, t_eval, shape=(size, 3, 3)))
+    return kernel, size
+
+
+# method: (setup(size, seed) -> (kernel, work units), sizes (quick size first), unit)
+BENCHMARKS = {
+    "atomic_mass_unit_projection": (_projection("m_u"), (100_000, 1_000_000), "evaluations"),
+    "avogadro_constant_projection": (_projection("N_A"), (100_000, 1_000_000), "evaluations"),
+    "compton_wavelength_projection": (_projection("lambda_C"), (100_000, 1_000_000), "evaluations"),
+    "cosmo_constant_from_hubble_flow": (_projection("Lambda"), (100_000, 1_000_000), "evaluations"),
+    "discrete_curvature_projection": (_curvature, (2, 4), "Riemann components"),
+    "entropy_vector_field_visualization": (_vector_field, (100_000, 1_000_000), "samples"),
+    "entropic_ray_tracing": (_ray_tracing, (10_000, 100_000), "rays"),
+    "hessian_scale_analysis": (_hessian_scale, (24, 64), "cell updates"),
+    "hessian_scale_ensemble": (_hessian_ensemble, (8, 32), "cell updates"),
+    "hubble_constant_from_entropy": (_projection("H0"), (100_000, 1_000_000), "evaluations"),
+    "lagrangian_density_simulation": (_lagrangian, (1000, 10000), "samples"),
+    "lattice_yang_mills": (_lattice, (8, 16), "link updates"),
+    "lie_group_branching_e8_su321": (_lie_branching, ((0, 0, 0, 0, 0, 0, 0, 1), (1, 0, 0, 0, 0, 0, 0, 0),
+                                                      (1, 0, 0, 0, 0, 0, 0, 1)), "states"),
+    "lorentz_signature_detection": (_lorentz, (10_000, 1_000_000), "samples"),
+    "mass_and_g_projection": (_projection("G"), (100_000, 1_000_000), "evaluations"),
+    "montecarlo_structural_simulation": (_lensing, (100_000, 1_000_000), "rays"),
+    "planck_constant_reconstruction": (_projection("hbar"), (100_000, 1_000_000), "evaluations"),
+    "rg_stability_landscape_mapping": (_rg_landscape, (4, 8), "scenarios"),
+    "rgflow_ode_solver": (_rgflow, (1, 100), "flows"),
+    "susy_parameter_variation": (_susy, (1_000_000, 10_000_000), "samples"),
+    "thomson_cross_section_projection": (_projection("sigma_T"), (100_000, 1_000_000), "evaluations"),
+    "top_yukawa_flow": (_top_yukawa, (10, 100), "flows"),
+    "topological_invariant_testing": (_topological, (10_000, 1_000_000), "samples"),
+    "yang_mills_field_dynamics": (_yang_mills, (10_000, 100_000), "samples"),
+    "yukawa_matrix_eigenflow": (_yukawa_matrix, (1, 50), "flows"),
+}
+
+
+def run_benchmark(method, size, seed=42, repeats=5, memory=True):
+    setup, _, unit = BENCHMARKS[method]
+    kernel, work = setup(size, seed)
+    timer = timeit.Timer(kernel)
+    # autorange doubles as warm-up (lazy imports, first-touch allocations)
+    number, _ = timer.autorange()
+    times = np.array(timer.repeat(repeat=repeats, number=number)) / number
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            kernel()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {
+        "method": method, "size": size, "unit": unit, "work": int(work),
+        "repeats": repeats, "loops": number,
+        "wall_time": float(times.min()), "wall_time_mean": float(times.mean()),
+        "peak_memory": peak, "throughput": float(work / times.min()),
+    }
+
+
+def run_suite(methods=None, preset="quick", seed=42, repeats=5, memory=True, report=None):
+    results = []
+    for method in methods or BENCHMARKS:
+        sizes = BENCHMARKS[method][1]
+        for size in (sizes[:1] if preset == "quick" else sizes):
+            result = run_benchmark(method, size, seed, repeats, memory)
+            results.append(result)
+            if report is not None:
+                report(result)
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "preset": preset, "seed": seed,
+            "python": platform.python_version(), "numpy": np.__version__,
+            "platform": platform.platform(), "processor": platform.processor(),
+        },
+        "results": results,
+    }
+
+
+def _key(result):
+    return result["method"], json.dumps(result["size"])
+
+
+def compare_results(current, baseline, tolerance=0.10):
+    # Ratios current/baseline per (method, size); status regression/improvement/ok/new/missing
+    base = {_key(r): r for r in baseline["results"]}
+    rows = []
+    for r in current["results"]:
+        b = base.pop(_key(r), None)
+        if b is None:
+            rows.append({"method": r["method"], "size": r["size"], "status": "new"})
+            continue
+        time_ratio = r["wall_time"] / b["wall_time"]
+        mem_ratio = (r["peak_memory"] / b["peak_memory"]
+                     if r["peak_memory"] and b["peak_memory"] else None)
+        if time_ratio > 1 + tolerance or (mem_ratio is not None and mem_ratio > 1 + tolerance):
+            status = "regression"
+        elif time_ratio < 1 - tolerance:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append({"method": r["method"], "size": r["size"], "status": status,
+                     "time_ratio": time_ratio, "memory_ratio": mem_ratio})
+    ran = {r["method"] for r in current["results"]}
+    rows += [{"method": b["method"], "size": b["size"], "status": "missing"}
+             for b in base.values() if b["method"] in ran]
+    return rows
+
+
+def format_bytes(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def print_result(r):
+    print(f"{r['method']:<36} {str(r['size']):<26} {r['wall_time'] * 1e3:>11.3f} "
+          f"{format_bytes(r['peak_memory']):>10}  {r['throughput']:.4g} {r['unit']}/s")
+
+
+def print_comparison(rows, tolerance):
+    print(f"=== Comparison against baseline (tolerance {tolerance * 100:.0f}%) ===")
+    print(f"{'Method':<36} {'Size':<26} {'Time':>7} {'Memory':>7}  Status")
+    for row in rows:
+        t = f"{row['time_ratio']:.2f}x" if row.get("time_ratio") is not None else "-"
+        m = f"{row['memory_ratio']:.2f}x" if row.get("memory_ratio") is not None else "-"
+        flag = row["status"].upper() if row["status"] == "regression" else row["status"]
+        print(f"{row['method']:<36} {str(row['size']):<26} {t:>7} {m:>7}  {flag}")
+    n_reg = sum(row["status"] == "regression" for row in rows)
+    print(f"{n_reg} regression(s) in {len(rows)} benchmark(s)")
+    return n_reg
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    print("=== Benchmark Suite Configuration ===")
+    mode = input("Select mode run/compare [default run]: ").strip().lower() or "run"
+
+    if mode == "compare":
+        current_path = input("Enter result JSON [default img/benchmarks/benchmark_results.json]: ") \
+            or "img/benchmarks/benchmark_results.json"
+        baseline_path = input("Enter baseline JSON [default img/benchmarks/baseline.json]: ") \
+            or "img/benchmarks/baseline.json"
+        try:
+            tolerance = float(input("Enter tolerance in percent [default 10]: ") or 10) / 100
+            if tolerance < 0:
+                raise ValueError("Tolerance must be non-negative.")
+        except ValueError as e:
+            print(f"Invalid input: {e}. Using default values.")
+            tolerance = 0.10
+        n_reg = print_comparison(compare_results(load_results(current_path), load_results(baseline_path),
+                                                 tolerance), tolerance)
+        sys.exit(1 if n_reg else 0)
+
+    try:
+        methods = input("Enter methods, comma-separated [default all]: ").strip()
+        methods = [m.strip() for m in methods.split(",")] if methods else list(BENCHMARKS)
+        unknown = [m for m in methods if m not in BENCHMARKS]
+        if unknown:
+            raise ValueError(f"Unknown methods {unknown}.")
+        preset = input("Enter size preset quick/full [default quick]: ").strip().lower() or "quick"
+        if preset not in ("quick", "full"):
+            raise ValueError("Preset must be quick or full.")
+        repeats = int(input("Enter repeats per benchmark [default 5]: ") or 5)
+        seed = int(input("Enter random seed [default 42]: ") or 42)
+        if repeats <= 0:
+            raise ValueError("repeats must be positive.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        methods, preset, repeats, seed = list(BENCHMARKS), "quick", 5, 42
+    out_path = input("Enter output JSON [default img/benchmarks/benchmark_results.json]: ") \
+        or "img/benchmarks/benchmark_results.json"
+    baseline_path = input("Enter baseline JSON to compare against [default none]: ").strip()
+
+    print("=== Benchmark Results ===")
+    print(f"{'Method':<36} {'Size':<26} {'Best (ms)':>11} {'Peak mem':>10}  Throughput")
+    results = run_suite(methods, preset, seed, repeats, report=print_result)
+
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(out_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results saved to {out_path}")
+
+    if baseline_path:
+        n_reg = print_comparison(compare_results(results, load_results(baseline_path)), 0.10)
+        sys.exit(1 if n_reg else 0)
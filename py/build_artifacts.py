@@ -0,0 +1,223 @@
+# ========================================================
+# File: build_artifacts.py
+# Purpose: Incremental, parallel regeneration of the published figures and summary numbers
+# Method:
+#   - ARTIFACTS lists every method with the files its script writes to img/; a build
+#     runs the script non-interactively (default answers on stdin, figures rendered
+#     inline) and the method runner (method_runners.py) for the summary numbers
+#   - Build key: SHA-256 of the method, its stdin answers and runner parameters, and the
+#     source version of the script (result_cache.source_version: the script and every
+#     local module it imports, transitively)
+#   - A method is stale if its key changed, its last build failed, or an output is
+#     missing or differs from the recorded hash; only stale methods are rebuilt, in
+#     parallel spawned worker processes, each script run with a timeout
+#   - The manifest img/manifest.json records per method the key, status, build time,
+#     output files (path, bytes, SHA-256), summary numbers and the script log
+#     (img/build/<method>.log); the appendix of index.html renders it
+# Usage:
+#   python build_artifacts.py [method ...] [--force] [--jobs=N] [--timeout=S]   (no prompts)
+#   python build_artifacts.py                                                  (interactive)
+# ========================================================
+
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST = "img/manifest.json"
+LOG_DIR = "img/build"
+DEFAULT_TIMEOUT = 1800
+
+# method -> output files written by its script with the default answers
+ARTIFACTS = {
+    "atomic_mass_unit_projection": (),
+    "avogadro_constant_projection": (),
+    "compton_wavelength_projection": (),
+    "cosmo_constant_from_hubble_flow": (),
+    "discrete_curvature_projection": (),
+    "entropic_ray_tracing": ("img/ray_deflection_histogram.png", "img/ray_lensing_map.png"),
+    "entropy_vector_field_visualization": ("img/entropy_vectorfield_histogram.png",
+                                           "img/entropy_vectorfield_norm_sorted.png"),
+    "hessian_scale_analysis": ("img/entropy_slices.png", "img/mean_entropy_evolution.png",
+                               "img/hessian_spectra_evolution.png", "img/entropy_field.npz"),
+    "hubble_constant_from_entropy": (),
+    "lagrangian_density_simulation": ("img/lagrangian_density_simulation.png",),
+    "lattice_yang_mills": ("img/lattice_plaquette_history.png",),
+    "lie_group_branching_e8_su321": (),
+    "lorentz_signature_detection": (),
+    "mass_and_g_projection": (),
+    "montecarlo_structural_simulation": ("img/entropic_lensing_rays.png",),
+    "planck_constant_reconstruction": (),
+    "rg_stability_landscape_mapping": ("img/rg_stability_landscape.png",),
+    "rgflow_ode_solver": ("img/mssm_gauge_coupling_unification.png",),
+    "susy_parameter_variation": ("img/susy_mass_splitting.png",),
+    "thomson_cross_section_projection": (),
+    "top_yukawa_flow": ("img/top_yukawa_rg_flow.png",),
+    "topological_invariant_testing": ("img/topological_invariant_histogram.png",),
+    "yang_mills_field_dynamics": ("img/yangmills_energy_density_histogram.png",),
+    "yukawa_matrix_eigenflow": ("img/yukawa_eigenvalue_flow.png",),
+}
+# Non-default stdin answers (one per prompt) and runner parameters, per method
+INPUTS = {}
+PARAMS = {}
+
+
+def build_key(method):
+    from result_cache import source_version
+    payload = {"method": method, "inputs": INPUTS.get(method, []), "params": PARAMS.get(method, {}),
+               "outputs": list(ARTIFACTS[method]), "version": source_version(method)}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(2**20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_manifest(path=MANIFEST):
+    if not os.path.exists(path):
+        return {"methods": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_manifest(manifest, path=MANIFEST):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp, path)
+
+
+def stale_reason(method, entry):
+    # None if the recorded build is current, else why it needs a rebuild
+    if entry is None:
+        return "not built"
+    if entry["key"] != build_key(method):
+        return "inputs changed"
+    if entry["status"] != "ok":
+        return "last build failed"
+    for output in entry["outputs"]:
+        if not os.path.exists(output["path"]) or file_hash(output["path"]) != output["sha256"]:
+            return f"output {output['path']} missing or modified"
+    return None
+
+
+def _finite(value):
+    # JSON for the browser: no NaN/Infinity literals
+    return value if not isinstance(value, float) or math.isfinite(value) else None
+
+
+def build(method, key, timeout=DEFAULT_TIMEOUT):
+    # Run the script with its answers, then the runner; returns the manifest entry (in a worker process)
+    from method_runners import run_method
+    os.makedirs(LOG_DIR, exist_ok=True)
+    log = os.path.join(LOG_DIR, f"{method}.log")
+    start = time.perf_counter()
+    entry = {"key": key, "built": time.strftime("%Y-%m-%dT%H:%M:%S"), "log": log, "outputs": [], "summary": {}}
+    env = dict(os.environ, PLOT_MODE="inline")
+    answers = "".join(f"{a}\n" for a in INPUTS.get(method, [])) + "\n" * 64  # Defaults for the remaining prompts
+    try:
+        with open(log, "w") as f:
+            process = subprocess.run([sys.executable, os.path.join("py", f"{method}.py")], input=answers, text=True,
+                                     stdout=f, stderr=subprocess.STDOUT, env=env, timeout=timeout)
+        if process.returncode:
+            raise RuntimeError(f"Script exited with status {process.returncode}, see {log}.")
+        missing = [path for path in ARTIFACTS[method] if not os.path.exists(path)]
+        if missing:
+            raise RuntimeError(f"Script did not write {', '.join(missing)}.")
+        entry["outputs"] = [{"path": path, "bytes": os.path.getsize(path), "sha256": file_hash(path)}
+                            for path in ARTIFACTS[method]]
+        entry["summary"] = {k: _finite(v) for k, v in run_method(method, PARAMS.get(method, {})).items()}
+        entry["status"] = "ok"
+    except subprocess.TimeoutExpired:
+        entry.update(status="error", error=f"Script exceeded the timeout of {timeout} s.")
+    except Exception as e:
+        entry.update(status="error", error=f"{type(e).__name__}: {e}")
+    entry["elapsed"] = time.perf_counter() - start
+    return entry
+
+
+def run_build(methods=None, force=False, jobs=None, timeout=DEFAULT_TIMEOUT, report=None):
+    # Rebuild the stale methods in parallel and update the manifest after each one; returns the manifest
+    methods = list(methods or ARTIFACTS)
+    unknown = [m for m in methods if m not in ARTIFACTS]
+    if unknown:
+        raise ValueError(f"Unknown methods {unknown}.")
+    manifest = read_manifest()
+    entries = manifest["methods"]
+    stale = {}
+    for method in methods:
+        reason = "forced" if force else stale_reason(method, entries.get(method))
+        if reason:
+            stale[method] = reason
+        elif report:
+            report(method, "up to date", entries[method])
+    if stale:
+        jobs = min(jobs or os.cpu_count() or 1, len(stale))
+        with ProcessPoolExecutor(jobs, mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {executor.submit(build, m, build_key(m), timeout): m for m in sorted(stale)}
+            for future in as_completed(futures):
+                method = futures[future]
+                entries[method] = dict(future.result(), script=f"py/{method}.py")
+                manifest["generated"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+                write_manifest(manifest)
+                if report:
+                    report(method, stale[method], entries[method])
+    manifest["methods"] = {m: entries[m] for m in sorted(entries) if m in ARTIFACTS}
+    write_manifest(manifest)
+    return manifest
+
+
+def print_entry(method, reason, entry):
+    if reason == "up to date":
+        print(f"  {method:<36} up to date")
+    elif entry["status"] == "ok":
+        print(f"  {method:<36} rebuilt ({reason}) in {entry['elapsed']:.1f} s")
+    else:
+        print(f"  {method:<36} FAILED ({reason}): {entry['error']}")
+
+
+if __name__ == "__main__":
+    os.chdir(ROOT)  # Scripts write to img/ relative to the repository root
+    args = sys.argv[1:]
+    if args:
+        methods = [a for a in args if not a.startswith("--")]
+        force = "--force" in args
+        jobs = timeout = None
+        for arg in args:
+            if arg.startswith("--jobs="):
+                jobs = int(arg.split("=", 1)[1])
+            elif arg.startswith("--timeout="):
+                timeout = float(arg.split("=", 1)[1])
+    else:
+        print("=== Artifact Build Configuration ===")
+        try:
+            methods = [m.strip() for m in input("Enter methods, comma-separated [default all]: ").split(",") if m.strip()]
+            force = (input("Rebuild everything, ignoring the manifest? y/n [default n]: ").strip().lower() or "n") == "y"
+            jobs = int(input(f"Enter parallel jobs [default {os.cpu_count()}]: ") or os.cpu_count() or 1)
+            timeout = float(input(f"Enter timeout per script in seconds [default {DEFAULT_TIMEOUT}]: ") or DEFAULT_TIMEOUT)
+            if jobs <= 0 or timeout <= 0:
+                raise ValueError("jobs and timeout must be positive.")
+        except ValueError as e:
+            print(f"Invalid input: {e}. Using default values.")
+            methods, force, jobs, timeout = [], False, os.cpu_count() or 1, DEFAULT_TIMEOUT
+
+    start = time.perf_counter()
+    print("=== Artifact Build ===")
+    try:
+        manifest = run_build(methods, force, jobs, timeout or DEFAULT_TIMEOUT, report=print_entry)
+    except ValueError as e:
+        sys.exit(str(e))
+    failed = [m for m, e in manifest["methods"].items() if e["status"] != "ok" and (not methods or m in methods)]
+    print(f"Manifest written to {MANIFEST} ({time.perf_counter() - start:.1f} s)")
+    sys.exit(1 if failed else 0)
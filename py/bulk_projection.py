@@ -0,0 +1,161 @@
+# ========================================================
+# File: bulk_projection.py
+# Purpose: Stream large tabular scenario files through the constant-projection chain
+# Method:
+#   - Read CSV (header row with column names) or NPY (structured array, or 2D array
+#     with given column names) in fixed-size row chunks; NPY files are memory-mapped
+#   - Columns matching chain inputs (m_p, m_n, m_e, c, alpha, a0, L_eff, beta_H, tau,
+#     t_universe) or nodes (hbar, H0, m_u, ...) are used as given; missing inputs
+#     fall back to their central values; any other column is rejected (ValueError)
+#   - Blank CSV lines are skipped
+#   - Each chunk is evaluated as one vectorized pass through projection_chain
+#   - Derived constants and relative deviations (%) are written chunk by chunk to
+#     CSV or NPY, so memory stays bounded by the chunk size
+# Inputs:
+# - input_path: CSV or NPY file with scenario rows
+# - output_path: CSV or NPY file for results
+# - chunk_size: Rows per chunk (default: 1000000)
+# Output:
+#   - Result file with <constant> and <constant>_rel_dev columns (NPY output is a
+#     2D float array; column names go to <output>_columns.txt)
+#   - Print rows processed and throughput in rows/s and MB/s
+# ========================================================
+
+import os
+import sys
+import time
+from itertools import islice
+import numpy as np
+
+from projection_chain import INPUTS, NODES, evaluate_chain
+
+
+def output_columns(targets):
+    return [c for name in targets for c in (name, f"{name}_rel_dev")]
+
+
+def input_columns(path, columns=None):
+    # Column names of the input file (CSV header, NPY field names or the given names)
+    if path.endswith(".npy"):
+        names = np.load(path, mmap_mode="r").dtype.names
+        return list(names) if names is not None else list(columns or [])
+    with open(path) as f:
+        return [c.strip() for c in f.readline().split(",")]
+
+
+def check_columns(names):
+    unknown = [name for name in names if name not in INPUTS and name not in NODES]
+    if unknown:
+        raise ValueError(f"Unknown input columns {unknown}; expected chain inputs ({', '.join(INPUTS)}) "
+                         f"or nodes ({', '.join(NODES)}).")
+
+
+def read_csv_chunks(path, chunk_size):
+    with open(path) as f:
+        columns = [c.strip() for c in f.readline().split(",")]
+        data_lines = (line for line in f if line.strip())
+        while True:
+            lines = list(islice(data_lines, chunk_size))
+            if not lines:
+                break
+            data = np.loadtxt(lines, delimiter=",", ndmin=2)
+            yield {name: data[:, i] for i, name in enumerate(columns)}
+
+
+def read_npy_chunks(path, chunk_size, columns=None):
+    data = np.load(path, mmap_mode="r")
+    if data.dtype.names is None and columns is None:
+        raise ValueError("Plain NPY input needs column names.")
+    for start in range(0, data.shape[0], chunk_size):
+        block = data[start:start + chunk_size]
+        if data.dtype.names is not None:
+            yield {name: np.asarray(block[name], dtype=float) for name in data.dtype.names}
+        else:
+            yield {name: np.asarray(block[:, i], dtype=float) for i, name in enumerate(columns)}
+
+
+def count_rows(path):
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode="r").shape[0]
+    with open(path, "rb") as f:
+        f.readline()
+        return sum(1 for line in f if line.strip())  # Non-empty data lines, as read by read_csv_chunks
+
+
+def evaluate_rows(columns, targets):
+    n = len(next(iter(columns.values())))
+    values = {name: value for name, (value, _) in INPUTS.items()}
+    values.update(columns)
+    result = evaluate_chain(values, targets)
+    out = np.empty((n, 2 * len(targets)))
+    for k, name in enumerate(targets):
+        official = NODES[name][2]
+        out[:, 2 * k] = result[name]
+        out[:, 2 * k + 1] = (out[:, 2 * k] - official) / official * 100
+    return out
+
+
+def bulk_projection(input_path, output_path, chunk_size=1_000_000, targets=None, columns=None):
+    targets = list(targets or NODES)
+    names = output_columns(targets)
+    check_columns(input_columns(input_path, columns))
+    if input_path.endswith(".npy"):
+        chunks = read_npy_chunks(input_path, chunk_size, columns)
+    else:
+        chunks = read_csv_chunks(input_path, chunk_size)
+
+    to_npy = output_path.endswith(".npy")
+    if to_npy:
+        # Row count is needed up front for the memory-mapped result array
+        out = np.lib.format.open_memmap(output_path, mode="w+", dtype=np.float64,
+                                        shape=(count_rows(input_path), len(names)))
+        with open(output_path[:-4] + "_columns.txt", "w") as f:
+            f.write(",".join(names) + "\n")
+    else:
+        out = open(output_path, "w")
+        out.write(",".join(names) + "\n")
+
+    rows = 0
+    start_time = time.perf_counter()
+    try:
+        for chunk in chunks:
+            block = evaluate_rows(chunk, targets)
+            if to_npy:
+                out[rows:rows + len(block)] = block
+            else:
+                np.savetxt(out, block, delimiter=",", fmt="%.12e")
+            rows += len(block)
+    finally:
+        if to_npy:
+            out.flush()
+            del out
+        else:
+            out.close()
+    elapsed = time.perf_counter() - start_time
+    return rows, elapsed
+
+
+if __name__ == "__main__":
+    print("=== Bulk Projection Configuration ===")
+    input_path = input("Enter input file (.csv or .npy): ").strip()
+    output_path = input("Enter output file (.csv or .npy) [default img/bulk_projection.npy]: ").strip() or "img/bulk_projection.npy"
+    try:
+        chunk_size = int(input("Enter chunk size (rows) [default 1000000]: ") or 1000000)
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        chunk_size = 1000000
+    columns = None
+    if input_path.endswith(".npy") and np.load(input_path, mmap_mode="r").dtype.names is None:
+        columns = [c.strip() for c in input("Enter comma-separated column names of the NPY array: ").split(",")]
+
+    try:
+        rows, elapsed = bulk_projection(input_path, output_path, chunk_size=chunk_size, columns=columns)
+    except ValueError as e:
+        sys.exit(str(e))
+    size_mb = os.path.getsize(input_path) / 1e6
+    print("=== Bulk Projection Results ===")
+    print(f"Rows processed: {rows} in {elapsed:.2f} s")
+    print(f"Throughput: {rows / elapsed:.3e} rows/s ({size_mb / elapsed:.1f} MB/s input)")
+    print(f"Results written to {output_path}")
@@ -13,29 +13,35 @@
 #   - Print relative deviation (%)
 # ========================================================
 
-import numpy as np
-
-# Interaktive Eingaben
-print("=== Cosmological Constant Calculation Configuration ===")
-try:
-    H0_proj = float(input("Enter projected Hubble constant H0_proj (1/s) [default 2.26908425e-18]: ") or 2.26908425e-18)
-    c = float(input("Enter speed of light c (m/s) [default 2.99792458e8]: ") or 2.99792458e8)
-    if H0_proj <= 0 or c <= 0:
-        raise ValueError("H0_proj and c must be positive.")
-except ValueError as e:
-    print(f"Invalid input: {e}. Using default values.")
-    H0_proj = 2.26908425e-18
-    c = 2.99792458e8
-
-# Calculate cosmological constant Λ
-Lambda_proj = 3 * H0_proj**2 / c**2
-Lambda_official = 1.1056e-52  # m^-2 (official value)
-
-# Relative deviation calculation
-rel_dev = (Lambda_proj - Lambda_official) / Lambda_official * 100
-
-# Output
-print("=== Cosmological Constant from Projected Hubble Constant ===")
-print(f"Λ_proj = {Lambda_proj:.10e} m^-2")
-print(f"Λ_official = {Lambda_official:.10e} m^-2")
-print(f"Relative deviation: {rel_dev:.5f}%")
\ No newline at end of file
+LAMBDA_OFFICIAL = 1.1056e-52  # m^-2 (official value)
+
+
+def cosmological_constant(H0_proj, c):
+    return 3 * H0_proj**2 / c**2
+
+
+if __name__ == "__main__":
+    # Interaktive Eingaben
+    print("=== Cosmological Constant Calculation Configuration ===")
+    try:
+        H0_proj = float(input("Enter projected Hubble constant H0_proj (1/s) [default 2.26908425e-18]: ") or 2.26908425e-18)
+        c = float(input("Enter speed of light c (m/s) [default 2.99792458e8]: ") or 2.99792458e8)
+        if H0_proj <= 0 or c <= 0:
+            raise ValueError("H0_proj and c must be positive.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        H0_proj = 2.26908425e-18
+        c = 2.99792458e8
+
+    # Calculate cosmological constant Λ
+    Lambda_proj = cosmological_constant(H0_proj, c)
+    Lambda_official = LAMBDA_OFFICIAL
+
+    # Relative deviation calculation
+    rel_dev = (Lambda_proj - Lambda_official) / Lambda_official * 100
+
+    # Output
+    print("=== Cosmological Constant from Projected Hubble Constant ===")
+    print(f"Λ_proj = {Lambda_proj:.10e} m^-2")
+    print(f"Λ_official = {Lambda_official:.10e} m^-2")
+    print(f"Relative deviation: {rel_dev:.5f}%")
@@ -7,55 +7,102 @@
 #   - Compute Gμν = Rμν - ½ R gμν
 # Output:
 #   - Printed symbolic Einstein tensor Gμν
+# Instrumentation:
+#   - INSTRUMENT=time|memory or --instrument[=memory] times metric, inverse, Γ, Riemann,
+#     Ricci, scalar and Einstein phases (simplification reported separately inside each)
+#     and writes img/discrete_curvature_projection_instrumentation.json
 # ========================================================
 
-import numpy as np
-from numpy.linalg import inv
-import sympy as sp
-
-x = sp.symbols('t x y z')
-coords = [x[0], x[1], x[2], x[3]]
-
-S_expr = sp.exp(x[0]) + sp.sin(x[1])**2 + sp.cos(x[2]) + x[3]**2
-Hessian = sp.hessian(S_expr, coords)
-g = sp.Matrix(Hessian)
-g_inv = g.inv()
-
-Gamma = [[[0 for _ in range(4)] for _ in range(4)] for _ in range(4)]
-for l in range(4):
-    for m in range(4):
-        for n in range(4):
-            term = 0
-            for k in range(4):
-                term += g_inv[l, k] * (
-                    sp.diff(g[k, m], coords[n]) +
-                    sp.diff(g[k, n], coords[m]) -
-                    sp.diff(g[m, n], coords[k])
-                )
-            Gamma[l][m][n] = sp.simplify(0.5 * term)
-
-Riemann = [[[[0 for _ in range(4)] for _ in range(4)] for _ in range(4)] for _ in range(4)]
-for rho in range(4):
-    for sigma in range(4):
-        for mu in range(4):
-            for nu in range(4):
-                term1 = sp.diff(Gamma[rho][sigma][nu], coords[mu])
-                term2 = sp.diff(Gamma[rho][sigma][mu], coords[nu])
-                term3 = sum(Gamma[rho][mu][k] * Gamma[k][sigma][nu] for k in range(4))
-                term4 = sum(Gamma[rho][nu][k] * Gamma[k][sigma][mu] for k in range(4))
-                Riemann[rho][sigma][mu][nu] = sp.simplify(term1 - term2 + term3 - term4)
-
-Ricci = sp.zeros(4)
-for mu in range(4):
-    for nu in range(4):
-        Ricci[mu, nu] = sum(Riemann[l][mu][l][nu] for l in range(4))
-Ricci = sp.simplify(Ricci)
-
-Ricci_scalar = sum(g_inv[i, j] * Ricci[i, j] for i in range(4) for j in range(4))
-Ricci_scalar = sp.simplify(Ricci_scalar)
-
-Einstein = Ricci - 0.5 * Ricci_scalar * g
-Einstein = sp.simplify(Einstein)
-
-print("=== Einstein Tensor from Entropic Metric ===")
-sp.pprint(Einstein)
+from instrumentation import profiler
+
+
+def default_entropy():
+    import sympy as sp
+    x = sp.symbols('t x y z')
+    coords = [x[0], x[1], x[2], x[3]]
+    S_expr = sp.exp(x[0]) + sp.sin(x[1])**2 + sp.cos(x[2]) + x[3]**2
+    return S_expr, coords
+
+
+def entropy_metric(S_expr, coords):
+    import sympy as sp
+    return sp.Matrix(sp.hessian(S_expr, coords))
+
+
+def christoffel_symbols(g, g_inv, coords):
+    import sympy as sp
+    Gamma = [[[0 for _ in range(4)] for _ in range(4)] for _ in range(4)]
+    for l in range(4):
+        for m in range(4):
+            for n in range(4):
+                term = 0
+                for k in range(4):
+                    term += g_inv[l, k] * (
+                        sp.diff(g[k, m], coords[n]) +
+                        sp.diff(g[k, n], coords[m]) -
+                        sp.diff(g[m, n], coords[k])
+                    )
+                with profiler.phase("simplify"):
+                    Gamma[l][m][n] = sp.simplify(0.5 * term)
+    profiler.add(components=4**3)
+    return Gamma
+
+
+def riemann_tensor(Gamma, coords):
+    import sympy as sp
+    Riemann = [[[[0 for _ in range(4)] for _ in range(4)] for _ in range(4)] for _ in range(4)]
+    for rho in range(4):
+        for sigma in range(4):
+            for mu in range(4):
+                for nu in range(4):
+                    term1 = sp.diff(Gamma[rho][sigma][nu], coords[mu])
+                    term2 = sp.diff(Gamma[rho][sigma][mu], coords[nu])
+                    term3 = sum(Gamma[rho][mu][k] * Gamma[k][sigma][nu] for k in range(4))
+                    term4 = sum(Gamma[rho][nu][k] * Gamma[k][sigma][mu] for k in range(4))
+                    with profiler.phase("simplify"):
+                        Riemann[rho][sigma][mu][nu] = sp.simplify(term1 - term2 + term3 - term4)
+    profiler.add(components=4**4)
+    return Riemann
+
+
+def ricci_tensor(Riemann):
+    import sympy as sp
+    Ricci = sp.zeros(4)
+    for mu in range(4):
+        for nu in range(4):
+            Ricci[mu, nu] = sum(Riemann[l][mu][l][nu] for l in range(4))
+    with profiler.phase("simplify"):
+        return sp.simplify(Ricci)
+
+
+def einstein_tensor(S_expr, coords):
+    import sympy as sp
+    with profiler.phase("metric"):
+        g = entropy_metric(S_expr, coords)
+    with profiler.phase("inverse"):
+        g_inv = g.inv()
+    with profiler.phase("christoffel"):
+        Gamma = christoffel_symbols(g, g_inv, coords)
+    with profiler.phase("riemann"):
+        Riemann = riemann_tensor(Gamma, coords)
+    with profiler.phase("ricci"):
+        Ricci = ricci_tensor(Riemann)
+    with profiler.phase("scalar"):
+        Ricci_scalar = sp.simplify(sum(g_inv[i, j] * Ricci[i, j] for i in range(4) for j in range(4)))
+    with profiler.phase("einstein"):
+        return sp.simplify(Ricci - 0.5 * Ricci_scalar * g)
+
+
+if __name__ == "__main__":
+    import sympy as sp
+    from instrumentation import configure_from_environment, print_report
+
+    configure_from_environment()
+    Einstein = einstein_tensor(*default_entropy())
+    print("=== Einstein Tensor from Entropic Metric ===")
+    sp.pprint(Einstein)
+
+    report_path = profiler.write("discrete_curvature_projection")
+    if report_path:
+        print_report(profiler.report("discrete_curvature_projection"))
+        print(f"Instrumentation report saved to {report_path}")
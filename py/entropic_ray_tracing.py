@@ -0,0 +1,300 @@
+# ========================================================
+# File: entropic_ray_tracing.py
+# Purpose: Propagate light rays through entropy fields and map the entropic lensing deflection
+# Method:
+#   - Refractive index n(r) = 1 + α S(r); rays obey the eikonal equation
+#     dr/ds = p / n, dp/ds = ∇n with p = n t (t: unit tangent), integrated with a
+#     classical RK4 step of fixed length h, for a whole chunk of rays at once
+#   - Fields: the analytic profile S = A exp(-r²/w²) of montecarlo_structural_simulation.py
+#     (2D or 3D, exact gradient), or a gridded field (e.g. the final entropy field saved by
+#     hessian_scale_analysis.py to img/entropy_field.npz) with S and its central-difference
+#     gradient interpolated (bi/trilinear) from the cell corners
+#   - A parallel beam enters the box along +x at uniformly sampled impact parameters b;
+#     rays leaving the box (or exceeding the step budget) are retired from the active set,
+#     so the remaining steps only integrate rays still inside
+#   - Rays are traced in chunks with their own seeds (spawned from one base seed, so the
+#     result does not depend on the process count), in parallel worker processes; each
+#     chunk returns only histogram counts and sums, so memory stays bounded for 10^7 rays
+#   - Deflection θ_r: exit direction projected on the impact direction b̂ (negative =
+#     bent towards the center); checked against the weak-field (Born) deflection of
+#     the Gaussian profile, θ(b) = -2√π α A (b/w) exp(-b²/w²)
+# Inputs:
+# - field analytic/grid (default: analytic), dimension (default: 2) or field file,
+#   rays N (default: 1000000), lensing strength α (default: 0.01), steps per box length
+#   (default: 200, gridded fields: 2 per cell), processes (default: all cores), seed (default: 42)
+# Output:
+#   - Deflection statistics, Born check (analytic field), rays per second
+#   - img/ray_deflection_histogram.png and img/ray_lensing_map.png
+# ========================================================
+
+import os
+from itertools import product
+
+import numpy as np
+
+CHUNK_RAYS = 2**16
+PILOT_RAYS = 4096
+BINS = 200
+
+
+class GaussianProfile:
+    # S = A exp(-|r|²/w²) on the box [-extent, extent]^d
+    def __init__(self, d=2, amplitude=1.0, width=1.0, extent=2.0):
+        self.d, self.amplitude, self.width = d, amplitude, width
+        self.lo, self.hi = np.full(d, -extent), np.full(d, extent)
+
+    def __call__(self, r):
+        S = self.amplitude * np.exp(-np.sum(r**2, axis=0) / self.width**2)
+        return S, (-2 / self.width**2) * S * r
+
+
+class GridField:
+    # Gridded S with linear interpolation of S and ∇S between the 2^d cell corners
+    def __init__(self, S, dx, origin=None):
+        S = np.asarray(S, dtype=float)
+        self.d, self.dx, self.shape = S.ndim, dx, np.array(S.shape)
+        self.lo = np.zeros(self.d) if origin is None else np.asarray(origin, dtype=float)
+        self.hi = self.lo + (self.shape - 1) * dx
+        grads = np.gradient(S, dx) if self.d > 1 else [np.gradient(S, dx)]
+        self.data = np.stack([S, *grads]).reshape(self.d + 1, -1)
+        self.strides = np.cumprod([1, *self.shape[:0:-1]])[::-1]  # C order
+        self.offsets = [int(np.dot(corner, self.strides)) for corner in product((0, 1), repeat=self.d)]
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as f:
+            return cls(f["S"], float(f["dx"]))
+
+    def __call__(self, r):
+        u = (r - self.lo[:, None]) / self.dx
+        i = np.clip(u.astype(np.intp), 0, self.shape[:, None] - 2)
+        f = u - i
+        base = np.dot(self.strides, i)
+        weights = [(1 - f[k], f[k]) for k in range(self.d)]
+        out = 0.0
+        for corner, offset in zip(product((0, 1), repeat=self.d), self.offsets):
+            w = weights[0][corner[0]]
+            for k in range(1, self.d):
+                w = w * weights[k][corner[k]]
+            out = out + w * np.take(self.data, base + offset, axis=1)
+        return out[0], out[1:]
+
+
+def launch(field, n, rng):
+    # Parallel beam along +x: entry points on the x = lo face, impact parameters b relative to its center
+    d, lo, hi = field.d, field.lo, field.hi
+    r = np.empty((d, n))
+    r[0] = lo[0]
+    r[1:] = rng.uniform(lo[1:, None], hi[1:, None], (d - 1, n))
+    return r, r[1:] - (lo[1:, None] + hi[1:, None]) / 2
+
+
+def trace(field, r, alpha, h, max_steps):
+    # RK4 on (r, p) for the active rays; returns exit directions t (d, n) and the escaped mask
+    def rhs(r, p):
+        S, grad = field(r)
+        return p / (1 + alpha * S), alpha * grad
+
+    S, _ = field(r)
+    p = np.zeros_like(r)
+    p[0] = 1 + alpha * S
+    t_out = np.empty_like(r)
+    escaped = np.zeros(r.shape[1], dtype=bool)
+    active = np.arange(r.shape[1])
+    lo, hi = field.lo[:, None], field.hi[:, None]
+    for step in range(max_steps):
+        k1r, k1p = rhs(r, p)
+        k2r, k2p = rhs(r + h / 2 * k1r, p + h / 2 * k1p)
+        k3r, k3p = rhs(r + h / 2 * k2r, p + h / 2 * k2p)
+        k4r, k4p = rhs(r + h * k3r, p + h * k3p)
+        r = r + h / 6 * (k1r + 2 * k2r + 2 * k3r + k4r)
+        p = p + h / 6 * (k1p + 2 * k2p + 2 * k3p + k4p)
+        inside = np.all((r >= lo) & (r <= hi), axis=0)
+        if not inside.all():
+            done = ~inside
+            t_out[:, active[done]] = p[:, done] / np.linalg.norm(p[:, done], axis=0)
+            r, p, active = r[:, inside], p[:, inside], active[inside]
+            if not active.size:
+                break
+    if active.size:
+        t_out[:, active] = p / np.linalg.norm(p, axis=0)
+        escaped[active] = True
+    return t_out, escaped
+
+
+def deflection(t, b):
+    # Radial deflection θ_r (towards b̂ positive) and total deflection |θ| in degrees
+    b_norm = np.linalg.norm(b, axis=0)
+    b_hat = b / np.where(b_norm > 0, b_norm, 1)
+    theta_r = np.degrees(np.arctan2(np.sum(t[1:] * b_hat, axis=0), t[0]))
+    theta = np.degrees(np.arccos(np.clip(t[0], -1, 1)))
+    return theta_r, theta, b_norm
+
+
+def born_deflection(b, alpha, amplitude=1.0, width=1.0):
+    # Weak-field deflection of the Gaussian profile (degrees)
+    return np.degrees(-2 * np.sqrt(np.pi) * alpha * amplitude * b / width * np.exp(-(b / width)**2))
+
+
+def trace_chunk(field, n, seed, alpha, h, max_steps, theta_max, b_max):
+    # Histogram counts and sums of one chunk of rays
+    r, b = launch(field, n, np.random.default_rng(seed))
+    t, escaped = trace(field, r, alpha, h, max_steps)
+    theta_r, theta, b_norm = deflection(t, b)
+    return {
+        "theta_r": np.histogram(theta_r, BINS, (-theta_max, theta_max))[0],
+        "theta": np.histogram(theta, BINS, (0, theta_max))[0],
+        "map": np.histogram2d(b_norm, theta_r, BINS, ((0, b_max), (-theta_max, theta_max)))[0],
+        "sums": np.array([n, theta_r.sum(), (theta_r**2).sum(), theta.sum(), escaped.sum()]),
+        "theta_abs_max": float(theta.max()),
+    }
+
+
+_FIELD = None
+
+
+def _init_worker(field):
+    global _FIELD
+    _FIELD = field
+
+
+def _worker_chunk(*args):
+    return trace_chunk(_FIELD, *args)
+
+
+def default_steps(field):
+    # RK4 steps per box length: 200 for analytic profiles, 2 per cell for gridded (piecewise-linear) fields
+    return 2 * int(field.shape[0] - 1) if isinstance(field, GridField) else 200
+
+
+def lensing_map(field, N, alpha=0.01, steps=None, processes=None, seed=42, chunk=CHUNK_RAYS, report=None):
+    # Trace N rays in chunks over `processes` workers; returns the summed histograms and statistics
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    steps = steps or default_steps(field)
+    length = field.hi[0] - field.lo[0]
+    h, max_steps = length / steps, 4 * steps
+    b_max = float(np.linalg.norm((field.hi[1:] - field.lo[1:]) / 2))
+    pilot_r, pilot_b = launch(field, PILOT_RAYS, np.random.default_rng([seed, 1]))
+    theta_max = 1.2 * float(np.abs(deflection(trace(field, pilot_r, alpha, h, max_steps)[0], pilot_b)[:2]).max()) or 1.0
+
+    sizes = [min(chunk, N - start) for start in range(0, N, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(n, s, alpha, h, max_steps, theta_max, b_max) for n, s in zip(sizes, seeds)]
+    processes = processes or os.cpu_count() or 1
+    total = None
+    if processes > 1:
+        with ProcessPoolExecutor(processes, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_worker, initargs=(field,)) as executor:
+            results = executor.map(_worker_chunk, *zip(*tasks))
+            for done, result in enumerate(results, 1):
+                total = _accumulate(total, result)
+                if report:
+                    report(done, len(tasks))
+    else:
+        for done, task in enumerate(tasks, 1):
+            total = _accumulate(total, trace_chunk(field, *task))
+            if report:
+                report(done, len(tasks))
+    n, s1, s2, s_abs, escaped = total["sums"]
+    total.update(N=int(n), theta_r_mean=s1 / n, theta_r_std=np.sqrt(max(s2 / n - (s1 / n)**2, 0)),
+                 theta_mean=s_abs / n, escaped=int(escaped), theta_max=theta_max, b_max=b_max, h=h)
+    return total
+
+
+def _accumulate(total, result):
+    if total is None:
+        return result
+    for key in ("theta_r", "theta", "map", "sums"):
+        total[key] = total[key] + result[key]
+    total["theta_abs_max"] = max(total["theta_abs_max"], result["theta_abs_max"])
+    return total
+
+
+def plot_deflection_histogram(plt, theta_r, theta, theta_max):
+    fig, axes = plt.subplots(1, 2, figsize=(11, 4))
+    edges = np.linspace(-theta_max, theta_max, len(theta_r) + 1)
+    axes[0].stairs(theta_r, edges, fill=True, color='blue', alpha=0.7)
+    axes[0].set_xlabel('Radial deflection θ_r [°] (negative: towards the center)')
+    axes[0].set_title('Radial Deflection Distribution')
+    edges = np.linspace(0, theta_max, len(theta) + 1)
+    axes[1].stairs(theta, edges, fill=True, color='green', alpha=0.7)
+    axes[1].set_xlabel('Total deflection |θ| [°]')
+    axes[1].set_title('Total Deflection Distribution')
+    for ax in axes:
+        ax.set_ylabel('Rays')
+        ax.grid(True)
+    plt.tight_layout()
+
+
+def plot_lensing_map(plt, counts, b_max, theta_max, born_b, born_theta):
+    plt.figure(figsize=(8, 6))
+    plt.imshow(np.log1p(counts.T), origin='lower', aspect='auto', cmap='viridis',
+               extent=(0, b_max, -theta_max, theta_max))
+    plt.colorbar(label='log(1 + rays)')
+    if len(born_b):
+        plt.plot(born_b, born_theta, 'r--', label='Born approximation')
+        plt.legend()
+    plt.xlabel('Impact parameter |b|')
+    plt.ylabel('Radial deflection θ_r [°]')
+    plt.title('Entropic Lensing Map')
+
+
+if __name__ == "__main__":
+    import time
+
+    from plot_backend import submit_figure, wait_for_figures
+
+    print("=== Entropic Ray Tracing Configuration ===")
+    try:
+        source = input("Select field analytic/grid [default analytic]: ").strip().lower() or "analytic"
+        if source == "grid":
+            path = input("Enter field file (.npz with S, dx) [default img/entropy_field.npz]: ").strip() \
+                or "img/entropy_field.npz"
+            field = GridField.load(path)
+        elif source == "analytic":
+            d = int(input("Enter dimension 2/3 [default 2]: ") or 2)
+            if d not in (2, 3):
+                raise ValueError("Dimension must be 2 or 3.")
+            field = GaussianProfile(d)
+        else:
+            raise ValueError(f"Unknown field {source}.")
+        N = int(float(input("Enter number of rays N [default 1000000]: ") or 1000000))
+        alpha = float(input("Enter lensing strength alpha [default 0.01]: ") or 0.01)
+        steps = int(input(f"Enter RK4 steps per box length [default {default_steps(field)}]: ") or default_steps(field))
+        processes = int(input(f"Enter worker processes [default {os.cpu_count()}]: ") or os.cpu_count() or 1)
+        seed = int(input("Enter random seed [default 42]: ") or 42)
+        if N <= 0 or steps <= 0 or processes <= 0:
+            raise ValueError("N, steps and processes must be positive.")
+    except (ValueError, OSError, KeyError) as e:
+        print(f"Invalid input: {e}. Using default values.")
+        source, field, N, alpha, steps, processes, seed = "analytic", GaussianProfile(2), 1000000, 0.01, 200, \
+            os.cpu_count() or 1, 42
+
+    start = time.perf_counter()
+    result = lensing_map(field, N, alpha, steps, processes, seed,
+                         report=lambda done, total: print(f"\r  chunks {done}/{total}", end="", flush=True))
+    elapsed = time.perf_counter() - start
+
+    print("\n=== Entropic Ray Tracing Results ===")
+    print(f"Rays: {result['N']} through a {field.d}D {source} field, α = {alpha}, h = {result['h']:.4g}")
+    print(f"Mean radial deflection: {result['theta_r_mean']:.6f}° (σ = {result['theta_r_std']:.6f}°)")
+    print(f"Mean total deflection:  {result['theta_mean']:.6f}°, max {result['theta_abs_max']:.6f}°")
+    if result["escaped"]:
+        print(f"Warning: {result['escaped']} rays still inside after the step budget")
+    born_b = born_theta = np.array([])
+    if source == "analytic":
+        born_b = np.linspace(0, result["b_max"], 200)
+        born_theta = born_deflection(born_b, alpha)
+        sample = launch(field, PILOT_RAYS, np.random.default_rng(seed))
+        theta_r, _, b = deflection(trace(field, sample[0], alpha, result["h"], 4 * steps)[0], sample[1])
+        print(f"Born check (weak field): max |θ_r - θ_Born| = {np.abs(theta_r - born_deflection(b, alpha)).max():.3e}°"
+              f" of max |θ_Born| = {np.abs(born_theta).max():.3e}°")
+    print(f"Throughput: {result['N'] / elapsed:.4g} rays per second ({elapsed:.1f} s, {processes} process(es))")
+
+    submit_figure(plot_deflection_histogram, "img/ray_deflection_histogram.png",
+                  theta_r=result["theta_r"], theta=result["theta"], theta_max=result["theta_max"])
+    submit_figure(plot_lensing_map, "img/ray_lensing_map.png", counts=result["map"], b_max=result["b_max"],
+                  theta_max=result["theta_max"], born_b=born_b, born_theta=born_theta)
+    wait_for_figures()
@@ -8,99 +8,72 @@
 # Description of calculation steps:
 # - Initialize entropy field S with noise around 0.5
 # - Iterate over meta-time, update S via diffusion and nonlinear source term based on gradient magnitude
-# - Calculate statistics at selected meta-times
-# - Visualize 2D slices at mid-plane and mean entropy evolution
-# - Compute 3D Hessian matrix of entropy at global max position, eigenvalues
-# - Compute 4D Hessian including meta-time dimension, eigenvalues
+# - Analyses run in situ on the live field during stepping (run_in_situ); only the last
+#   three meta-time levels are kept, no history:
+#   - moments (mean, σ, min, max) every step, mid-plane slices at selected meta-times
+#   - global max tracked every k steps, with the 3D Hessian there and the 4D Hessian
+#     including meta-time (central level of the three-level window)
+# - Optional early stop once the field has flattened (σ below a minimum)
+# - Ensemble mode (E > 1): E realizations (own seed, D and threshold) advance together on
+#   a leading array axis, so each stencil pass serves several members; per-member
+#   mean-entropy curves and Hessian eigenvalues at the maxima are aggregated online
+# - Visualize 2D slices at mid-plane, mean entropy evolution and Hessian spectra evolution
+# - Save the final field to img/entropy_field.npz (S, dx) for entropic_ray_tracing.py
+# - Print statistics at selected meta-times and the final 3D/4D Hessians with eigenvalues
 # Input:
 # - Nx - Nz, #meta-time steps, time resolution dx & dtau, diffusion coeff. D, source threshold and grid size
+# - seed: Random seed of the initial noise (default: none); seeded runs are memoized in the
+#   result cache (result_cache.py), so repeated configurations skip the evolution
+# - k: analysis interval of the max tracking and Hessians (default: 10)
+# - min_std: early-stop threshold of σ(S) (default: none)
+# - E: ensemble size (default: 1); members use seeds seed+e (seed default 0) and optional
+#   comma-separated per-member D and threshold values
+# Instrumentation:
+# - INSTRUMENT=time|memory or --instrument[=memory] times the phases (stepping with its
+#   laplacian/gradient/source parts, the in-situ analyses, plotting), counts stencil
+#   steps and cell updates and writes img/hessian_scale_analysis_instrumentation.json
 # =============================================================================
 
-# Interaktive Eingaben
-print("=== Hessian Scale Analysis Configuration ===")
-try:
-    Nx = int(input("Enter grid size Nx [default 50]: ") or 50)
-    Ny = int(input("Enter grid size Ny [default 50]: ") or 50)
-    Nz = int(input("Enter grid size Nz [default 50]: ") or 50)
-    Ntau = int(input("Enter number of meta-time steps Ntau [default 600]: ") or 600)
-    dx = float(input("Enter spatial resolution dx [default 0.1]: ") or 0.1)
-    dtau = float(input("Enter meta-time resolution dtau [default 0.01]: ") or 0.01)
-    D = float(input("Enter diffusion coefficient D [default 0.02]: ") or 0.02)
-    threshold = float(input("Enter source threshold [default 0.04]: ") or 0.04)
-    if Nx <= 0 or Ny <= 0 or Nz <= 0 or Ntau <= 0 or dx <= 0 or dtau <= 0 or D < 0:
-        raise ValueError("Grid sizes, steps, and diffusion must be positive.")
-    if Nx > 100 or Ny > 100 or Nz > 100 or Ntau > 1000:
-        raise ValueError("Grid sizes or Ntau too large for performance.")
-except ValueError as e:
-    print(f"Invalid input: {e}. Using default values.")
-    Nx, Ny, Nz = 50, 50, 50
-    Ntau = 600
-    dx = dtau = 0.1
-    D = 0.02
-    threshold = 0.04
-
-# Simulation: Entropy field
-S = np.zeros((Nx, Ny, Nz, Ntau))
-S[..., 0] = 0.5 + 0.15 * np.random.randn(Nx, Ny, Nz)
-
-for t in range(1, Ntau):
-    laplacian_S = (
-        np.roll(S[..., t-1], 1, axis=0) + np.roll(S[..., t-1], -1, axis=0) +
-        np.roll(S[..., t-1], 1, axis=1) + np.roll(S[..., t-1], -1, axis=1) +
-        np.roll(S[..., t-1], 1, axis=2) + np.roll(S[..., t-1], -1, axis=2) -
-        6 * S[..., t-1]
-    ) / (dx**2)
-
-    grad_x, grad_y, grad_z = np.gradient(S[..., t-1], dx, edge_order=2)
-    grad_magnitude = np.sqrt(grad_x**2 + grad_y**2 + grad_z**2)
-
-    source = 0.5 * np.tanh(20 * (grad_magnitude - threshold)) * (grad_magnitude > threshold)
-    S[..., t] = S[..., t-1] + dtau * (D * laplacian_S + source)
-
-# Statistics
-time_steps = [0, Ntau//4, Ntau//2, 3*Ntau//4, Ntau-1]
-print("Statistical Summary at Selected τ:")
-for t in time_steps:
-    snapshot = S[..., t]
-    avg = np.mean(snapshot)
-    std = np.std(snapshot)
-    s_min = np.min(snapshot)
-    s_max = np.max(snapshot)
-    print(f"  τ = {t*dtau:.2f} → ⟨S⟩ = {avg:.5f}, σ = {std:.5f}, min = {s_min:.5f}, max = {s_max:.5f}")
-
-final_slice = S[..., -1]
-max_val = np.max(final_slice)
-max_pos = np.unravel_index(np.argmax(final_slice), final_slice.shape)
-print(f"\nGlobal max at τ = {Ntau*dtau:.2f}: S = {max_val:.5f} at position (x, y, z) = {max_pos}")
-
-# --- Visualization ---
-z_mid = Nz // 2
-fig, axes = plt.subplots(1, len(time_steps), figsize=(16, 3))
-for i, t in enumerate(time_steps):
-    im = axes[i].imshow(S[:, :, z_mid, t], origin='lower', cmap='inferno',
-                        vmin=np.min(S[:, :, z_mid, t]), vmax=np.max(S[:, :, z_mid, t]))
-    axes[i].set_title(f'Meta-time τ={t*dtau:.2f}')
-    axes[i].axis('off')
-fig.colorbar(im, ax=axes.ravel().tolist(), shrink=0.6, label='Entropy S')
-plt.suptitle('2D Mid-Plane Entropy Slices (Aggressive Nonlinear Dynamics)', fontsize=14)
-plt.savefig('img/entropy_slices.png')
-plt.show()
-
-mean_entropy = np.mean(S, axis=(0, 1, 2))
-plt.figure(figsize=(8, 4))
-plt.plot(np.arange(Ntau) * dtau, mean_entropy, color='blue')
-plt.xlabel('Meta-Time τ')
-plt.ylabel('Average Entropy ⟨S⟩')
-plt.title('Mean Entropy Evolution with Enhanced Nonlinearity')
-plt.grid(True)
-plt.savefig('img/mean_entropy_evolution.png')
-plt.show()
-
-# --- 3D Hessian at global maximum (with boundary check) ---
-x0, y0, z0 = max_pos
-if not (1 <= x0 < Nx-1 and 1 <= y0 < Ny-1 and 1 <= z0 < Nz-1):
-    print(f"Warning: global max position {max_pos} too close to boundary, using center point (25,25,25).")
-    x0, y0, z0 = 25, 25, 25
+from collections import deque
+
+import numpy as np
+
+from instrumentation import profiler
+
+
+def entropy_step(S_prev, dx, dtau, D, threshold):
+    # One explicit meta-time step: diffusion plus gradient-triggered nonlinear source.
+    # Space is the last three axes; an ensemble (E, Nx, Ny, Nz) takes D and threshold
+    # as scalars or per-member arrays of shape (E, 1, 1, 1)
+    with profiler.phase("laplacian"):
+        laplacian_S = (
+            np.roll(S_prev, 1, axis=-3) + np.roll(S_prev, -1, axis=-3) +
+            np.roll(S_prev, 1, axis=-2) + np.roll(S_prev, -1, axis=-2) +
+            np.roll(S_prev, 1, axis=-1) + np.roll(S_prev, -1, axis=-1) -
+            6 * S_prev
+        ) / (dx**2)
+
+    with profiler.phase("gradient"):
+        grad_x, grad_y, grad_z = np.gradient(S_prev, dx, axis=(-3, -2, -1), edge_order=2)
+        grad_magnitude = np.sqrt(grad_x**2 + grad_y**2 + grad_z**2)
+
+    with profiler.phase("source"):
+        source = 0.5 * np.tanh(20 * (grad_magnitude - threshold)) * (grad_magnitude > threshold)
+        return S_prev + dtau * (D * laplacian_S + source)
+
+
+def evolve_entropy_field(Nx, Ny, Nz, Ntau, dx, dtau, D, threshold, seed=None):
+    # Full meta-time history S[x, y, z, τ]
+    with profiler.phase("initialization"):
+        rng = np.random.RandomState(seed)
+        S = np.zeros((Nx, Ny, Nz, Ntau))
+        S[..., 0] = 0.5 + 0.15 * rng.randn(Nx, Ny, Nz)
+    with profiler.phase("stepping"):
+        for t in range(1, Ntau):
+            S[..., t] = entropy_step(S[..., t-1], dx, dtau, D, threshold)
+        profiler.add(steps=Ntau - 1, cell_updates=(Ntau - 1) * Nx * Ny * Nz)
+    return S
+
 
 def compute_hessian_3d(S_3d, dx, x, y, z):
     def second_derivative(arr, axis, i, j, k):
@@ -128,14 +101,6 @@ def compute_hessian_3d(S_3d, dx, x, y, z):
     H[1,2] = H[2,1] = mixed_derivative(S_3d, 1, 2, x, y, z)
     return H
 
-S_final = S[..., -1]
-H3d = compute_hessian_3d(S_final, dx, x0, y0, z0)
-eigvals3d = np.linalg.eigvalsh(H3d)
-print(f"\n3D Hessian I_μν at (x={x0}, y={y0}, z={z0}):\n{np.round(H3d,6)}")
-print(f"Eigenvalues (3D metric signature):\n{np.round(eigvals3d,6)}")
-
-# --- 4D Hessian including meta-time ---
-tau0 = Ntau-1
 
 def second_derivative_4d(arr, axis, i, j, k, l, dx, dtau):
     if axis == 0:
@@ -147,6 +112,7 @@ def second_derivative_4d(arr, axis, i, j, k, l, dx, dtau):
     elif axis == 3:
         return (arr[i,j,k,l+1] - 2*arr[i,j,k,l] + arr[i,j,k,l-1]) / dtau**2
 
+
 def mixed_derivative_4d(arr, ax1, ax2, i, j, k, l, dx, dtau):
     offsets = {
         (0,1): arr[i+1,j+1,k,l] - arr[i+1,j-1,k,l] - arr[i-1,j+1,k,l] + arr[i-1,j-1,k,l],
@@ -162,6 +128,7 @@ def mixed_derivative_4d(arr, ax1, ax2, i, j, k, l, dx, dtau):
     else:
         return offsets[(ax1, ax2)] / (4*dx**2)
 
+
 def compute_hessian_4d(S, dx, dtau, x, y, z, tau):
     Nx, Ny, Nz, Ntau = S.shape
     if not (1 <= x < Nx-1 and 1 <= y < Ny-1 and 1 <= z < Nz-1 and 1 <= tau < Ntau-1):
@@ -181,17 +148,427 @@ def compute_hessian_4d(S, dx, dtau, x, y, z, tau):
             H[j,i] = val
     return H
 
-tau0 = Ntau - 2  # Second last time step to avoid boundary issues
 
-# Check boundary for spatial point
-if not (1 <= x0 < Nx-1 and 1 <= y0 < Ny-1 and 1 <= z0 < Nz-1):
-    print(f"Warning: spatial point {(x0, y0, z0)} too close to boundary, using center (25,25,25).")
-    x0, y0, z0 = 25, 25, 25
+# --- In-situ analyses: hooks on the live field during stepping ---
+
+class Analysis:
+    # observe(t, window) runs every `every` steps; window holds the last (up to) three
+    # meta-time levels, window[-1] = S(τ=t). Results accumulate in steps/values.
+    name = "analysis"
+
+    def __init__(self, every=1):
+        self.every = every
+        self.steps, self.values = [], []
+
+    def compute(self, t, window):
+        raise NotImplementedError
+
+    def observe(self, t, window):
+        value = self.compute(t, window)
+        if value is not None:
+            self.steps.append(t)
+            self.values.append(value)
+        return value
+
+    def finish(self, t, window):
+        # Last step of the run (final or early stop): make sure it is observed
+        if not self.steps or self.steps[-1] != t:
+            return self.observe(t, window)
+        return None
+
+    def result(self):
+        return np.array(self.steps, dtype=int), np.array(self.values)
+
+
+class Moments(Analysis):
+    name = "moments"
+
+    def compute(self, t, window):
+        S = window[-1]
+        return np.array([S.mean(), S.std(), S.min(), S.max()])
+
+
+class ArgmaxTracker(Analysis):
+    # Global max (x, y, z, S_max); `interior` is the max or, at the boundary, the center
+    name = "argmax"
+
+    def compute(self, t, window):
+        S = window[-1]
+        pos = np.unravel_index(np.argmax(S), S.shape)
+        self.position = tuple(int(p) for p in pos)
+        inside = all(1 <= p < n - 1 for p, n in zip(pos, S.shape))
+        self.interior = self.position if inside else tuple(n // 2 for n in S.shape)
+        return np.array([*self.position, S[pos]])
+
+
+class SliceCapture(Analysis):
+    # Mid-plane slices S[:, :, z] at the given meta-time steps (and at the last step)
+    name = "slices"
+
+    def __init__(self, capture_steps, z):
+        super().__init__(every=1)
+        self.capture_steps, self.z = set(capture_steps), z
+
+    def compute(self, t, window):
+        return window[-1][:, :, self.z].copy() if t in self.capture_steps else None
+
+    def finish(self, t, window):
+        self.capture_steps.add(t)
+        return super().finish(t, window)
+
+
+class Hessian3D(Analysis):
+    # 3D Hessian at the tracked max; list the tracker first with the same interval
+    name = "hessian_3d"
+
+    def __init__(self, tracker, dx, every=1):
+        super().__init__(every)
+        self.tracker, self.dx = tracker, dx
+
+    def compute(self, t, window):
+        return compute_hessian_3d(window[-1], self.dx, *self.tracker.interior)
+
+
+class Hessian4D(Analysis):
+    # 4D Hessian at the tracked max of S(t), centered on the middle level τ = t-1 of the window
+    name = "hessian_4d"
+
+    def __init__(self, tracker, dx, dtau, every=1):
+        super().__init__(every)
+        self.tracker, self.dx, self.dtau = tracker, dx, dtau
+
+    def compute(self, t, window):
+        if len(window) < 3:
+            return None
+        x, y, z = self.tracker.interior
+        block = np.stack([S[x-1:x+2, y-1:y+2, z-1:z+2] for S in window], axis=-1)
+        return compute_hessian_4d(block, self.dx, self.dtau, 1, 1, 1, 1)
+
+
+class FinalField(Analysis):
+    # Copy of the whole field at the last step of the run
+    name = "final_field"
+
+    def compute(self, t, window):
+        return None
+
+    def finish(self, t, window):
+        self.steps.append(t)
+        self.values.append(window[-1].copy())
+        return self.values[-1]
+
+
+def stop_when_flat(min_std):
+    # Early-stop rule: the field has relaxed to σ(S) < min_std (requires Moments)
+    return lambda t, latest: "moments" in latest and latest["moments"][1] < min_std
+
+
+def run_in_situ(Nx, Ny, Nz, Ntau, dx, dtau, D, threshold, seed=None, analyses=(), stop=None, report=None):
+    # Single pass over meta-time with analyses on the live field; keeps three levels only.
+    # stop(t, latest) -> bool ends the run early (latest: newest value per analysis name);
+    # report(name, t, value) receives every result as it is produced. Returns the last step.
+    def observe(batch, t, final=False):
+        with profiler.phase("analysis"):
+            for analysis in batch:
+                with profiler.phase(analysis.name):
+                    value = analysis.finish(t, window) if final else analysis.observe(t, window)
+                if value is not None:
+                    latest[analysis.name] = value
+                    if report:
+                        report(analysis.name, t, value)
+
+    with profiler.phase("initialization"):
+        rng = np.random.RandomState(seed)
+        window = deque([0.5 + 0.15 * rng.randn(Nx, Ny, Nz)], maxlen=3)
+    latest = {}
+    for t in range(Ntau):
+        if t:
+            with profiler.phase("stepping"):
+                window.append(entropy_step(window[-1], dx, dtau, D, threshold))
+                profiler.add(steps=1, cell_updates=Nx * Ny * Nz)
+        due = [a for a in analyses if t % a.every == 0]
+        observe(due, t)
+        if t == Ntau - 1 or (stop is not None and due and stop(t, latest)):
+            observe(analyses, t, final=True)
+            return t
+    return Ntau - 1
+
+
+DIAGNOSTICS = ("moment_steps", "moments", "track_steps", "maxima", "H3d", "H4d_steps", "H4d",
+               "slice_steps", "slices", "final_field")
+
+
+def in_situ_diagnostics(Nx, Ny, Nz, Ntau, dx, dtau, D, threshold, seed=None, every=10, min_std=None):
+    # Standard analyses of the script in one pass; returns arrays named by DIAGNOSTICS
+    moments = Moments()
+    tracker = ArgmaxTracker(every)
+    slices = SliceCapture([0, Ntau//4, Ntau//2, 3*Ntau//4, Ntau-1], Nz // 2)
+    hessian_3d = Hessian3D(tracker, dx, every)
+    hessian_4d = Hessian4D(tracker, dx, dtau, every)
+    final_field = FinalField(every=Ntau)  # Only observed at the end
+    run_in_situ(Nx, Ny, Nz, Ntau, dx, dtau, D, threshold, seed,
+                analyses=[moments, tracker, slices, hessian_3d, hessian_4d, final_field],
+                stop=stop_when_flat(min_std) if min_std else None)
+    slice_steps, slice_values = slices.result()
+    return (*moments.result(), *tracker.result(), hessian_3d.result()[1], *hessian_4d.result(),
+            slice_steps, np.moveaxis(slice_values, 0, -1), final_field.result()[1][-1])
+
+
+# --- Ensemble mode: E realizations advanced together on a leading axis ---
+
+ENSEMBLE_CHUNK_CELLS = 2**16  # Members per stencil pass are grouped up to this many cells (cache-sized temporaries)
+ENSEMBLE_DIAGNOSTICS = ("mean_curves", "final_moments", "track_steps", "maxima", "eig3d", "eig4d_steps", "eig4d")
+
+
+def initial_ensemble(Nx, Ny, Nz, seeds):
+    # Member e starts from the same noise as a single run with seed seeds[e]
+    return np.stack([0.5 + 0.15 * np.random.RandomState(s).randn(Nx, Ny, Nz) for s in seeds])
+
+
+def run_ensemble(Nx, Ny, Nz, Ntau, dx, dtau, D, threshold, seeds, every=10):
+    # D and threshold: scalars or one value per member. Every stencil pass advances all
+    # members; aggregated online with three levels kept: per-member mean-entropy curves
+    # (E, Ntau), final moments (E, 4), and every k steps each member's global max
+    # (x, y, z, S_max) with the 3D/4D Hessian eigenvalues there. Returns ENSEMBLE_DIAGNOSTICS.
+    E = len(seeds)
+    D_e = np.broadcast_to(np.asarray(D, dtype=float), (E,)).reshape(E, 1, 1, 1)
+    threshold_e = np.broadcast_to(np.asarray(threshold, dtype=float), (E,)).reshape(E, 1, 1, 1)
+    shape, center, members = np.array([Nx, Ny, Nz]), np.array([Nx // 2, Ny // 2, Nz // 2]), np.arange(E)
+    size = max(1, ENSEMBLE_CHUNK_CELLS // (Nx * Ny * Nz))
+    chunks = [slice(i, i + size) for i in range(0, E, size)]
+
+    with profiler.phase("initialization"):
+        window = deque([initial_ensemble(Nx, Ny, Nz, seeds)], maxlen=3)
+    mean_curves = np.empty((E, Ntau))
+    track_steps, maxima, eig3d, eig4d_steps, eig4d = [], [], [], [], []
+    for t in range(Ntau):
+        if t:
+            with profiler.phase("stepping"):
+                S_prev, S = window[-1], np.empty_like(window[-1])
+                for c in chunks:
+                    S[c] = entropy_step(S_prev[c], dx, dtau, D_e[c], threshold_e[c])
+                window.append(S)
+                profiler.add(steps=1, cell_updates=E * Nx * Ny * Nz)
+        S = window[-1]
+        with profiler.phase("analysis"):
+            mean_curves[:, t] = S.mean(axis=(1, 2, 3))
+            if t % every and t != Ntau - 1:
+                continue
+            flat = S.reshape(E, -1).argmax(axis=1)
+            pos = np.stack(np.unravel_index(flat, S.shape[1:]), axis=1)
+            inside = np.all((pos >= 1) & (pos < shape - 1), axis=1)
+            x, y, z = np.where(inside[:, None], pos, center).T
+            track_steps.append(t)
+            maxima.append(np.column_stack([pos, S.reshape(E, -1)[members, flat]]))
+            eig3d.append(np.linalg.eigvalsh(np.array(
+                [compute_hessian_3d(S[e], dx, x[e], y[e], z[e]) for e in members])))
+            if len(window) == 3:
+                blocks = [np.stack([W[e, x[e]-1:x[e]+2, y[e]-1:y[e]+2, z[e]-1:z[e]+2] for W in window], axis=-1)
+                          for e in members]
+                eig4d_steps.append(t)
+                eig4d.append(np.linalg.eigvalsh(np.array(
+                    [compute_hessian_4d(block, dx, dtau, 1, 1, 1, 1) for block in blocks])))
+    final_moments = np.column_stack([S.mean(axis=(1, 2, 3)), S.std(axis=(1, 2, 3)),
+                                     S.min(axis=(1, 2, 3)), S.max(axis=(1, 2, 3))])
+    return (mean_curves, final_moments, np.array(track_steps), np.array(maxima), np.array(eig3d),
+            np.array(eig4d_steps, dtype=int), np.array(eig4d).reshape(-1, E, 4))
+
+
+def plot_entropy_slices(plt, slices, tau):
+    # slices: (Nx, Ny, K) mid-plane snapshots at meta-times tau (K,)
+    fig, axes = plt.subplots(1, len(tau), figsize=(16, 3), squeeze=False)
+    axes = axes[0]
+    for i, t in enumerate(tau):
+        im = axes[i].imshow(slices[..., i], origin='lower', cmap='inferno',
+                            vmin=np.min(slices[..., i]), vmax=np.max(slices[..., i]))
+        axes[i].set_title(f'Meta-time τ={t:.2f}')
+        axes[i].axis('off')
+    fig.colorbar(im, ax=axes.ravel().tolist(), shrink=0.6, label='Entropy S')
+    plt.suptitle('2D Mid-Plane Entropy Slices (Aggressive Nonlinear Dynamics)', fontsize=14)
+
+
+def plot_mean_entropy(plt, tau, mean_entropy):
+    plt.figure(figsize=(8, 4))
+    plt.plot(tau, mean_entropy, color='blue')
+    plt.xlabel('Meta-Time τ')
+    plt.ylabel('Average Entropy ⟨S⟩')
+    plt.title('Mean Entropy Evolution with Enhanced Nonlinearity')
+    plt.grid(True)
+
+
+def plot_hessian_spectra(plt, tau_3d, eig3d, tau_4d, eig4d):
+    # Eigenvalues of the 3D/4D Hessians at the tracked max over meta-time
+    fig, axes = plt.subplots(1, 2, figsize=(12, 4))
+    for ax, tau, eig, title in ((axes[0], tau_3d, eig3d, '3D Hessian'), (axes[1], tau_4d, eig4d, '4D Hessian')):
+        for i in range(eig.shape[1] if eig.ndim == 2 else 0):
+            ax.plot(tau, eig[:, i], label=f'λ{i+1}')
+        ax.set_xlabel('Meta-Time τ')
+        ax.set_ylabel('Eigenvalue')
+        ax.set_yscale('symlog')
+        ax.set_title(f'{title} Spectrum at Tracked Maximum')
+        ax.grid(True)
+        ax.legend()
+    plt.tight_layout()
+
+
+def plot_ensemble_mean_entropy(plt, tau, mean_curves):
+    # mean_curves: (E, Ntau) mean entropy of each member
+    mean, std = mean_curves.mean(axis=0), mean_curves.std(axis=0)
+    plt.figure(figsize=(8, 4))
+    for curve in mean_curves:
+        plt.plot(tau, curve, color='gray', alpha=0.3, linewidth=0.8)
+    plt.fill_between(tau, mean - std, mean + std, color='blue', alpha=0.2, label='Ensemble mean ± σ')
+    plt.plot(tau, mean, color='blue', label='Ensemble mean')
+    plt.xlabel('Meta-Time τ')
+    plt.ylabel('Average Entropy ⟨S⟩')
+    plt.title(f'Mean Entropy Evolution of {len(mean_curves)} Ensemble Members')
+    plt.legend()
+    plt.grid(True)
+
+
+if __name__ == "__main__":
+    from instrumentation import configure_from_environment, print_report
+    from plot_backend import submit_figure, wait_for_figures
+    from result_cache import cached
+
+    # Interaktive Eingaben
+    print("=== Hessian Scale Analysis Configuration ===")
+    try:
+        Nx = int(input("Enter grid size Nx [default 50]: ") or 50)
+        Ny = int(input("Enter grid size Ny [default 50]: ") or 50)
+        Nz = int(input("Enter grid size Nz [default 50]: ") or 50)
+        Ntau = int(input("Enter number of meta-time steps Ntau [default 600]: ") or 600)
+        dx = float(input("Enter spatial resolution dx [default 0.1]: ") or 0.1)
+        dtau = float(input("Enter meta-time resolution dtau [default 0.01]: ") or 0.01)
+        D = float(input("Enter diffusion coefficient D [default 0.02]: ") or 0.02)
+        threshold = float(input("Enter source threshold [default 0.04]: ") or 0.04)
+        seed = input("Enter random seed [default none]: ").strip()
+        seed = int(seed) if seed else None
+        every = int(input("Enter analysis interval k (max tracking, Hessians) [default 10]: ") or 10)
+        min_std = input("Enter early-stop minimum σ of S [default none]: ").strip()
+        min_std = float(min_std) if min_std else None
+        E = int(input("Enter ensemble size E (members advanced together) [default 1]: ") or 1)
+        D_members, threshold_members = D, threshold
+        if E > 1:
+            D_members = input("Enter per-member D values, comma-separated [default D for all]: ").strip()
+            D_members = [float(v) for v in D_members.split(",")] if D_members else [D] * E
+            threshold_members = input("Enter per-member thresholds, comma-separated [default threshold for all]: ").strip()
+            threshold_members = [float(v) for v in threshold_members.split(",")] if threshold_members else [threshold] * E
+            if len(D_members) != E or len(threshold_members) != E or min(D_members) < 0:
+                raise ValueError("Per-member D and thresholds need E values and D >= 0.")
+        if Nx <= 0 or Ny <= 0 or Nz <= 0 or Ntau <= 0 or dx <= 0 or dtau <= 0 or D < 0 or every <= 0 or E <= 0:
+            raise ValueError("Grid sizes, steps, interval, ensemble size, and diffusion must be positive.")
+        if Nx > 100 or Ny > 100 or Nz > 100 or Ntau > 1000:
+            raise ValueError("Grid sizes or Ntau too large for performance.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        Nx, Ny, Nz = 50, 50, 50
+        Ntau = 600
+        dx = dtau = 0.1
+        D = 0.02
+        threshold = 0.04
+        seed = None
+        every, min_std = 10, None
+        E, D_members, threshold_members = 1, D, threshold
+
+    configure_from_environment()
+
+    if E > 1:
+        # Ensemble: member e uses seed (seed or 0) + e and its own D and threshold
+        seeds = [(seed or 0) + e for e in range(E)]
+        ensemble, hit = cached("hessian_scale_analysis", run_ensemble,
+                               {"Nx": Nx, "Ny": Ny, "Nz": Nz, "Ntau": Ntau, "dx": dx, "dtau": dtau,
+                                "D": D_members, "threshold": threshold_members, "seeds": seeds,
+                                "every": every}, names=ENSEMBLE_DIAGNOSTICS)
+        if hit:
+            print("Ensemble diagnostics loaded from result cache")
+        mean_curves, final_moments, track_steps, maxima, eig3d, eig4d_steps, eig4d = ensemble
+
+        print(f"Ensemble of {E} members: mean entropy ⟨S⟩ across members at selected τ:")
+        for t in [0, Ntau//4, Ntau//2, 3*Ntau//4, Ntau-1]:
+            print(f"  τ = {t*dtau:.2f} → ⟨S⟩ = {mean_curves[:, t].mean():.5f} ± {mean_curves[:, t].std():.5f}"
+                  f" (min {mean_curves[:, t].min():.5f}, max {mean_curves[:, t].max():.5f})")
+
+        print(f"\nFinal state per member (τ = {Ntau*dtau:.2f}):")
+        print(f"{'Member':>6} {'Seed':>6} {'D':>8} {'Threshold':>10} {'⟨S⟩':>9} {'σ':>9} {'S_max':>9}  Position      "
+              "3D eigenvalues")
+        for e in range(E):
+            pos = tuple(int(p) for p in maxima[-1, e, :3])
+            print(f"{e:>6} {seeds[e]:>6} {D_members[e]:>8.4g} {threshold_members[e]:>10.4g} {final_moments[e, 0]:>9.5f} "
+                  f"{final_moments[e, 1]:>9.5f} {final_moments[e, 3]:>9.5f}  {str(pos):<13} {np.round(eig3d[-1, e], 4)}")
+
+        print("\nEnsemble Hessian eigenvalues at the maxima (mean ± std across members):")
+        print(f"  3D: {np.round(eig3d[-1].mean(axis=0), 6)} ± {np.round(eig3d[-1].std(axis=0), 6)}")
+        if len(eig4d):
+            print(f"  4D: {np.round(eig4d[-1].mean(axis=0), 6)} ± {np.round(eig4d[-1].std(axis=0), 6)}")
+        lorentz = np.mean((np.sum(eig4d[-1] > 0, axis=1) == 1) & (np.sum(eig4d[-1] < 0, axis=1) == 3)) \
+            if len(eig4d) else 0.0
+        print(f"  Fraction of members with 4D signature (+,-,-,-): {lorentz:.3f}")
+
+        with profiler.phase("plotting"):
+            submit_figure(plot_ensemble_mean_entropy, 'img/ensemble_mean_entropy.png',
+                          tau=np.arange(Ntau) * dtau, mean_curves=mean_curves)
+    else:
+        # Simulation: Entropy field with in-situ analyses (no history kept)
+        diagnostics, hit = cached("hessian_scale_analysis", in_situ_diagnostics,
+                                  {"Nx": Nx, "Ny": Ny, "Nz": Nz, "Ntau": Ntau, "dx": dx, "dtau": dtau,
+                                   "D": D, "threshold": threshold, "seed": seed, "every": every,
+                                   "min_std": min_std}, names=DIAGNOSTICS)
+        if hit:
+            print("Diagnostics loaded from result cache")
+        moment_steps, moments, track_steps, maxima, H3d, H4d_steps, H4d, slice_steps, slices, final_field = diagnostics
+        last = int(moment_steps[-1])
+        if last < Ntau - 1:
+            print(f"Early stop at τ = {last*dtau:.2f}: σ = {moments[-1, 1]:.5f} < {min_std}")
+
+        # Statistics
+        print("Statistical Summary at Selected τ:")
+        for t in slice_steps:
+            avg, std, s_min, s_max = moments[t]
+            print(f"  τ = {t*dtau:.2f} → ⟨S⟩ = {avg:.5f}, σ = {std:.5f}, min = {s_min:.5f}, max = {s_max:.5f}")
+
+        np.savez_compressed('img/entropy_field.npz', S=final_field, dx=dx, tau=last * dtau)
+        print("Final field saved to img/entropy_field.npz (for entropic_ray_tracing.py)")
+
+        max_pos = tuple(int(p) for p in maxima[-1, :3])
+        max_val = maxima[-1, 3]
+        print(f"\nGlobal max at τ = {(last+1)*dtau:.2f}: S = {max_val:.5f} at position (x, y, z) = {max_pos}")
+
+        # --- Visualization (rendered in the background while the results are printed) ---
+        eigvals3d_track = np.linalg.eigvalsh(H3d)
+        eigvals4d_track = np.linalg.eigvalsh(H4d) if len(H4d) else np.zeros((0, 4))
+        with profiler.phase("plotting"):
+            submit_figure(plot_entropy_slices, 'img/entropy_slices.png',
+                          slices=slices, tau=slice_steps * dtau)
+            submit_figure(plot_mean_entropy, 'img/mean_entropy_evolution.png',
+                          tau=moment_steps * dtau, mean_entropy=moments[:, 0])
+            submit_figure(plot_hessian_spectra, 'img/hessian_spectra_evolution.png',
+                          tau_3d=track_steps * dtau, eig3d=eigvals3d_track,
+                          tau_4d=(H4d_steps - 1) * dtau, eig4d=eigvals4d_track)
+
+        # --- 3D Hessian at global maximum (with boundary check) ---
+        x0, y0, z0 = max_pos
+        if not (1 <= x0 < Nx-1 and 1 <= y0 < Ny-1 and 1 <= z0 < Nz-1):
+            x0, y0, z0 = Nx // 2, Ny // 2, Nz // 2
+            print(f"Warning: global max position {max_pos} too close to boundary, using center point {(x0, y0, z0)}.")
+
+        print(f"\n3D Hessian I_μν at (x={x0}, y={y0}, z={z0}):\n{np.round(H3d[-1],6)}")
+        print(f"Eigenvalues (3D metric signature):\n{np.round(eigvals3d_track[-1],6)}")
+
+        # --- 4D Hessian including meta-time ---
+        if len(H4d):
+            tau0 = int(H4d_steps[-1]) - 1  # Central level of the last three-level window
+            print(f"\n4D Hessian I_μν at (x={x0}, y={y0}, z={z0}, τ={tau0}):")
+            print(np.round(H4d[-1], 6))
+            print("Eigenvalues (4D metric signature):")
+            print(np.round(eigvals4d_track[-1], 6))
+        else:
+            print("\n4D Hessian not available: fewer than three meta-time levels.")
 
-H4d = compute_hessian_4d(S, dx, dtau, x0, y0, z0, tau0)
-eigvals4d = np.linalg.eigvalsh(H4d)
+    with profiler.phase("plotting"):
+        wait_for_figures()
 
-print(f"\n4D Hessian I_μν at (x={x0}, y={y0}, z={z0}, τ={tau0}):")
-print(np.round(H4d, 6))
-print("Eigenvalues (4D metric signature):")
-print(np.round(eigvals4d, 6))
+    report_path = profiler.write("hessian_scale_analysis")
+    if report_path:
+        print_report(profiler.report("hessian_scale_analysis"))
+        print(f"Instrumentation report saved to {report_path}")
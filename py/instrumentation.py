@@ -0,0 +1,159 @@
+# ========================================================
+# File: instrumentation.py
+# Purpose: Lightweight phase timing, memory peaks and per-phase counters with JSON reports
+# Method:
+#   - profiler.phase(name) is a context manager timing one phase; nested phases are
+#     recorded under "outer/inner", so e.g. the simplification share of the Riemann
+#     tensor appears as riemann/simplify
+#   - profiler.add(steps=..., cell_updates=...) accumulates counters of the innermost
+#     open phase; the report adds their rates per second of that phase
+#   - Optional tracemalloc tracking gives the peak traced memory reached inside each phase
+#   - Disabled (the default), phase() returns one shared null context and add() returns
+#     immediately, so the hooks can stay in the code paths at near-zero cost
+#   - Enabled by the environment variable INSTRUMENT=time|memory or by the command-line
+#     flag --instrument[=memory]; the report path is INSTRUMENT_REPORT or
+#     img/<script>_instrumentation.json
+# ========================================================
+
+import json
+import os
+import sys
+import time
+from contextlib import nullcontext
+
+_NULL = nullcontext()
+
+
+class Profiler:
+    def __init__(self, enabled=False, memory=False):
+        self.enabled = False
+        self.memory = False
+        self.configure(enabled, memory)
+
+    def configure(self, enabled=True, memory=False):
+        self.enabled = bool(enabled or memory)
+        self.memory = bool(memory)
+        self.phases = {}
+        self._stack = []
+        self._peaks = []
+        self._start = time.perf_counter()
+        if self.memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+        return self
+
+    def phase(self, name):
+        return _Phase(self, name) if self.enabled else _NULL
+
+    def add(self, **counters):
+        # Counters belong to the innermost open phase ("run" outside of any phase)
+        if not self.enabled:
+            return
+        record = self._record("/".join(self._stack) or "run")
+        for key, n in counters.items():
+            record["counters"][key] = record["counters"].get(key, 0) + n
+
+    def _record(self, key):
+        if key not in self.phases:
+            self.phases[key] = {"calls": 0, "seconds": 0.0, "counters": {}}
+        return self.phases[key]
+
+    def _enter(self, name):
+        if self.memory:
+            import tracemalloc
+            # Fold the peak reached so far into the enclosing phase before resetting it
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self._peaks.append(0)
+        self._stack.append(name)
+        return time.perf_counter()
+
+    def _exit(self, start):
+        elapsed = time.perf_counter() - start
+        record = self._record("/".join(self._stack))
+        record["calls"] += 1
+        record["seconds"] += elapsed
+        self._stack.pop()
+        if self.memory:
+            import tracemalloc
+            peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+            record["peak_memory"] = max(record.get("peak_memory", 0), peak)
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+
+    def report(self, script=None):
+        phases = {}
+        for key, record in self.phases.items():
+            entry = {"calls": record["calls"], "seconds": record["seconds"]}
+            if "peak_memory" in record:
+                entry["peak_memory"] = record["peak_memory"]
+            if record["counters"]:
+                entry["counters"] = dict(record["counters"])
+                if record["seconds"] > 0:
+                    entry["rates"] = {f"{k}_per_second": v / record["seconds"]
+                                      for k, v in record["counters"].items()}
+            phases[key] = entry
+        report = {
+            "script": script, "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "wall_time": time.perf_counter() - self._start, "phases": phases,
+        }
+        if self.memory:
+            import tracemalloc
+            report["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        return report
+
+    def write(self, script, path=None):
+        # Write the JSON report if enabled; returns the path or None
+        if not self.enabled:
+            return None
+        path = path or os.environ.get("INSTRUMENT_REPORT") or f"img/{script}_instrumentation.json"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.report(script), f, indent=2)
+        return path
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = self.profiler._enter(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._exit(self.start)
+        return False
+
+
+def configure_from_environment(argv=None):
+    # INSTRUMENT=time|memory (or 1) and --instrument / --instrument=memory switch the profiler on
+    argv = sys.argv[1:] if argv is None else argv
+    mode = os.environ.get("INSTRUMENT", "").strip().lower()
+    for arg in argv:
+        if arg == "--instrument":
+            mode = mode if mode == "memory" else "time"
+        elif arg.startswith("--instrument="):
+            mode = arg.split("=", 1)[1].strip().lower()
+    if mode in ("", "0", "off", "false", "no"):
+        return profiler
+    return profiler.configure(enabled=True, memory=(mode == "memory"))
+
+
+def print_report(report):
+    print("=== Instrumentation Report ===")
+    print(f"{'Phase':<32} {'Calls':>7} {'Time (s)':>10} {'Share':>7} {'Peak mem':>11}  Rates")
+    for key, entry in report["phases"].items():
+        share = entry["seconds"] / report["wall_time"] * 100 if report["wall_time"] else 0.0
+        peak = f"{entry['peak_memory'] / 2**20:.1f} MB" if "peak_memory" in entry else "-"
+        rates = ", ".join(f"{k} {v:.4g}" for k, v in entry.get("rates", {}).items())
+        print(f"{key:<32} {entry['calls']:>7} {entry['seconds']:>10.4f} {share:>6.1f}% {peak:>11}  {rates}")
+
+
+# Shared process-wide profiler, disabled until configured
+profiler = Profiler()
@@ -8,53 +8,78 @@
 # - N: Number of samples (default: 1000)
 # - repeats: Number of simulation repeats (default: 500)
 # - kappa: Scaling factor (default: 6.5244e34 J/m)
+# - sampler: pseudo (default), or scrambled sobol/halton points (qmc_sampling.py); repeats
+#   are then randomized replicates, so their spread is the error bar of the mean
 # =============================================================================
 
 import numpy as np
-import matplotlib.pyplot as plt
-
-
-# Interactive input
-print("=== Lagrangian Density Simulation Configuration ===")
-try:
-    S_mean = float(input("Enter mean entropy S_mean [default 2.74309]: ") or 2.74309)
-    S_sigma = float(input("Enter entropy standard deviation S_sigma [default 0.05894]: ") or 0.05894)
-    N = int(input("Enter number of samples N [default 1000]: ") or 1000)
-    repeats = int(input("Enter number of repeats [default 500]: ") or 500)
-    kappa = float(input("Enter scaling factor kappa (J/m) [default 6.5244e34]: ") or 6.5244e34)
-    if S_sigma <= 0 or N <= 0 or repeats <= 0 or kappa <= 0:
-        raise ValueError("S_sigma, N, repeats, and kappa must be positive.")
-    if N > 10000 or repeats > 1000:
-        raise ValueError("N or repeats too large for performance.")
-except ValueError as e:
-    print(f"Invalid input: {e}. Using default values.")
-    S_mean = 2.74309
-    S_sigma = 0.05894
-    N = 1000
-    repeats = 500
-    kappa = 6.5244e34
-
-np.random.seed(42)
-L_values = np.zeros(repeats)
-
-for i in range(repeats):
-    S = np.random.normal(loc=S_mean, scale=S_sigma, size=N)
-    grad_S = np.random.normal(loc=0, scale=S_sigma, size=(N, 4))
-    grad_norm = np.linalg.norm(grad_S, axis=1)
-    L = kappa * np.mean(S * grad_norm)
-    L_values[i] = L
-
-L_mean = np.mean(L_values)
-L_std = np.std(L_values)
-print(f"Mean Lagrangian density: {L_mean:.8e} J/m^3")
-print(f"Standard deviation: {L_std:.8e} J/m^3")
-
-plt.figure(figsize=(8, 6))
-plt.hist(L_values, bins=50, color='teal', alpha=0.7)
-plt.axvline(L_mean, color='red', linestyle='--', label=f'Mean = {L_mean:.2e}')
-plt.title('Distribution of Lagrangian Density')
-plt.xlabel('Lagrangian density (J/m^3)')
-plt.ylabel('Frequency')
-plt.legend()
-plt.savefig('img/lagrangian_density_simulation.png')
-plt.close()
\ No newline at end of file
+
+KAPPA = 6.5244e34  # J/m
+
+
+def lagrangian_density(S_mean, S_sigma, N, repeats, kappa=KAPPA, seed=42, sampler="pseudo"):
+    # One Lagrangian density estimate L = κ ⟨S |∇S|⟩ per repeat -> (repeats,);
+    # with sampler sobol/halton each repeat is an independently scrambled replicate
+    if sampler != "pseudo":
+        from qmc_sampling import normal, replicate_seeds
+        loc = np.array([S_mean, 0, 0, 0, 0])
+        samples = (normal(N, 5, sampler, s, loc, S_sigma) for s in replicate_seeds(seed, repeats))
+        return np.array([kappa * np.mean(x[:, 0] * np.linalg.norm(x[:, 1:], axis=1)) for x in samples])
+
+    rng = np.random.RandomState(seed)
+    L_values = np.zeros(repeats)
+    for i in range(repeats):
+        S = rng.normal(loc=S_mean, scale=S_sigma, size=N)
+        grad_S = rng.normal(loc=0, scale=S_sigma, size=(N, 4))
+        grad_norm = np.linalg.norm(grad_S, axis=1)
+        L_values[i] = kappa * np.mean(S * grad_norm)
+    return L_values
+
+
+def plot_lagrangian_density(plt, L_values, L_mean):
+    plt.figure(figsize=(8, 6))
+    plt.hist(L_values, bins=50, color='teal', alpha=0.7)
+    plt.axvline(L_mean, color='red', linestyle='--', label=f'Mean = {L_mean:.2e}')
+    plt.title('Distribution of Lagrangian Density')
+    plt.xlabel('Lagrangian density (J/m^3)')
+    plt.ylabel('Frequency')
+    plt.legend()
+
+
+if __name__ == "__main__":
+    from plot_backend import submit_figure, wait_for_figures
+
+    # Interactive input
+    print("=== Lagrangian Density Simulation Configuration ===")
+    try:
+        S_mean = float(input("Enter mean entropy S_mean [default 2.74309]: ") or 2.74309)
+        S_sigma = float(input("Enter entropy standard deviation S_sigma [default 0.05894]: ") or 0.05894)
+        N = int(input("Enter number of samples N [default 1000]: ") or 1000)
+        repeats = int(input("Enter number of repeats [default 500]: ") or 500)
+        kappa = float(input("Enter scaling factor kappa (J/m) [default 6.5244e34]: ") or 6.5244e34)
+        sampler = input("Select sampler pseudo/sobol/halton [default pseudo]: ").strip().lower() or "pseudo"
+        if sampler not in ("pseudo", "sobol", "halton"):
+            raise ValueError(f"Unknown sampler {sampler}.")
+        if S_sigma <= 0 or N <= 0 or repeats <= 0 or kappa <= 0:
+            raise ValueError("S_sigma, N, repeats, and kappa must be positive.")
+        if N > 10000 or repeats > 1000:
+            raise ValueError("N or repeats too large for performance.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        S_mean = 2.74309
+        S_sigma = 0.05894
+        N = 1000
+        repeats = 500
+        kappa = 6.5244e34
+        sampler = "pseudo"
+
+    L_values = lagrangian_density(S_mean, S_sigma, N, repeats, kappa, sampler=sampler)
+    L_mean = np.mean(L_values)
+    L_std = np.std(L_values)
+    print(f"Mean Lagrangian density: {L_mean:.8e} J/m^3")
+    print(f"Standard deviation: {L_std:.8e} J/m^3")
+    print(f"Standard error of the mean ({sampler}): {L_std / np.sqrt(repeats):.8e} J/m^3")
+
+    submit_figure(plot_lagrangian_density, 'img/lagrangian_density_simulation.png',
+                  L_values=L_values, L_mean=L_mean)
+    wait_for_figures()
@@ -0,0 +1,339 @@
+# ========================================================
+# File: lattice_yang_mills.py
+# Purpose: SU(2) lattice gauge Monte Carlo with plaquette energy density
+# Method:
+#   - Link variables U_μ(x) ∈ SU(2) on a periodic L^4 lattice, stored compactly as unit
+#     quaternions (u0, u1, u2, u3), U = u0 + i u·σ: one (4 directions, 4, L^4) array;
+#     the quaternion product carries the structure constants f_abc = ε_abc (F_ABC of
+#     yang_mills_field_dynamics.py) in its cross term
+#   - Wilson action S = β Σ_P (1 - ½ Tr U_P) with β = 4/g² from the coupling g = 0.65
+#   - Checkerboard sweeps: for each direction μ the links on even sites, then on odd
+#     sites, are updated all at once (their staples only contain links that are not
+#     updated in the same pass); staples are gathered with precomputed neighbour tables
+#   - Update algorithms: heat-bath (Kennedy–Pendleton sampling of exp(β k w0)) or
+#     Metropolis (multi-hit, random SU(2) step of size ε, acceptance rate reported)
+#   - Optional slab decomposition: the lattice lives in shared memory and each worker
+#     process updates the links of its x0-slab, synchronized after every half-sweep
+#   - Observables: average plaquette per plane, compared with weak coupling
+#     1 - 3/(4β); field strengths Σ_a (F^a_μν)² = 2β (1 - P_μν) / a⁴ with a = l_meta,
+#     combined like the random-potential estimator rho (electric Σ_j F_0j² plus
+#     magnetic -¼ Σ_{i<j} F_ij², summed over color, potentials in units of κ)
+# Inputs:
+# - L (default: 8), β (default: 4/g²), algorithm heatbath/metropolis (default: heatbath),
+#   thermalization and measurement sweeps (default: 20/50), processes (default: 1), seed (default: 42)
+# Output:
+#   - Average plaquette with error, energy densities of both estimators, link updates per second
+#   - Plaquette history plot img/lattice_plaquette_history.png
+# ========================================================
+
+import numpy as np
+
+from yang_mills_field_dynamics import F_ABC, g, kappa, l_meta
+
+_CONJ = np.array([1.0, -1.0, -1.0, -1.0])[:, None]
+_CROSS_TERMS = [(a, b, c, F_ABC[a, b, c]) for a in range(3) for b in range(3) for c in range(3) if F_ABC[a, b, c]]
+PLANES = [(mu, nu) for mu in range(4) for nu in range(mu + 1, 4)]
+
+
+def _cross(u, v):
+    # (u × v)_a = f_abc u_b v_c
+    out = np.zeros(np.broadcast_shapes(u.shape, v.shape))
+    for a, b, c, f in _CROSS_TERMS:
+        if f > 0:
+            out[a] += u[b] * v[c]
+        else:
+            out[a] -= u[b] * v[c]
+    return out
+
+
+def qmul(p, q):
+    # SU(2) product of quaternion arrays (4, ...): (p0 q0 - p·q, p0 q + q0 p - p × q)
+    out = np.empty(np.broadcast_shapes(p.shape, q.shape))
+    out[0] = p[0] * q[0] - p[1] * q[1] - p[2] * q[2] - p[3] * q[3]
+    out[1:] = p[0] * q[1:] + q[0] * p[1:] - _cross(p[1:], q[1:])
+    return out
+
+
+def random_su2(n, rng):
+    q = rng.standard_normal((4, n))
+    return q / np.linalg.norm(q, axis=0)
+
+
+def heatbath_sample(alpha, rng):
+    # w0 ∈ [-1, 1] with density ∝ √(1 - w0²) exp(α w0) (Kennedy–Pendleton), vectorized rejection
+    w0 = np.empty_like(alpha)
+    todo = np.arange(alpha.size)
+    while todo.size:
+        a = alpha[todo]
+        r1, r2, r3, r4 = 1 - rng.random((4, todo.size))
+        lam2 = -(np.log(r1) + np.cos(2 * np.pi * r2)**2 * np.log(r3)) / (2 * a)
+        accept = r4**2 <= 1 - lam2
+        w0[todo[accept]] = 1 - 2 * lam2[accept]
+        todo = todo[~accept]
+    return w0
+
+
+class SU2Lattice:
+    # U[μ, :, site] with sites flattened in C order over (x0, x1, x2, x3)
+    def __init__(self, L, beta=None, start="cold", seed=42, U=None):
+        if L < 2 or L % 2:
+            raise ValueError("L must be even and at least 2 for the checkerboard.")
+        self.L, self.V = L, L**4
+        self.beta = 4 / g**2 if beta is None else beta
+        self.rng = np.random.default_rng(seed)
+        coords = np.indices((L,) * 4).reshape(4, -1)
+        self.up = np.array([np.ravel_multi_index((coords + np.eye(4, dtype=int)[mu][:, None]) % L, (L,) * 4)
+                            for mu in range(4)])
+        self.down = np.array([np.ravel_multi_index((coords - np.eye(4, dtype=int)[mu][:, None]) % L, (L,) * 4)
+                              for mu in range(4)])
+        self.parity = coords.sum(axis=0) % 2
+        self.x0 = coords[0]
+        if U is not None:
+            self.U = U
+        else:
+            self.U = np.zeros((4, 4, self.V))
+            if start == "hot":
+                for mu in range(4):
+                    self.U[mu] = random_su2(self.V, self.rng)
+            else:
+                self.U[:, 0] = 1.0
+        self.set_slab(0, L)
+
+    def set_slab(self, start, stop):
+        # Restrict updates to the sites with start <= x0 < stop; staple index tables per (μ, parity)
+        self.tables = {}
+        for parity in (0, 1):
+            sites = np.flatnonzero((self.parity == parity) & (self.x0 >= start) & (self.x0 < stop))
+            for mu in range(4):
+                terms = []
+                for nu in range(4):
+                    if nu == mu:
+                        continue
+                    x_mu, x_nu, x_dn = self.up[mu][sites], self.up[nu][sites], self.down[nu][sites]
+                    terms.append((nu, x_mu, x_nu, x_dn, self.down[nu][x_mu]))
+                self.tables[mu, parity] = (sites, terms)
+
+    def staples(self, mu, parity):
+        # Sum of staples A with ½ Tr(U_μ(x) A) = local action weight of the link
+        sites, terms = self.tables[mu, parity]
+        U = self.U
+        A = np.zeros((4, sites.size))
+        for nu, x_mu, x_nu, x_dn, x_mu_dn in terms:
+            A += qmul(qmul(np.take(U[nu], x_mu, axis=1), np.take(U[mu], x_nu, axis=1) * _CONJ),
+                      np.take(U[nu], sites, axis=1) * _CONJ)
+            A += qmul(qmul(np.take(U[nu], x_mu_dn, axis=1) * _CONJ, np.take(U[mu], x_dn, axis=1) * _CONJ),
+                      np.take(U[nu], x_dn, axis=1))
+        return sites, A
+
+    def heatbath(self, mu, parity):
+        sites, A = self.staples(mu, parity)
+        k = np.linalg.norm(A, axis=0)
+        w0 = heatbath_sample(self.beta * k, self.rng)
+        direction = self.rng.standard_normal((3, sites.size))
+        W = np.empty((4, sites.size))
+        W[0] = w0
+        W[1:] = direction * (np.sqrt(np.maximum(1 - w0**2, 0)) / np.linalg.norm(direction, axis=0))
+        self.U[mu][:, sites] = qmul(W, A * _CONJ / k)  # U = W V†, V = A / k
+        return sites.size
+
+    def metropolis(self, mu, parity, eps=0.25, hits=4):
+        sites, A = self.staples(mu, parity)
+        U = np.take(self.U[mu], sites, axis=1)
+        accepted = 0
+        for _ in range(hits):
+            R = np.empty((4, sites.size))
+            step = self.rng.standard_normal((3, sites.size))
+            R[1:] = eps * step / np.linalg.norm(step, axis=0)
+            R[0] = np.sqrt(1 - eps**2)
+            U_new = qmul(R, U)
+            dS = -self.beta * (qmul(U_new, A)[0] - qmul(U, A)[0])
+            accept = self.rng.random(sites.size) < np.exp(-np.maximum(dS, 0))
+            U[:, accept] = U_new[:, accept]
+            accepted += accept.sum()
+        self.U[mu][:, sites] = U / np.linalg.norm(U, axis=0)  # Reunitarize
+        return accepted / hits
+
+    def sweep(self, algorithm="heatbath", barrier=None, **kwargs):
+        # One checkerboard sweep over all directions; returns accepted link updates
+        update = self.heatbath if algorithm == "heatbath" else self.metropolis
+        accepted = 0
+        for mu in range(4):
+            for parity in (0, 1):
+                accepted += update(mu, parity, **kwargs)
+                if barrier is not None:
+                    barrier.wait()
+        return accepted
+
+    def plaquettes(self):
+        # Average ½ Tr U_P per plane (μ, ν) in PLANES
+        U = self.U
+        out = []
+        for mu, nu in PLANES:
+            left = qmul(U[mu], np.take(U[nu], self.up[mu], axis=1))
+            right = qmul(U[nu], np.take(U[mu], self.up[nu], axis=1))
+            out.append(np.mean(np.sum(left * right, axis=0)))  # Re ½ Tr(left right†)
+        return np.array(out)
+
+
+def field_strength_squared(plaquettes, beta, a=l_meta):
+    # Σ_a (F^a_μν)² per plane from the average plaquettes
+    return 2 * beta * (1 - plaquettes) / a**4
+
+
+def plaquette_energy_density(plaquettes, beta, a=l_meta):
+    # (electric, magnetic, rho) in the convention of the random-potential estimator, whose potentials
+    # carry the field scale κ per lattice spacing (A = κ a A_μ), so F² -> κ² a² F²
+    F2 = kappa**2 * a**2 * field_strength_squared(plaquettes, beta, a)
+    electric = sum(F2[i] for i, (mu, nu) in enumerate(PLANES) if mu == 0)
+    magnetic = -0.25 * sum(F2[i] for i, (mu, nu) in enumerate(PLANES) if mu > 0)
+    return electric, magnetic, electric + magnetic
+
+
+def _slab_worker(shm_name, L, beta, slab, seed, barrier, conn):
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        U = np.ndarray((4, 4, L**4), buffer=shm.buf)
+        lattice = SU2Lattice(L, beta, seed=seed, U=U)
+        lattice.set_slab(*slab)
+        while True:
+            task = conn.recv()
+            if task is None:
+                break
+            sweeps, algorithm, kwargs = task
+            try:
+                conn.send(sum(lattice.sweep(algorithm, barrier, **kwargs) for _ in range(sweeps)))
+            except BaseException:
+                barrier.abort()  # Release the other slabs instead of leaving them waiting
+                raise
+        del U, lattice
+    finally:
+        shm.close()
+
+
+class SlabPool:
+    # Worker processes updating x0-slabs of one lattice held in shared memory
+    def __init__(self, lattice, processes, seed=42):
+        import multiprocessing
+        from multiprocessing import shared_memory
+        if not 1 <= processes <= lattice.L:
+            raise ValueError("processes must be between 1 and L.")
+        self.lattice = lattice
+        self.shm = shared_memory.SharedMemory(create=True, size=lattice.U.nbytes)
+        shared = np.ndarray(lattice.U.shape, buffer=self.shm.buf)
+        shared[:] = lattice.U
+        lattice.U = shared
+        context = multiprocessing.get_context("spawn")
+        self.barrier = context.Barrier(processes)  # Kept referenced until the workers have attached
+        bounds = np.linspace(0, lattice.L, processes + 1).astype(int)
+        seeds = np.random.SeedSequence(seed).spawn(processes)
+        self.conns, self.workers = [], []
+        for w in range(processes):
+            conn, child = context.Pipe()
+            worker = context.Process(target=_slab_worker, daemon=True, args=(
+                self.shm.name, lattice.L, lattice.beta, (bounds[w], bounds[w + 1]), seeds[w], self.barrier, child))
+            worker.start()
+            self.conns.append(conn)
+            self.workers.append(worker)
+
+    def sweep(self, sweeps=1, algorithm="heatbath", **kwargs):
+        for conn in self.conns:
+            conn.send((sweeps, algorithm, kwargs))
+        return sum(conn.recv() for conn in self.conns)
+
+    def close(self):
+        for conn in self.conns:
+            try:
+                conn.send(None)
+            except OSError:
+                pass  # Worker already gone
+        for worker in self.workers:
+            worker.join()
+        self.lattice.U = self.lattice.U.copy()
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def run_lattice(L=8, beta=None, algorithm="heatbath", therm=20, sweeps=50, processes=1, seed=42,
+                start="cold", report=None, **kwargs):
+    # Thermalize, then measure the plaquettes after every sweep.
+    # Returns (lattice, plaquette history (sweeps, 6), acceptance rate, link updates per second)
+    import time
+    lattice = SU2Lattice(L, beta, start, seed)
+    pool = SlabPool(lattice, processes, seed) if processes > 1 else None
+    step = pool.sweep if pool else (lambda n, *a, **k: sum(lattice.sweep(*a, **k) for _ in range(n)))
+    history, accepted, start_time = [], 0, time.perf_counter()
+    try:
+        for i in range(therm + sweeps):
+            accepted += step(1, algorithm, **kwargs)
+            if i >= therm:
+                history.append(lattice.plaquettes())
+            if report:
+                report(i, lattice)
+    finally:
+        if pool:
+            pool.close()
+    elapsed = time.perf_counter() - start_time
+    links = 4 * lattice.V * (therm + sweeps)
+    return lattice, np.array(history), accepted / links, links / elapsed
+
+
+def plot_plaquette_history(plt, plaquettes, weak_coupling):
+    plt.figure(figsize=(8, 4))
+    plt.plot(plaquettes, color='blue', label='⟨P⟩ per sweep')
+    plt.axhline(weak_coupling, color='red', linestyle='--', label='Weak coupling 1 - 3/(4β)')
+    plt.xlabel('Measurement sweep')
+    plt.ylabel('Average plaquette ⟨½ Tr U_P⟩')
+    plt.title('SU(2) Lattice Plaquette History')
+    plt.legend()
+    plt.grid(True)
+
+
+if __name__ == "__main__":
+    from plot_backend import submit_figure, wait_for_figures
+    from yang_mills_field_dynamics import yang_mills_energy_density
+
+    print("=== SU(2) Lattice Yang-Mills Configuration ===")
+    try:
+        L = int(input("Enter lattice size L (even) [default 8]: ") or 8)
+        beta = float(input(f"Enter inverse coupling beta [default 4/g^2 = {4 / g**2:.4f}]: ") or 4 / g**2)
+        algorithm = input("Select algorithm heatbath/metropolis [default heatbath]: ").strip().lower() or "heatbath"
+        therm = int(input("Enter thermalization sweeps [default 20]: ") or 20)
+        sweeps = int(input("Enter measurement sweeps [default 50]: ") or 50)
+        processes = int(input("Enter worker processes (x0-slabs) [default 1]: ") or 1)
+        seed = int(input("Enter random seed [default 42]: ") or 42)
+        if L < 2 or L % 2 or beta <= 0 or therm < 0 or sweeps < 2 or not 1 <= processes <= L:
+            raise ValueError("L must be even, beta positive, sweeps >= 2, and 1 <= processes <= L.")
+        if algorithm not in ("heatbath", "metropolis"):
+            raise ValueError(f"Unknown algorithm {algorithm}.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        L, beta, algorithm, therm, sweeps, processes, seed = 8, 4 / g**2, "heatbath", 20, 50, 1, 42
+
+    lattice, history, acceptance, rate = run_lattice(L, beta, algorithm, therm, sweeps, processes, seed)
+    P = history.mean(axis=1)
+    P_mean, P_err = P.mean(), P.std(ddof=1) / np.sqrt(len(P))
+    electric, magnetic, rho_lattice = plaquette_energy_density(history.mean(axis=0), beta)
+    rho_random = yang_mills_energy_density(2.74309, 0.05894, 1000).sum(axis=1).mean()
+
+    print("=== SU(2) Lattice Yang-Mills Results ===")
+    print(f"Lattice {L}^4, beta = {beta:.4f}, {algorithm}, {processes} process(es)")
+    print(f"Average plaquette: {P_mean:.6f} ± {P_err:.6f} (weak coupling 1 - 3/(4β) = {1 - 3 / (4 * beta):.6f})")
+    print("Plaquette per plane: " + ", ".join(f"P{mu}{nu} = {p:.5f}" for (mu, nu), p in zip(PLANES, history.mean(axis=0))))
+    if algorithm == "metropolis":
+        print(f"Acceptance rate: {acceptance:.3f}")
+    print(f"Plaquette energy density (a = l_meta): electric {electric:.8e}, magnetic {magnetic:.8e}, "
+          f"rho = {rho_lattice:.8e} J/m^3")
+    print(f"Random-potential estimator rho (summed over color): {rho_random:.8e} J/m^3 "
+          f"(lattice/random = {rho_lattice / rho_random:.4g})")
+    print(f"Throughput: {rate:.4g} link updates per second")
+
+    submit_figure(plot_plaquette_history, 'img/lattice_plaquette_history.png',
+                  plaquettes=P, weak_coupling=1 - 3 / (4 * beta))
+    wait_for_figures()
@@ -2,32 +2,577 @@
 # File: lie_group_branching_e8_su321.py
 # Purpose: Validate branching dimensions of E8 and its subgroups down to the Standard Model
 # Method:
-#   - Define stepwise subgroup decomposition from E8 → E6 → SO(10) → SU(5) → SM gauge groups
-#   - List expected dimension counts of each group and multiplet decomposition
+#   - Cartan matrices of the simple Lie algebras (Bourbaki numbering); positive roots
+#     generated from the simple roots by root strings
+#   - Irrep dimensions from the Weyl formula dim V(λ) = Π_{α>0} (λ+ρ, α)/(ρ, α),
+#     evaluated in exact integer arithmetic
+#   - Dominant weights by subtracting positive roots from λ; multiplicities from
+#     Freudenthal's formula
+#       m(μ) = 2 Σ_{α>0} Σ_{k≥1} m(μ+kα) (μ+kα, α) / (|λ+ρ|² - |μ+ρ|²),
+#     evaluated level by level on integer arrays (Weyl invariance: m(μ+kα) is read
+#     off the dominant conjugate via a sorted key lookup)
+#   - Full weight systems as Weyl orbits of the dominant weights, generated as
+#     integer arrays level by level through simple reflections; all characters are
+#     memoized per algebra
+#   - Regular subalgebra embeddings E8 ⊃ E6×SU(3), E6 ⊃ SO(10)×U(1),
+#     SO(10) ⊃ SU(5)×U(1), SU(5) ⊃ SU(3)×SU(2)×U(1) as integer projection matrices
+#     (subalgebra simple roots and U(1) coweights in parent coordinates); chained
+#     embeddings are matrix products
+#   - Branching: project all weights, keep the subgroup-dominant ones in a sparse
+#     weight dictionary and peel off highest weights with their dominant characters
+#   - Persisted table store keyed by (group, Dynkin labels, embedding): each entry
+#     holds the irrep dimension, the dominant weights with multiplicities and the
+#     branching result as compact .npy arrays, memory-mapped lazily on first use;
+#     entries are renamed into place atomically, so concurrent runs can share them
+# Inputs:
+# - group: E8, E6, SO(10) or SU(5) (default: E8)
+# - Dynkin labels of the highest weight (default: adjoint)
+# - steps: Number of branching steps down the chain (default: 1)
 # Output:
-#   - Prints dimension checks for each subgroup and multiplet breakdown
+#   - Prints Weyl-formula dimension checks for each subgroup
+#   - Prints the decomposition into subgroup irreps with multiplicities and U(1) charges
+#   - Branching tables in img/branching_tables (or $BRANCHING_TABLE_DIR)
 # ========================================================
 
-groups = [
-    ("E8", 248),
-    ("E6", 78),
-    ("SO(10)", 45),
-    ("SU(5)", 24),
-    ("SU(3) × SU(2) × U(1)", 8 + 3 + 1),
-]
-
-multiplet_counts = {
-    "E8": 248,
-    "E6 + extra": 78 + 27 + 27 + 1 + 1 + 1 + 1 + 1 + 1,  # common E6 decompositions
-    "SO(10) (adjoint)": 45,
-    "SU(5) (adjoint)": 24,
-    "Standard Model": 8 + 3 + 1  # gluons, weak bosons, photon
+import json
+import math
+import os
+import shutil
+import tempfile
+import time
+from functools import lru_cache
+from fractions import Fraction
+import numpy as np
+
+TABLE_DIR = os.environ.get("BRANCHING_TABLE_DIR", "img/branching_tables")
+GROUP_NAMES = {"E8": "E8", "E6": "E6", "SO(10)": "D5", "SU(5)": "A4", "SU(3)": "A2", "SU(2)": "A1"}
+DISPLAY_NAMES = {v: k for k, v in GROUP_NAMES.items()}
+
+
+def cartan_matrix(series, rank):
+    # A_ij = 2 (α_i, α_j) / (α_j, α_j), Bourbaki numbering
+    A = 2 * np.eye(rank, dtype=np.int64)
+    if series in ("A", "B", "C", "F", "G"):
+        for i in range(rank - 1):
+            A[i, i + 1] = A[i + 1, i] = -1
+        if series == "B":
+            A[rank - 2, rank - 1] = -2
+        elif series == "C":
+            A[rank - 1, rank - 2] = -2
+        elif series == "F":
+            A[1, 2] = -2
+        elif series == "G":
+            A[1, 0] = -3
+    elif series == "D":
+        for i in range(rank - 2):
+            A[i, i + 1] = A[i + 1, i] = -1
+        A[rank - 3, rank - 1] = A[rank - 1, rank - 3] = -1
+    elif series == "E":
+        edges = [(0, 2), (1, 3)] + [(i, i + 1) for i in range(2, rank - 1)]
+        for i, j in edges:
+            A[i, j] = A[j, i] = -1
+    else:
+        raise ValueError(f"Unknown Lie algebra series '{series}'.")
+    return A
+
+
+class LieAlgebra:
+    # Simple Lie algebra with memoized characters; weights are Dynkin labels (int arrays)
+    def __init__(self, name):
+        self.name = name
+        self.series, self.rank = name[0], int(name[1:])
+        self.cartan = cartan_matrix(self.series, self.rank)
+        self.d = self._symmetrizer()
+        self.positive_roots = self._positive_roots()  # simple-root coordinates
+        self.roots_dynkin = self.positive_roots @ self.cartan
+        self.det = int(round(np.linalg.det(self.cartan)))
+        # Quadratic form (ω_i, ω_j) = (A⁻¹)_ij d_j, scaled by det(A) to integers
+        self.form = np.rint(np.linalg.inv(self.cartan) * self.det * self.d[None, :]).astype(np.int64)
+        self.inv_cartan = np.linalg.inv(self.cartan)
+        self._dominant = {}
+        self._weights = {}
+
+    def _symmetrizer(self):
+        # d_j = (α_j, α_j)/2 with short roots normalized to d = 1
+        d = [Fraction(0)] * self.rank
+        d[0] = Fraction(1)
+        stack = [0]
+        while stack:
+            i = stack.pop()
+            for j in range(self.rank):
+                if self.cartan[i, j] != 0 and j != i and d[j] == 0:
+                    d[j] = d[i] * int(self.cartan[j, i]) / int(self.cartan[i, j])
+                    stack.append(j)
+        scale = 1 / min(d)
+        return np.array([int(x * scale) for x in d], dtype=np.int64)
+
+    def _positive_roots(self):
+        # Root strings: β + α_i is a root iff p = q - ⟨β, α_i^∨⟩ > 0
+        simple = [tuple(int(i == j) for j in range(self.rank)) for i in range(self.rank)]
+        roots, level = set(simple), list(simple)
+        while level:
+            nxt = []
+            for beta in level:
+                labels = np.array(beta) @ self.cartan
+                for i in range(self.rank):
+                    q = 0
+                    down = list(beta)
+                    while True:
+                        down[i] -= 1
+                        if tuple(down) not in roots:
+                            break
+                        q += 1
+                    if q - labels[i] > 0:
+                        up = list(beta)
+                        up[i] += 1
+                        up = tuple(up)
+                        if up not in roots:
+                            roots.add(up)
+                            nxt.append(up)
+            level = nxt
+        return np.array(sorted(roots, key=lambda r: (sum(r), r)), dtype=np.int64)
+
+    def dim(self, hw):
+        # Weyl dimension formula in exact integers
+        hw = np.asarray(hw, dtype=np.int64)
+        numer = self.positive_roots @ ((hw + 1) * self.d)
+        denom = self.positive_roots @ self.d
+        return math.prod(int(x) for x in numer) // math.prod(int(x) for x in denom)
+
+    def inner(self, a, b):
+        # det(A) · (a, b) for Dynkin-label arrays, broadcast over leading axes
+        return np.einsum('...i,ij,...j->...', a, self.form, b)
+
+    def height(self, weights):
+        # ⟨μ, ρ^∨⟩-type level: sum of simple-root coordinates
+        return np.asarray(weights) @ self.inv_cartan.sum(axis=1)
+
+    def to_dominant(self, weights):
+        # Dominant Weyl conjugates of a batch of weights: reflect each row in its first
+        # negative label until none is left
+        w = np.array(weights, dtype=np.int64)
+        active = np.nonzero((w < 0).any(axis=1))[0]
+        while len(active):
+            sub = w[active]
+            i = np.argmax(sub < 0, axis=1)
+            sub -= sub[np.arange(len(sub)), i, None] * self.cartan[i]
+            w[active] = sub
+            active = active[(sub < 0).any(axis=1)]
+        return w
+
+    def dominant_weights(self, hw):
+        # Dominant weights of V(hw), ordered by depth below hw
+        hw = np.asarray(hw, dtype=np.int64)
+        seen = {tuple(hw)}
+        level, found = hw[None, :], [hw[None, :]]
+        while len(level):
+            cand = (level[:, None, :] - self.roots_dynkin[None, :, :]).reshape(-1, self.rank)
+            cand = np.unique(cand[(cand >= 0).all(axis=1)], axis=0)
+            new = [c for c in map(tuple, cand) if c not in seen]
+            seen.update(new)
+            level = np.array(new, dtype=np.int64).reshape(-1, self.rank)
+            found.append(level)
+        dom = np.concatenate(found)
+        depth = np.rint(self.height(hw) - self.height(dom)).astype(np.int64)
+        order = np.argsort(depth, kind="stable")
+        return dom[order], depth[order]
+
+    def dominant_character(self, hw):
+        # (dominant weights, multiplicities) of V(hw) via Freudenthal, memoized
+        key = tuple(int(x) for x in hw)
+        if key not in self._dominant:
+            self._dominant[key] = self._freudenthal(np.array(key, dtype=np.int64))
+        return self._dominant[key]
+
+    def _freudenthal(self, hw):
+        dom, depth = self.dominant_weights(hw)
+        mult = np.zeros(len(dom), dtype=np.int64)
+        mult[0] = 1
+        base = int(dom.max()) + 1
+        if base ** self.rank >= 2**62:
+            raise OverflowError("Highest weight too large for integer weight keys.")
+        radix = base ** np.arange(self.rank, dtype=np.int64)
+        keys = dom @ radix
+        sorter = np.argsort(keys)
+        sorted_keys = keys[sorter]
+
+        def lookup(weights):
+            # Index into dom of each weight, -1 if not a dominant weight of V(hw)
+            inside = (weights < base).all(axis=1)
+            k = np.where(inside, np.minimum(weights, base - 1) @ radix, -1)
+            pos = np.clip(np.searchsorted(sorted_keys, k), 0, len(keys) - 1)
+            return np.where(inside & (sorted_keys[pos] == k), sorter[pos], -1)
+
+        rho = np.ones(self.rank, dtype=np.int64)
+        top = self.inner(hw + rho, hw + rho)
+        root_d = self.positive_roots * self.d  # (ν, α) = Σ_j ν_j d_j c_j
+        for lvl in np.unique(depth)[1:]:
+            idx = np.nonzero(depth == lvl)[0]
+            mu = dom[idx]
+            numer = np.zeros(len(idx), dtype=np.int64)
+            # Strings μ + kα for all (μ, α) pairs, k = 1, 2, ... until they leave V(hw)
+            which = np.repeat(np.arange(len(idx)), len(self.positive_roots))
+            alpha = np.tile(np.arange(len(self.positive_roots)), len(idx))
+            k = 1
+            while len(which):
+                nu = mu[which] + k * self.roots_dynkin[alpha]
+                pos = lookup(self.to_dominant(nu))
+                hit = pos >= 0
+                which, alpha, nu, pos = which[hit], alpha[hit], nu[hit], pos[hit]
+                np.add.at(numer, which, mult[pos] * np.einsum('ij,ij->i', nu, root_d[alpha]))
+                k += 1
+            denom = top - self.inner(mu + rho, mu + rho)
+            mult[idx] = 2 * self.det * numer // denom
+        return dom, mult
+
+    def orbits(self, dominant):
+        # Weyl orbits of a batch of dominant weights, generated together level by level by
+        # simple reflections. Each non-dominant weight has a unique parent s_i w (i = its
+        # first negative label), so a child s_i w is kept only if its labels before i are
+        # non-negative: every orbit element is produced exactly once, without deduplication.
+        # Returns (weights, index of the dominant weight each one belongs to).
+        level = np.asarray(dominant, dtype=np.int64).reshape(-1, self.rank)
+        source = np.arange(len(level))
+        out, out_source = [level], [source]
+        while len(level):
+            nxt, nxt_source = [], []
+            for i in range(self.rank):
+                up = level[:, i] > 0
+                child = level[up] - level[up, i, None] * self.cartan[i]
+                keep = (child[:, :i] >= 0).all(axis=1)
+                nxt.append(child[keep])
+                nxt_source.append(source[up][keep])
+            level, source = np.concatenate(nxt), np.concatenate(nxt_source)
+            out.append(level)
+            out_source.append(source)
+        return np.concatenate(out), np.concatenate(out_source)
+
+    def weight_system(self, hw):
+        # All weights of V(hw) with multiplicities, memoized
+        key = tuple(int(x) for x in hw)
+        if key not in self._weights:
+            dom, mult = self.dominant_character(key)
+            weights, source = self.orbits(dom)
+            self._weights[key] = (weights, mult[source])
+        return self._weights[key]
+
+
+def _unique_rows(w):
+    # Unique rows of an int array and inverse indices, through a single int64 key where it fits
+    lo, hi = int(w.min()), int(w.max())
+    base = hi - lo + 1
+    if base ** w.shape[1] >= 2**62:
+        uniq, inverse = np.unique(w, axis=0, return_inverse=True)
+        return uniq, inverse.ravel()
+    radix = base ** np.arange(w.shape[1], dtype=np.int64)
+    _, first, inverse = np.unique((w - lo) @ radix, return_index=True, return_inverse=True)
+    return w[first], inverse
+
+
+@lru_cache(maxsize=None)
+def lie_algebra(name):
+    return LieAlgebra(GROUP_NAMES.get(name, name))
+
+
+class Embedding:
+    # Subgroup H = Π factors of a parent algebra; factor None is a U(1).
+    # projection: integer matrix mapping parent Dynkin labels to the concatenated
+    # factor labels (U(1) rows give integer-normalized charges)
+    def __init__(self, parent, factors, projection, key=None):
+        self.parent = parent
+        self.factors = factors
+        self.key = key
+        self.projection = np.asarray(projection, dtype=np.int64)
+        self.slices = []
+        self._branchings = {}
+        start = 0
+        for f in factors:
+            n = f.rank if f is not None else 1
+            self.slices.append(slice(start, start + n))
+            start += n
+
+    @property
+    def name(self):
+        return " × ".join(DISPLAY_NAMES.get(f.name, f.name) if f is not None else "U(1)"
+                          for f in self.factors)
+
+
+def regular_embedding(parent, components, key=None):
+    # components: list of (subalgebra name, simple roots in parent simple-root coordinates)
+    # or ("U1", node) for the U(1) generated by the fundamental coweight of a removed node
+    factors, rows = [], []
+    S = parent.cartan * parent.d[None, :]  # (α_i, α_j)
+    for name, spec in components:
+        if name == "U1":
+            col = parent.form[:, spec]
+            rows.append(col // np.gcd.reduce(col))
+            factors.append(None)
+            continue
+        sub = lie_algebra(name)
+        for beta in np.asarray(spec, dtype=np.int64):
+            # ⟨λ, β^∨⟩ = 2 (λ, β) / (β, β)
+            rows.append(2 * beta * parent.d // (beta @ S @ beta))
+        factors.append(sub)
+    return Embedding(parent, factors, np.array(rows), key)
+
+
+def compose(outer, index, inner):
+    # Replace factor `index` of outer by the factors of inner (inner.parent is that factor)
+    rows = outer.projection[outer.slices[index]]
+    factors = outer.factors[:index] + inner.factors + outer.factors[index + 1:]
+    projection = np.concatenate([outer.projection[:outer.slices[index].start],
+                                 inner.projection @ rows,
+                                 outer.projection[outer.slices[index].stop:]])
+    return Embedding(outer.parent, factors, projection, f"{outer.key}+{inner.key}")
+
+
+class BranchingTable:
+    # One persisted entry: meta.json plus .npy arrays, memory-mapped on first access
+    def __init__(self, path):
+        self.path = path
+        self._meta = None
+        self._arrays = {}
+
+    @property
+    def meta(self):
+        if self._meta is None:
+            with open(os.path.join(self.path, "meta.json")) as f:
+                self._meta = json.load(f)
+        return self._meta
+
+    def __getitem__(self, name):
+        if name not in self._arrays:
+            self._arrays[name] = np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+        return self._arrays[name]
+
+
+class BranchingStore:
+    # Directory of branching tables keyed by (group, Dynkin labels, embedding).
+    # Entries are written to a temporary directory and renamed into place, so
+    # concurrent processes never see partial tables; the first writer wins.
+    def __init__(self, root=TABLE_DIR):
+        self.root = root
+        self._tables = {}
+
+    def path(self, group, hw, embedding_key):
+        name = f"{group}_{'-'.join(str(int(x)) for x in hw)}_{embedding_key}"
+        return os.path.join(self.root, "".join(c if c.isalnum() or c in "+-_" else "" for c in name))
+
+    def get(self, group, hw, embedding_key):
+        path = self.path(group, hw, embedding_key)
+        if path not in self._tables and os.path.isdir(path):
+            self._tables[path] = BranchingTable(path)
+        return self._tables.get(path)
+
+    def put(self, group, hw, embedding_key, arrays, meta):
+        path = self.path(group, hw, embedding_key)
+        os.makedirs(self.root, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=self.root, prefix=".tmp_")
+        for name, arr in arrays.items():
+            np.save(os.path.join(tmp, f"{name}.npy"), arr)
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            shutil.rmtree(tmp)  # Written concurrently by another process
+        return self.get(group, hw, embedding_key)
+
+
+def _compact(arr):
+    # Smallest signed integer dtype holding the array
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if not len(arr) or (arr.min() >= info.min and arr.max() <= info.max):
+            return arr.astype(dtype)
+    return arr.astype(np.int64)
+
+
+def store_branching(store, hw, embedding, result):
+    # Persist irrep dimension, dominant character and branching of V(hw)
+    parent = embedding.parent
+    dom, mult = parent.dominant_character(hw)
+    width = embedding.slices[-1].stop
+    rows = np.array([sum(parts, ()) for parts in result], dtype=np.int64).reshape(-1, width)
+    arrays = {
+        "dominant_weights": _compact(dom),
+        "dominant_mults": mult,
+        "branch_weights": _compact(rows),
+        "branch_mults": np.array(list(result.values()), dtype=np.int64),
+    }
+    meta = {"group": DISPLAY_NAMES.get(parent.name, parent.name), "algebra": parent.name,
+            "labels": [int(x) for x in hw], "embedding": embedding.key, "subgroup": embedding.name,
+            "dim": parent.dim(hw)}
+    return store.put(parent.name, hw, embedding.key, arrays, meta)
+
+
+def load_branching(table, embedding):
+    rows = np.asarray(table["branch_weights"]).tolist()
+    return {tuple(tuple(row[s]) for s in embedding.slices): int(n)
+            for row, n in zip(rows, table["branch_mults"].tolist())}
+
+
+def branch(hw, embedding, store=None):
+    # Decompose V(hw) of embedding.parent into irreps of the subgroup.
+    # Returns {tuple of per-factor highest weights (U(1): charge): multiplicity}, memoized
+    # in memory and, with a store, on disk across processes
+    key = tuple(int(x) for x in hw)
+    if key not in embedding._branchings:
+        table = store.get(embedding.parent.name, key, embedding.key) if store is not None else None
+        if table is not None:
+            embedding._branchings[key] = load_branching(table, embedding)
+        else:
+            embedding._branchings[key] = _branch(key, embedding)
+            if store is not None:
+                store_branching(store, key, embedding, embedding._branchings[key])
+    return embedding._branchings[key]
+
+
+def _branch(hw, embedding):
+    weights, mults = embedding.parent.weight_system(hw)
+    proj = weights @ embedding.projection.T
+    nonabelian = [s for f, s in zip(embedding.factors, embedding.slices) if f is not None]
+    dominant = np.ones(len(proj), dtype=bool)
+    for s in nonabelian:
+        dominant &= (proj[:, s] >= 0).all(axis=1)
+    proj, mults = proj[dominant], mults[dominant]
+    uniq, inverse = _unique_rows(proj)
+    counts = np.bincount(inverse, weights=mults).astype(np.int64)
+    remaining = dict(zip(map(tuple, uniq.tolist()), counts.tolist()))
+
+    # Peel off highest weights in order of decreasing height
+    level = np.zeros(len(uniq))
+    for f, s in zip(embedding.factors, embedding.slices):
+        if f is not None:
+            level += uniq[:, s] @ f.inv_cartan.sum(axis=1)
+    result = {}
+    for w in map(tuple, uniq[np.argsort(-level, kind="stable")].tolist()):
+        n = remaining[w]
+        if n == 0:
+            continue
+        parts = tuple(w[s] for s in embedding.slices)
+        result[parts] = n
+        # Subtract n × dominant character of the product irrep
+        char_weights, char_mults = product_character(embedding, parts)
+        for key, m in zip(map(tuple, char_weights.tolist()), char_mults.tolist()):
+            remaining[key] -= n * m
+    return result
+
+
+def product_character(embedding, parts):
+    # Dominant character of a subgroup irrep: Cartesian product of the factor characters
+    weights = np.zeros((1, 0), dtype=np.int64)
+    mults = np.ones(1, dtype=np.int64)
+    for f, p in zip(embedding.factors, parts):
+        fw, fm = f.dominant_character(p) if f is not None else (np.array([p]), np.array([1]))
+        weights = np.concatenate([np.repeat(weights, len(fw), axis=0), np.tile(fw, (len(weights), 1))], axis=1)
+        mults = np.repeat(mults, len(fw)) * np.tile(fm, len(mults))
+    return weights, mults
+
+E8 = lie_algebra("E8")
+E6 = lie_algebra("E6")
+D5 = lie_algebra("D5")
+A4 = lie_algebra("A4")
+
+_THETA_E8 = E8.positive_roots[-1]  # highest root (2, 3, 4, 6, 5, 4, 3, 2)
+
+# Single steps of the chain E8 ⊃ E6 ⊃ SO(10) ⊃ SU(5) ⊃ SU(3) × SU(2) × U(1)
+EMBEDDINGS = {
+    # Extended E8 diagram with node 7 removed: {α1..α6} = E6, {α8, -θ} = SU(3)
+    "E8": regular_embedding(E8, [("E6", np.eye(8, dtype=np.int64)[:6]),
+                                 ("A2", [np.eye(8, dtype=np.int64)[7], -_THETA_E8])], "E6xSU3"),
+    # Node 1 removed: (α6, α5, α4, α3, α2) = D5 in Bourbaki order
+    "E6": regular_embedding(E6, [("D5", np.eye(6, dtype=np.int64)[[5, 4, 3, 2, 1]]), ("U1", 0)], "SO10xU1"),
+    # Spinor node 5 removed: A4 chain, U(1) from ω5
+    "SO(10)": regular_embedding(D5, [("A4", np.eye(5, dtype=np.int64)[:4]), ("U1", 4)], "SU5xU1"),
+    # Node 3 removed: SU(3) = (α1, α2), SU(2) = α4, hypercharge from ω3
+    "SU(5)": regular_embedding(A4, [("A2", np.eye(4, dtype=np.int64)[:2]),
+                                    ("A1", np.eye(4, dtype=np.int64)[3:]), ("U1", 2)], "SU3xSU2xU1"),
 }
+CHAIN = ["E8", "E6", "SO(10)", "SU(5)"]
+ADJOINT = {"E8": (0, 0, 0, 0, 0, 0, 0, 1), "E6": (0, 1, 0, 0, 0, 0),
+           "SO(10)": (0, 1, 0, 0, 0), "SU(5)": (1, 0, 0, 1)}
+
+
+def chain_embedding(group, steps):
+    # Compose `steps` consecutive embeddings starting at `group`; the first factor
+    # of each subgroup is broken further
+    start = CHAIN.index(group)
+    emb = EMBEDDINGS[CHAIN[start]]
+    for g in CHAIN[start + 1:start + steps]:
+        emb = compose(emb, 0, EMBEDDINGS[g])
+    return emb
+
+
+def branch_chain(hw, group, steps, store=None):
+    # Step-by-step branching down the chain; each intermediate irrep is decomposed once
+    # (memoized per embedding, persisted with a store) and the spectator factors are
+    # carried along. With a store the composed result is persisted as well.
+    embedding = chain_embedding(group, steps)
+    hw = tuple(int(x) for x in hw)
+    table = store.get(embedding.parent.name, hw, embedding.key) if store is not None else None
+    if table is not None:
+        return load_branching(table, embedding)
+    start = CHAIN.index(group)
+    result = {(hw,): 1}
+    for g in CHAIN[start:start + steps]:
+        nxt = {}
+        for parts, n in result.items():
+            for sub, m in branch(parts[0], EMBEDDINGS[g], store).items():
+                key = sub + parts[1:]
+                nxt[key] = nxt.get(key, 0) + n * m
+        result = nxt
+    if store is not None and store.get(embedding.parent.name, hw, embedding.key) is None:
+        store_branching(store, hw, embedding, result)
+    return result
+
+
+def format_irrep(embedding, parts):
+    labels = []
+    for f, p in zip(embedding.factors, parts):
+        labels.append(f"{p[0]:+d}" if f is None else str(f.dim(p)))
+    return "(" + ", ".join(labels) + ")"
+
+
+if __name__ == "__main__":
+    print("=== E8 Branching Configuration ===")
+    group = input("Enter group E8/E6/SO(10)/SU(5) [default E8]: ").strip() or "E8"
+    if group not in CHAIN:
+        print(f"Invalid input: unknown group {group}. Using default values.")
+        group = "E8"
+    algebra = lie_algebra(group)
+    try:
+        text = input(f"Enter Dynkin labels of the highest weight [default {','.join(map(str, ADJOINT[group]))}]: ")
+        hw = tuple(int(x) for x in text.split(",")) if text.strip() else ADJOINT[group]
+        steps = int(input(f"Enter number of branching steps 1..{len(CHAIN) - CHAIN.index(group)} [default 1]: ") or 1)
+        if len(hw) != algebra.rank or min(hw) < 0 or not 1 <= steps <= len(CHAIN) - CHAIN.index(group):
+            raise ValueError("Dynkin labels must be non-negative, one per node, and steps within the chain.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        hw, steps = ADJOINT[group], 1
+
+    print("=== E8 Branching Dimension Validation ===")
+    for name in CHAIN + ["SU(3)", "SU(2)"]:
+        g = lie_algebra(name)
+        adj = tuple(int(x) for x in g.positive_roots[-1] @ g.cartan)  # highest root = adjoint
+        print(f"{name:<8} ({g.name}) rank {g.rank:<2} → dim(adjoint) = {g.dim(adj):<4} "
+              f"(positive roots: {len(g.positive_roots)})")
 
-print("=== E8 Branching Dimension Validation ===")
-for name, dim in groups:
-    print(f"{name:<30} → dim = {dim}")
+    store = BranchingStore()
+    embedding = chain_embedding(group, steps)
+    cached = store.get(algebra.name, hw, embedding.key) is not None
+    start = time.perf_counter()
+    result = branch_chain(hw, group, steps, store)
+    elapsed = time.perf_counter() - start
+    table = store.get(algebra.name, hw, embedding.key)
 
-print("\n=== Multiplet Breakdown Check ===")
-for label, dim in multiplet_counts.items():
-    print(f"{label:<30} = {dim}")
+    print(f"\n=== Branching {group} {hw} → {embedding.name} ===")
+    print(f"dim = {table.meta['dim']}, dominant weights = {len(table['dominant_weights'])}, "
+          f"time = {elapsed:.2f} s ({'loaded from' if cached else 'stored in'} {table.path})")
+    total = 0
+    for parts, n in sorted(result.items(), key=lambda item: -math.prod(
+            f.dim(p) for f, p in zip(embedding.factors, item[0]) if f is not None)):
+        d = math.prod(f.dim(p) for f, p in zip(embedding.factors, parts) if f is not None)
+        total += n * d
+        print(f"  {n:>4} × {format_irrep(embedding, parts):<28} labels {parts}")
+    print(f"Dimension check: Σ = {total} (expected {algebra.dim(hw)})")
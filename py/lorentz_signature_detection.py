@@ -4,51 +4,61 @@
 # Method:
 #   - Compute 4×4 Hessians of S(x) at random points
 #   - Count positive vs. negative eigenvalues
+#   - Scale-free class probabilities with 95% intervals from the signature lookup
+#     table (signature_tables.py); tau only rescales H and leaves every sign unchanged
 # Inputs:
 # - N_samples: Number of Hessian samples (default: 1000)
 # - tau: Meta-time scale (default: 5.391e-44 s)
 # Output:
-#   - Signature distribution & eigenvalue histograms
+#   - Signature distribution & eigenvalue histograms, table probabilities for comparison
 # ========================================================
 
 import numpy as np
-from numpy.linalg import eigvalsh
-import matplotlib.pyplot as plt
-import numpy as np
 
 
-# Interactive Inputs
-print("=== Lorentz Signature Detection Configuration ===")
-try:
-    N_samples = int(input("Enter number of samples N_samples [default 1000]: ") or 1000)
-    tau = float(input("Enter meta-time scale tau (s) [default 5.391e-44]: ") or 5.391e-44)
-    if N_samples <= 0 or tau <= 0:
-        raise ValueError("N_samples and tau must be positive.")
-    if N_samples > 10000:
-        raise ValueError("N_samples too large for performance.")
-except ValueError as e:
-    print(f"Invalid input: {e}. Using default values.")
-    N_samples = 1000
-    tau = 5.391e-44
-
-np.random.seed(42)
-signature_counts = {(+1, -3): 0, (-1, +3): 0, 'other': 0}
-
-for _ in range(N_samples):
-    H = np.random.normal(loc=0, scale=1/np.sqrt(tau), size=(4, 4))
-    H = (H + H.T) / 2  # Symmetrize
-    eigenvalues = np.linalg.eigvalsh(H)
-    signs = np.sign(eigenvalues)
-    positive = np.sum(signs > 0)
-    negative = np.sum(signs < 0)
-    if positive == 1 and negative == 3:
-        signature_counts[(+1, -3)] += 1
-    elif positive == 3 and negative == 1:
-        signature_counts[(-1, +3)] += 1
-    else:
-        signature_counts['other'] += 1
-
-total = sum(signature_counts.values())
-print("=== Lorentz Signature Statistics ===")
-for sig, count in signature_counts.items():
-    print(f"Signature {sig}: {count} ({count/total*100:.2f}%)")
\ No newline at end of file
+def random_hessian_eigenvalues(N_samples, scale, n=4, seed=42):
+    # Eigenvalues of N_samples symmetrized Gaussian n×n matrices -> (N_samples, n)
+    rng = np.random.RandomState(seed)
+    H = rng.normal(loc=0, scale=scale, size=(N_samples, n, n))
+    H = (H + H.swapaxes(-1, -2)) / 2  # Symmetrize
+    return np.linalg.eigvalsh(H)
+
+
+def signature_counts(eigenvalues):
+    positive = np.sum(eigenvalues > 0, axis=-1)
+    negative = np.sum(eigenvalues < 0, axis=-1)
+    lorentz = np.sum((positive == 1) & (negative == 3))
+    anti = np.sum((positive == 3) & (negative == 1))
+    return {(+1, -3): int(lorentz), (-1, +3): int(anti), 'other': int(len(eigenvalues) - lorentz - anti)}
+
+
+if __name__ == "__main__":
+    # Interactive Inputs
+    print("=== Lorentz Signature Detection Configuration ===")
+    try:
+        N_samples = int(input("Enter number of samples N_samples [default 1000]: ") or 1000)
+        tau = float(input("Enter meta-time scale tau (s) [default 5.391e-44]: ") or 5.391e-44)
+        if N_samples <= 0 or tau <= 0:
+            raise ValueError("N_samples and tau must be positive.")
+        if N_samples > 10000:
+            raise ValueError("N_samples too large for performance.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        N_samples = 1000
+        tau = 5.391e-44
+
+    counts = signature_counts(random_hessian_eigenvalues(N_samples, 1/np.sqrt(tau)))
+
+    total = sum(counts.values())
+    print("=== Lorentz Signature Statistics ===")
+    for sig, count in counts.items():
+        print(f"Signature {sig}: {count} ({count/total*100:.2f}%)")
+
+    from signature_tables import class_probability, signature_probabilities
+    table = signature_probabilities(4)
+    lorentz, anti = class_probability(table, 1), class_probability(table, 3)
+    other = 1 - lorentz[0] - anti[0]
+    print(f"=== Scale-Free Signature Probabilities ({table['samples']} table samples, 95% CI) ===")
+    for sig, (p, low, high) in (((+1, -3), lorentz), ((-1, +3), anti)):
+        print(f"Signature {sig}: {p*100:.3f}% [{low*100:.3f}%, {high*100:.3f}%]")
+    print(f"Signature other: {other*100:.3f}%")
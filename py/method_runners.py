@@ -0,0 +1,303 @@
+# ========================================================
+# File: method_runners.py
+# Purpose: Headless entry points of the methods: keyword parameters in, summary numbers out
+# Method:
+#   - One runner per method script, built from its importable functions; parameter
+#     names and defaults follow the script's interactive prompts
+#   - Invalid parameters raise ValueError instead of silently falling back to the
+#     defaults, so automated runs never report results for a configuration nobody asked for
+#   - Heavy modules are imported inside the runners; a runner returns a flat dict of
+#     scalars (the numbers the script prints)
+#   - RUNNERS maps method name -> runner; run_method() validates the parameter names
+#     against the runner signature
+# ========================================================
+
+import inspect
+import math
+
+import numpy as np
+
+
+def _check(condition, message):
+    if not condition:
+        raise ValueError(message)
+
+
+def _projection(module, func_name, official_name):
+    # Runner for a constant projection formula: value and relative deviation (%)
+    def runner(**params):
+        mod = __import__(module)
+        func, official = getattr(mod, func_name), getattr(mod, official_name)
+        value = func(**{k: float(v) for k, v in params.items()})
+        return {"value": value, "rel_dev": (value - official) / official * 100}
+    return runner
+
+
+def _with_defaults(runner, **defaults):
+    # Give a generic runner an explicit signature with the script defaults
+    def wrapped(**params):
+        unknown = set(params) - set(defaults)
+        _check(not unknown, f"Unknown parameters {sorted(unknown)}.")
+        values = dict(defaults, **params)
+        _check(all(v > 0 for v in values.values()), "Inputs must be positive.")
+        return runner(**values)
+    wrapped.__signature__ = inspect.Signature(
+        [inspect.Parameter(k, inspect.Parameter.KEYWORD_ONLY, default=v) for k, v in defaults.items()])
+    return wrapped
+
+
+def run_entropy_vector_field(S_mean=2.74309, S_sigma=0.05894, N=10000, seed=42, sampler="pseudo"):
+    from entropy_vector_field_visualization import entropy_vector_field
+    from qmc_sampling import check_sampler
+    _check(S_sigma > 0 and N > 0, "S_sigma and N must be positive.")
+    A_mu = entropy_vector_field(S_mean, S_sigma, int(N), seed, check_sampler(sampler))
+    A_mean, A_max = A_mu.mean(axis=0), np.abs(A_mu).max(axis=0)
+    out = {f"A_mean_{i}": A_mean[i] for i in range(4)}
+    out.update({f"A_max_{i}": A_max[i] for i in range(4)})
+    out["A_norm_mean"] = np.linalg.norm(A_mu, axis=1).mean()
+    return out
+
+
+def run_entropic_ray_tracing(N=1000000, alpha=0.01, dimension=2, steps=0, processes=1, seed=42, field_path=""):
+    from entropic_ray_tracing import GaussianProfile, GridField, lensing_map
+    _check(N > 0 and steps >= 0 and processes > 0, "N and processes must be positive.")
+    _check(field_path or dimension in (2, 3), "dimension must be 2 or 3.")
+    field = GridField.load(field_path) if field_path else GaussianProfile(int(dimension))
+    result = lensing_map(field, int(N), alpha, int(steps) or None, int(processes), seed)
+    return {key: result[key] for key in ("theta_r_mean", "theta_r_std", "theta_mean", "theta_abs_max", "escaped")}
+
+
+def run_hessian_scale_analysis(Nx=50, Ny=50, Nz=50, Ntau=600, dx=0.1, dtau=0.01, D=0.02,
+                               threshold=0.04, seed=None, every=10, min_std=None):
+    from hessian_scale_analysis import in_situ_diagnostics
+    Nx, Ny, Nz, Ntau, every = int(Nx), int(Ny), int(Nz), int(Ntau), int(every)
+    _check(min(Nx, Ny, Nz) >= 3 and Ntau >= 3 and dx > 0 and dtau > 0 and D >= 0 and every > 0,
+           "Grid sizes (>= 3), steps (>= 3), interval, resolutions and diffusion must be positive.")
+    moment_steps, moments, _, maxima, H3d, _, H4d, _, _, _ = in_situ_diagnostics(
+        Nx, Ny, Nz, Ntau, dx, dtau, D, threshold, seed, every, min_std)
+    eig3 = np.linalg.eigvalsh(H3d[-1])
+    eig4 = np.linalg.eigvalsh(H4d[-1]) if len(H4d) else np.full(4, np.nan)
+    out = {"steps": int(moment_steps[-1]), "S_mean_final": moments[-1, 0], "S_std_final": moments[-1, 1],
+           "S_max_final": moments[-1, 3], "max_x": int(maxima[-1, 0]), "max_y": int(maxima[-1, 1]),
+           "max_z": int(maxima[-1, 2])}
+    out.update({f"eig3d_{i}": v for i, v in enumerate(eig3)})
+    out.update({f"eig4d_{i}": v for i, v in enumerate(eig4)})
+    return out
+
+
+def run_lagrangian_density(S_mean=2.74309, S_sigma=0.05894, N=1000, repeats=500, kappa=6.5244e34, seed=42,
+                           sampler="pseudo"):
+    from lagrangian_density_simulation import lagrangian_density
+    from qmc_sampling import check_sampler
+    _check(S_sigma > 0 and N > 0 and repeats > 0 and kappa > 0,
+           "S_sigma, N, repeats, and kappa must be positive.")
+    L = lagrangian_density(S_mean, S_sigma, int(N), int(repeats), kappa, seed, check_sampler(sampler))
+    return {"L_mean": L.mean(), "L_std": L.std()}
+
+
+def run_lattice_yang_mills(L=8, beta=4 / 0.65**2, algorithm="heatbath", therm=20, sweeps=50, processes=1, seed=42):
+    from lattice_yang_mills import plaquette_energy_density, run_lattice
+    _check(L >= 2 and L % 2 == 0 and beta > 0 and therm >= 0 and sweeps >= 2 and 1 <= processes <= L,
+           "L must be even, beta positive, sweeps >= 2, and 1 <= processes <= L.")
+    _check(algorithm in ("heatbath", "metropolis"), f"Unknown algorithm {algorithm}.")
+    _, history, acceptance, rate = run_lattice(int(L), beta, algorithm, int(therm), int(sweeps), int(processes), seed)
+    P = history.mean(axis=1)
+    electric, magnetic, rho = plaquette_energy_density(history.mean(axis=0), beta)
+    return {"plaquette": P.mean(), "plaquette_err": P.std(ddof=1) / np.sqrt(len(P)),
+            "weak_coupling": 1 - 3 / (4 * beta), "acceptance": acceptance, "rho_electric": electric,
+            "rho_magnetic": magnetic, "rho": rho, "link_updates_per_s": rate}
+
+
+def run_lie_branching(group="E8", labels=None, steps=1):
+    # labels: Dynkin labels as a sequence or comma-separated string (default: adjoint)
+    from lie_group_branching_e8_su321 import ADJOINT, CHAIN, branch_chain, chain_embedding, lie_algebra
+    _check(group in CHAIN, f"Unknown group {group}.")
+    algebra = lie_algebra(group)
+    if labels is None or labels == "":
+        hw = ADJOINT[group]
+    else:
+        hw = tuple(int(x) for x in (labels.split(",") if isinstance(labels, str) else labels))
+    steps = int(steps)
+    _check(len(hw) == algebra.rank and min(hw) >= 0 and 1 <= steps <= len(CHAIN) - CHAIN.index(group),
+           "Dynkin labels must be non-negative, one per node, and steps within the chain.")
+    embedding = chain_embedding(group, steps)
+    result = branch_chain(hw, group, steps)
+    total = sum(n * math.prod(f.dim(p) for f, p in zip(embedding.factors, parts) if f is not None)
+                for parts, n in result.items())
+    return {"dim": algebra.dim(hw), "irreps": len(result), "multiplicity": sum(result.values()),
+            "dim_check": total}
+
+
+def _signature_fractions(eigenvalues):
+    positive = np.sum(eigenvalues > 0, axis=-1)
+    negative = np.sum(eigenvalues < 0, axis=-1)
+    return {"lorentz_fraction": np.mean((positive == 1) & (negative == 3)),
+            "anti_lorentz_fraction": np.mean((positive == 3) & (negative == 1))}
+
+
+def _table_probability(name, positive):
+    # Scale-free class probability of the 4×4 Gaussian ensemble with its 95% interval
+    from signature_tables import class_probability, signature_probabilities
+    p, low, high = class_probability(signature_probabilities(4), positive)
+    return {f"{name}_probability": p, f"{name}_low": low, f"{name}_high": high}
+
+
+def run_lorentz_signature(N_samples=1000, tau=5.391e-44, seed=42):
+    from lorentz_signature_detection import random_hessian_eigenvalues
+    _check(N_samples > 0 and tau > 0, "N_samples and tau must be positive.")
+    out = _signature_fractions(random_hessian_eigenvalues(int(N_samples), 1 / np.sqrt(tau), seed=seed))
+    out.update(_table_probability("lorentz", 1))
+    out.update(_table_probability("anti_lorentz", 3))
+    return out
+
+
+def run_montecarlo_lensing(N=1000000, plot_range=1.0, seed=42, sampler="pseudo"):
+    from montecarlo_structural_simulation import entropic_lensing
+    from qmc_sampling import check_sampler
+    _check(N > 0 and plot_range > 0, "N and plot_range must be positive.")
+    theta = entropic_lensing(int(N), plot_range, seed, check_sampler(sampler))[4]
+    return {"theta_mean": theta.mean(), "theta_std": theta.std()}
+
+
+def run_rg_stability(alpha1_0=59.0, alpha2_0=29.6, alpha3_0=8.5, b1=6.6, b2=1.0, b3=-3.0):
+    from rg_stability_landscape_mapping import M_Z, unification_point
+    _check(min(alpha1_0, alpha2_0, alpha3_0) > 0, "Initial couplings must be positive.")
+    mu = np.logspace(2, 17, 500)
+    min_idx, alpha_unif, mismatch = unification_point(
+        np.array([[alpha1_0, alpha2_0, alpha3_0]]), np.array([[b1, b2, b3]]), np.log(mu / M_Z))
+    return {"mu_unif": mu[min_idx[0]], "alpha_inv_unif": alpha_unif[0], "mismatch": mismatch[0]}
+
+
+def run_rgflow(loops=1, alpha1_0=59.0, alpha2_0=29.6, alpha3_0=8.5, b1=6.6, b2=1.0, b3=-3.0):
+    from rgflow_ode_solver import M_Z, alpha_inv, solve_two_loop, two_loop_alpha_inv, unification_scale
+    _check(loops in (1, 2) and min(alpha1_0, alpha2_0, alpha3_0) > 0,
+           "loops must be 1 or 2 and initial couplings positive.")
+    mu = np.logspace(2, 17, 500)
+    if loops == 2:
+        sol, N = solve_two_loop([alpha1_0, alpha2_0, alpha3_0], [b1, b2, b3], mu_span=(M_Z, mu[-1]))
+        a = two_loop_alpha_inv(sol, N, mu)[0]
+    else:
+        log_mu = np.log(mu / M_Z)
+        a = np.array([alpha_inv(1 / a0, b, log_mu) for a0, b in ((alpha1_0, b1), (alpha2_0, b2), (alpha3_0, b3))])
+    mu_unif, alpha_unif = unification_scale(mu, a)
+    return {"mu_unif": mu_unif, "alpha_inv_unif": alpha_unif}
+
+
+def run_susy(alpha_S=0.1, omega=0.5, theta=0.0):
+    from susy_parameter_variation import susy_mass_moments
+    _check(alpha_S > 0 and omega > 0, "alpha_S and omega must be positive.")
+    mean, std = susy_mass_moments(alpha_S, omega, theta)
+    return {"m_mean": float(mean), "m_std": float(std)}
+
+
+def run_top_yukawa(y_t0=1.0, alpha1_0=0.0169, alpha2_0=0.0338, alpha3_0=0.1184):
+    from top_yukawa_flow import solve_top_yukawa
+    _check(min(y_t0, alpha1_0, alpha2_0, alpha3_0) > 0, "Yukawa and gauge couplings must be positive.")
+    result = solve_top_yukawa(y_t0, (alpha1_0, alpha2_0, alpha3_0))
+    y_mt, y_gut = result.y_t([173.0, 2.04e16])[0]
+    return {"y_t_mt": y_mt, "y_t_gut": y_gut, "mu_landau": result.mu_landau[0]}
+
+
+def run_topological_invariant(N_samples=1000, ev=0.1, seed=42):
+    from lorentz_signature_detection import random_hessian_eigenvalues
+    from topological_invariant_testing import invariant_count
+    _check(N_samples > 0 and ev > 0, "N_samples and ev must be positive.")
+    eigenvalues = random_hessian_eigenvalues(int(N_samples), ev, seed=seed)
+    out = {"invariant_fraction": invariant_count(eigenvalues) / int(N_samples)}
+    out.update(_table_probability("invariant", 1))
+    return out
+
+
+def run_yang_mills(S_mean=2.74309, S_sigma=0.05894, N=1000, seed=42):
+    from yang_mills_field_dynamics import yang_mills_energy_density
+    _check(S_sigma > 0 and N > 0, "S_sigma and N must be positive.")
+    rho = yang_mills_energy_density(S_mean, S_sigma, int(N), seed).mean(axis=0)
+    return {f"rho_mean_{a}": rho[a] for a in range(3)}
+
+
+def run_yukawa_eigenflow(Y0_1=0.01, Y0_2=0.04, Y0_3=0.99, A=0.5, B=4.5 / (16 * np.pi**2), eps=0.0, delta=0.0):
+    from yukawa_matrix_eigenflow import M_Z, mixing_angles, yukawa_eigenflow, yukawa_singular_flow
+    _check(min(Y0_1, Y0_2, Y0_3) > 0 and A >= 0 and B >= 0, "Yukawa elements, A, and B must be positive.")
+    Y0 = np.diag([Y0_1, Y0_2, Y0_3]).astype(complex if delta else float)
+    if eps:
+        Y0 = Y0 + eps * (np.ones((3, 3)) - np.eye(3))
+        Y0[0, 2] *= np.exp(1j * delta)
+    t_eval = np.linspace(np.log(173 / M_Z), np.log(2.04e16 / M_Z), 100)
+    out = {}
+    if eps:
+        eigenvalues, U_L, _ = yukawa_singular_flow(Y0, A, B, t_eval)
+        out.update(zip(("theta12", "theta13", "theta23"), np.degrees(mixing_angles(U_L[-1]))))
+    else:
+        eigenvalues = yukawa_eigenflow(Y0, A, B, t_eval)
+    out.update({f"eig_gut_{i}": eigenvalues[-1, i] for i in range(3)})
+    return out
+
+
+def run_curvature():
+    # Symbolic Einstein tensor of the default entropy; reports whether it vanishes
+    import sympy as sp
+    from discrete_curvature_projection import default_entropy, einstein_tensor
+    G = einstein_tensor(*default_entropy())
+    return {"nonzero_components": sum(1 for x in G if sp.simplify(x) != 0)}
+
+
+RUNNERS = {
+    "atomic_mass_unit_projection": _with_defaults(
+        _projection("atomic_mass_unit_projection", "atomic_mass_unit", "M_U_OFFICIAL"),
+        m_p=1.67262192369e-27, m_n=1.67492749804e-27, m_e=9.1093837015e-31),
+    "avogadro_constant_projection": _with_defaults(
+        _projection("avogadro_constant_projection", "avogadro_constant", "N_A_OFFICIAL"),
+        m_u=1.66053906660e-27),
+    "compton_wavelength_projection": _with_defaults(
+        _projection("compton_wavelength_projection", "compton_wavelength", "LAMBDA_C_OFFICIAL"),
+        hbar=1.054571817e-34, m_e=9.1093837015e-31, c=2.99792458e8),
+    "cosmo_constant_from_hubble_flow": _with_defaults(
+        _projection("cosmo_constant_from_hubble_flow", "cosmological_constant", "LAMBDA_OFFICIAL"),
+        H0_proj=2.26908425e-18, c=2.99792458e8),
+    "discrete_curvature_projection": run_curvature,
+    "entropy_vector_field_visualization": run_entropy_vector_field,
+    "entropic_ray_tracing": run_entropic_ray_tracing,
+    "hessian_scale_analysis": run_hessian_scale_analysis,
+    "hubble_constant_from_entropy": _with_defaults(
+        _projection("hubble_constant_from_entropy", "hubble_constant", "H0_OFFICIAL"),
+        beta_H=3.645e83, tau=4.35e17, t_universe=4.35e17),
+    "lagrangian_density_simulation": run_lagrangian_density,
+    "lattice_yang_mills": run_lattice_yang_mills,
+    "lie_group_branching_e8_su321": run_lie_branching,
+    "lorentz_signature_detection": run_lorentz_signature,
+    "mass_and_g_projection": _with_defaults(
+        _projection("mass_and_g_projection", "gravitational_constant", "G_OFFICIAL"),
+        hbar=1.054571817e-34, c=2.99792458e8, L_eff=1.616255e-35),
+    "montecarlo_structural_simulation": run_montecarlo_lensing,
+    "planck_constant_reconstruction": _with_defaults(
+        _projection("planck_constant_reconstruction", "reconstruct_hbar", "HBAR_OFFICIAL"),
+        a0_proj=5.29177210903e-11, m_e_proj=9.1093837015e-31, c_proj=2.99792458e8, alpha_proj=7.2973525693e-3),
+    "rg_stability_landscape_mapping": run_rg_stability,
+    "rgflow_ode_solver": run_rgflow,
+    "susy_parameter_variation": run_susy,
+    "thomson_cross_section_projection": _with_defaults(
+        _projection("thomson_cross_section_projection", "thomson_cross_section", "SIGMA_T_OFFICIAL"),
+        alpha_proj=7.2973525693e-3, hbar_proj=1.054571817e-34, m_e_proj=9.1093837015e-31, c=2.99792458e8),
+    "top_yukawa_flow": run_top_yukawa,
+    "topological_invariant_testing": run_topological_invariant,
+    "yang_mills_field_dynamics": run_yang_mills,
+    "yukawa_matrix_eigenflow": run_yukawa_eigenflow,
+}
+
+
+def method_parameters(method):
+    # Parameter names and defaults of a method runner
+    return {name: p.default for name, p in inspect.signature(RUNNERS[method]).parameters.items()}
+
+
+def run_method(method, params=None):
+    # Run one method headlessly; unknown methods or parameters raise ValueError
+    if method not in RUNNERS:
+        raise ValueError(f"Unknown method {method}.")
+    params = dict(params or {})
+    unknown = set(params) - set(method_parameters(method))
+    if unknown:
+        raise ValueError(f"Unknown parameters {sorted(unknown)} for {method}.")
+    result = RUNNERS[method](**params)
+    return {k: (np.asarray(v).item() if isinstance(v, (np.generic, np.ndarray)) else v)
+            for k, v in result.items()}
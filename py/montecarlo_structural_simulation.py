@@ -7,53 +7,76 @@
 #   - Compute numerical gradient of entropy field at sample points
 #   - Normalize gradient vectors as approximate light ray directions
 #   - Calculate lensing angles and statistics
+#   - Samples are memoized in the result cache (result_cache.py), keyed by N, plot range,
+#     seed and sampler
 # Input:
 #   - number of Monte Carlo samples and the plot range for the x,y axes
+#   - sampler: pseudo (default), or scrambled sobol/halton points (qmc_sampling.py)
 # Output:
 #   - Print mean and standard deviation of deviation angles in degrees
 #   - Save quiver plot of entropic lensing rays
 # ========================================================
 
 import numpy as np
-import matplotlib.pyplot as plt
-
-# Interaktive Eingaben
-print("=== Monte Carlo Entropic Lensing Configuration ===")
-N = int(input("Enter number of samples [default 1000000]: ") or 1000000)
-plot_range = float(input("Enter plot range for x,y axes [default 1.0]: ") or 1.0)
-
-np.random.seed(42)
-x = np.random.uniform(-plot_range, plot_range, N)
-y = np.random.uniform(-plot_range, plot_range, N)
-
-r = np.sqrt(x**2 + y**2)
-S = np.exp(-r**2)
-
-dS_dx = -2 * x * np.exp(-r**2)
-dS_dy = -2 * y * np.exp(-r**2)
-
-norm = np.sqrt(dS_dx**2 + dS_dy**2) + 1e-10
-dx_ray = dS_dx / norm
-dy_ray = dS_dy / norm
-
-theta = np.arctan2(dy_ray, dx_ray)
-theta_deg = np.degrees(theta)
-
-theta_mean = np.mean(theta_deg)
-theta_std = np.std(theta_deg)
-
-print("=== Monte Carlo Entropic Lensing Prediction ===")
-print(f"Samples: {N}")
-print(f"Mean deviation angle: {theta_mean:.4f}°")
-print(f"Standard deviation:   {theta_std:.4f}°")
-
-plt.figure(figsize=(6, 6))
-plt.quiver(x, y, dx_ray, dy_ray, color='blue', alpha=0.5, scale=20)
-plt.title("Monte Carlo Entropic Lensing Rays")
-plt.xlabel("x")
-plt.ylabel("y")
-plt.axis('equal')
-plt.grid(True)
-plt.tight_layout()
-plt.savefig("img/entropic_lensing_rays.png")
-plt.show()
\ No newline at end of file
+
+
+def entropic_lensing(N, plot_range=1.0, seed=42, sampler="pseudo"):
+    # Sample points, unit ray directions along ∇S and deviation angles (degrees);
+    # sampler: pseudo, or sobol/halton low-discrepancy points (qmc_sampling.py)
+    if sampler == "pseudo":
+        rng = np.random.RandomState(seed)
+        x = rng.uniform(-plot_range, plot_range, N)
+        y = rng.uniform(-plot_range, plot_range, N)
+    else:
+        from qmc_sampling import uniform
+        x, y = (plot_range * (2 * uniform(N, 2, sampler, seed) - 1)).T
+
+    r = np.sqrt(x**2 + y**2)
+    dS_dx = -2 * x * np.exp(-r**2)
+    dS_dy = -2 * y * np.exp(-r**2)
+
+    norm = np.sqrt(dS_dx**2 + dS_dy**2) + 1e-10
+    dx_ray = dS_dx / norm
+    dy_ray = dS_dy / norm
+    theta_deg = np.degrees(np.arctan2(dy_ray, dx_ray))
+    return x, y, dx_ray, dy_ray, theta_deg
+
+
+def plot_lensing_rays(plt, x, y, dx_ray, dy_ray):
+    plt.figure(figsize=(6, 6))
+    plt.quiver(x, y, dx_ray, dy_ray, color='blue', alpha=0.5, scale=20)
+    plt.title("Monte Carlo Entropic Lensing Rays")
+    plt.xlabel("x")
+    plt.ylabel("y")
+    plt.axis('equal')
+    plt.grid(True)
+    plt.tight_layout()
+
+
+if __name__ == "__main__":
+    from plot_backend import submit_figure, wait_for_figures
+    from result_cache import cached
+
+    # Interaktive Eingaben
+    print("=== Monte Carlo Entropic Lensing Configuration ===")
+    N = int(input("Enter number of samples [default 1000000]: ") or 1000000)
+    plot_range = float(input("Enter plot range for x,y axes [default 1.0]: ") or 1.0)
+    sampler = input("Select sampler pseudo/sobol/halton [default pseudo]: ").strip().lower() or "pseudo"
+    if sampler not in ("pseudo", "sobol", "halton"):
+        print(f"Invalid input: unknown sampler {sampler}. Using default values.")
+        sampler = "pseudo"
+
+    (x, y, dx_ray, dy_ray, theta_deg), hit = cached(
+        "montecarlo_structural_simulation", entropic_lensing, {"N": N, "plot_range": plot_range, "seed": 42, "sampler": sampler},
+        names=("x", "y", "dx_ray", "dy_ray", "theta_deg"))
+    theta_mean = np.mean(theta_deg)
+    theta_std = np.std(theta_deg)
+
+    print("=== Monte Carlo Entropic Lensing Prediction ===")
+    print(f"Samples: {N} ({sampler})" + (" (loaded from result cache)" if hit else ""))
+    print(f"Mean deviation angle: {theta_mean:.4f}°")
+    print(f"Standard deviation:   {theta_std:.4f}°")
+
+    submit_figure(plot_lensing_rays, "img/entropic_lensing_rays.png",
+                  x=x, y=y, dx_ray=dx_ray, dy_ray=dy_ray)
+    wait_for_figures()
@@ -0,0 +1,72 @@
+# ========================================================
+# File: plot_backend.py
+# Purpose: Shared lazy access to matplotlib and off-main-path figure rendering
+# Method:
+#   - matplotlib is imported only when a figure is actually drawn, so the pure
+#     computation functions import in milliseconds
+#   - The headless Agg backend is selected unless MPLBACKEND is set explicitly
+#   - Scripts hand a figure spec (module-level draw function, output path, the
+#     plotted arrays) to submit_figure(); the mode is chosen by PLOT_MODE:
+#       background  rendered by a worker process while the computation continues (default)
+#       inline      rendered immediately in the calling process
+#       data        no rendering; the plotted arrays go to a compressed .npz next to
+#                   the figure path
+#   - wait_for_figures() blocks until all background figures are written and
+#     re-raises any rendering error
+# ========================================================
+
+import atexit
+import os
+
+PLOT_MODE = os.environ.get("PLOT_MODE", "background")
+PLOT_WORKERS = int(os.environ.get("PLOT_WORKERS", 1))
+
+_executor = None
+_pending = []
+
+
+def get_pyplot():
+    import matplotlib
+    if "MPLBACKEND" not in os.environ:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def render_figure(draw, path, data, savefig_kwargs=None):
+    # draw(plt, **data) builds the figure on the current pyplot state
+    plt = get_pyplot()
+    draw(plt, **data)
+    plt.savefig(path, **(savefig_kwargs or {}))
+    plt.close('all')
+    return path
+
+
+def submit_figure(draw, path, savefig_kwargs=None, **data):
+    # Returns the written path (inline/data mode) or a future (background mode)
+    if PLOT_MODE == "data":
+        import numpy as np
+        out = os.path.splitext(path)[0] + ".npz"
+        np.savez_compressed(out, **data)
+        return out
+    if PLOT_MODE == "inline":
+        return render_figure(draw, path, data, savefig_kwargs)
+    global _executor
+    if _executor is None:
+        from concurrent.futures import ProcessPoolExecutor
+        _executor = ProcessPoolExecutor(max_workers=PLOT_WORKERS)
+        atexit.register(wait_for_figures)
+    future = _executor.submit(render_figure, draw, path, data, savefig_kwargs)
+    _pending.append(future)
+    return future
+
+
+def wait_for_figures():
+    global _executor
+    try:
+        while _pending:
+            _pending.pop(0).result()
+    finally:
+        if _executor is not None and not _pending:
+            _executor.shutdown()
+            _executor = None
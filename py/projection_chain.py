@@ -0,0 +1,215 @@
+# ========================================================
+# File: projection_chain.py
+# Purpose: Propagate CODATA input uncertainties through the chain of constant projections
+# Method:
+#   - Dependency graph of the projection scripts:
+#       m_p, m_n, m_e → m_u → N_A
+#       α, a₀, m_e, c → ħ → λ_C, σ_T, G
+#       β_H, τ, t_universe → H0 → Λ
+#   - Joint input samples drawn from CODATA standard uncertainties (exact constants
+#     and model parameters stay scalar and broadcast)
+#   - Each node is evaluated once per pass on NumPy arrays (memoized, so shared
+#     upstream nodes such as ħ or m_u are computed a single time)
+#   - Samples processed in chunks; mean/std merged across chunks, fixed-range histograms
+#   - Any node given in the input values overrides its formula (e.g. CODATA ħ)
+#   - Linearized mode: gradients of each formula are derived symbolically (SymPy) once,
+#     lambdified and cached; Jacobians are chained through the graph and the input
+#     covariance is propagated as Σ_out = J Σ_in Jᵀ, with elasticities ∂ln f/∂ln x_i
+#     and per-input variance budgets
+# Inputs:
+# - mode: montecarlo or linear (default: montecarlo)
+# - N: Number of joint samples (default: 10000000)
+# - chunk_size: Samples per vectorized pass (default: 1000000)
+# - seed: Random seed (default: 42)
+# Output:
+#   - Print mean, standard deviation, official value and relative deviation per constant
+#   - Linear mode: dominant elasticities and correlation matrix of the derived constants
+# ========================================================
+
+import time
+from functools import lru_cache
+import numpy as np
+
+from atomic_mass_unit_projection import atomic_mass_unit, M_U_OFFICIAL
+from avogadro_constant_projection import avogadro_constant, N_A_OFFICIAL
+from compton_wavelength_projection import compton_wavelength, LAMBDA_C_OFFICIAL
+from cosmo_constant_from_hubble_flow import cosmological_constant, LAMBDA_OFFICIAL
+from hubble_constant_from_entropy import hubble_constant, H0_OFFICIAL
+from mass_and_g_projection import gravitational_constant, G_OFFICIAL
+from planck_constant_reconstruction import reconstruct_hbar, HBAR_OFFICIAL
+from thomson_cross_section_projection import thomson_cross_section, SIGMA_T_OFFICIAL
+
+# name: (value, standard uncertainty); CODATA 2018, zero for exact constants and model parameters
+INPUTS = {
+    "m_p": (1.67262192369e-27, 5.1e-37),
+    "m_n": (1.67492749804e-27, 9.5e-37),
+    "m_e": (9.1093837015e-31, 2.8e-40),
+    "c": (2.99792458e8, 0.0),
+    "alpha": (7.2973525693e-3, 1.1e-12),
+    "a0": (5.29177210903e-11, 8.0e-21),
+    "L_eff": (1.616255e-35, 1.8e-40),
+    "beta_H": (3.645e83, 0.0),
+    "tau": (4.35e17, 0.0),
+    "t_universe": (4.35e17, 6.3e14),  # 13.787 ± 0.020 Gyr
+}
+
+# name: (formula, input names, official value, unit)
+NODES = {
+    "m_u": (atomic_mass_unit, ("m_p", "m_n", "m_e"), M_U_OFFICIAL, "kg"),
+    "N_A": (avogadro_constant, ("m_u",), N_A_OFFICIAL, "1/mol"),
+    "hbar": (reconstruct_hbar, ("a0", "m_e", "c", "alpha"), HBAR_OFFICIAL, "J·s"),
+    "lambda_C": (compton_wavelength, ("hbar", "m_e", "c"), LAMBDA_C_OFFICIAL, "m"),
+    "sigma_T": (thomson_cross_section, ("alpha", "hbar", "m_e", "c"), SIGMA_T_OFFICIAL, "m^2"),
+    "G": (gravitational_constant, ("hbar", "c", "L_eff"), G_OFFICIAL, "m^3 kg^-1 s^-2"),
+    "H0": (hubble_constant, ("beta_H", "tau", "t_universe"), H0_OFFICIAL, "1/s"),
+    "Lambda": (cosmological_constant, ("H0", "c"), LAMBDA_OFFICIAL, "m^-2"),
+}
+
+
+def sample_inputs(n, rng, inputs=INPUTS):
+    return {name: value if sigma == 0 else rng.normal(value, sigma, n)
+            for name, (value, sigma) in inputs.items()}
+
+
+def evaluate_chain(values, targets=None):
+    # values: dict of input (or overriding node) arrays; returns dict with all evaluated nodes
+    memo = dict(values)
+
+    def resolve(name):
+        if name not in memo:
+            if name not in NODES:
+                raise KeyError(f"Missing input '{name}' for projection chain.")
+            func, deps, _, _ = NODES[name]
+            memo[name] = func(*(resolve(d) for d in deps))
+        return memo[name]
+
+    for name in targets or NODES:
+        resolve(name)
+    return memo
+
+
+def propagate_uncertainties(n_samples, chunk_size=1_000_000, seed=42, inputs=INPUTS,
+                            targets=None, bins=100):
+    rng = np.random.default_rng(seed)
+    targets = list(targets or NODES)
+    stats = {}
+    for start in range(0, n_samples, chunk_size):
+        n = min(chunk_size, n_samples - start)
+        values = evaluate_chain(sample_inputs(n, rng, inputs), targets)
+        for name in targets:
+            x = np.broadcast_to(values[name], (n,))
+            mean, m2 = x.mean(), np.sum((x - x.mean())**2)
+            if name not in stats:
+                # Histogram range fixed from the first chunk (±6σ)
+                width = 6 * np.sqrt(m2 / n) or 1e-12 * abs(mean) or 1.0
+                edges = np.linspace(mean - width, mean + width, bins + 1)
+                stats[name] = {"n": 0, "mean": 0.0, "m2": 0.0, "edges": edges,
+                               "counts": np.zeros(bins, dtype=np.int64)}
+            s = stats[name]
+            # Parallel (Chan) update of mean and sum of squared deviations
+            total = s["n"] + n
+            delta = mean - s["mean"]
+            s["m2"] += m2 + delta**2 * s["n"] * n / total
+            s["mean"] += delta * n / total
+            s["n"] = total
+            s["counts"] += np.histogram(x, bins=s["edges"])[0]
+
+    for name, s in stats.items():
+        official = NODES[name][2] if name in NODES else inputs[name][0]
+        s["std"] = np.sqrt(s["m2"] / s["n"])
+        s["official"] = official
+        s["rel_dev"] = (s["mean"] - official) / official * 100
+        s["z"] = (s["mean"] - official) / s["std"] if s["std"] > 0 else np.nan
+    return stats
+
+
+@lru_cache(maxsize=None)
+def node_gradient(name):
+    # Symbolic gradient of a node formula w.r.t. its direct inputs, compiled once
+    import sympy as sp
+    func, deps, _, _ = NODES[name]
+    symbols = sp.symbols(deps)
+    expr = func(*symbols)
+    return sp.lambdify(symbols, [sp.diff(expr, x) for x in symbols], modules="numpy")
+
+
+def linearized_propagation(values=None, cov=None, inputs=INPUTS, targets=None):
+    # First-order propagation of the input covariance through the chain.
+    # values: nominal inputs (default: central values); cov: input covariance
+    # (default: diagonal from the standard uncertainties), ordered as inputs
+    names = list(inputs)
+    if values is None:
+        values = {n: v for n, (v, _) in inputs.items()}
+    if cov is None:
+        cov = np.diag([sigma**2 for _, sigma in inputs.values()])
+    targets = list(targets or NODES)
+    nominal = evaluate_chain(values, targets)
+
+    jac = {n: np.eye(len(names))[i] for i, n in enumerate(names)}
+
+    def chain_jacobian(name):
+        if name not in jac:
+            _, deps, _, _ = NODES[name]
+            grad = node_gradient(name)(*(nominal[d] for d in deps))
+            jac[name] = sum(np.asarray(g, dtype=float) * chain_jacobian(d) for g, d in zip(grad, deps))
+        return jac[name]
+
+    J = np.array([chain_jacobian(name) for name in targets])
+    x = np.array([values[n] for n in names], dtype=float)
+    f = np.array([nominal[name] for name in targets], dtype=float)
+    cov_out = J @ cov @ J.T
+    std = np.sqrt(np.diag(cov_out))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = cov_out / np.outer(std, std)
+        budget = (J**2 * np.diag(cov)) / std[:, None]**2
+    official = np.array([NODES[name][2] for name in targets])
+    return {
+        "targets": targets, "inputs": names, "value": f, "std": std,
+        "rel_dev": (f - official) / official * 100,
+        "jacobian": J, "elasticity": J * x / f[:, None],
+        "budget": budget, "cov": cov_out, "corr": corr,
+    }
+
+
+if __name__ == "__main__":
+    print("=== Projection Chain Uncertainty Propagation Configuration ===")
+    mode = input("Select mode montecarlo/linear [default montecarlo]: ").strip().lower() or "montecarlo"
+
+    if mode == "linear":
+        start = time.perf_counter()
+        result = linearized_propagation()
+        elapsed = time.perf_counter() - start
+        print("=== Linearized Projection Chain Results ===")
+        print(f"Evaluated in {elapsed * 1e3:.2f} ms (including one-time symbolic differentiation)")
+        print(f"{'Constant':<10} {'Value':>16} {'Std':>12} {'Rel. dev. (%)':>14}  Dominant elasticities")
+        for k, name in enumerate(result["targets"]):
+            order = np.argsort(-np.abs(result["elasticity"][k]))[:3]
+            elast = ", ".join(f"{result['inputs'][i]}: {result['elasticity'][k, i]:+.3g}"
+                              for i in order if abs(result["elasticity"][k, i]) > 1e-12)
+            print(f"{name:<10} {result['value'][k]:>16.9e} {result['std'][k]:>12.3e} "
+                  f"{result['rel_dev'][k]:>14.5f}  {elast}")
+        print("Correlation matrix:")
+        print("          " + " ".join(f"{name:>9}" for name in result["targets"]))
+        for name, row in zip(result["targets"], result["corr"]):
+            print(f"{name:<10}" + " ".join(f"{v:>9.4f}" for v in row))
+    else:
+        try:
+            N = int(input("Enter number of joint samples N [default 10000000]: ") or 10000000)
+            chunk_size = int(input("Enter chunk size [default 1000000]: ") or 1000000)
+            seed = int(input("Enter random seed [default 42]: ") or 42)
+            if N <= 0 or chunk_size <= 0:
+                raise ValueError("N and chunk size must be positive.")
+        except ValueError as e:
+            print(f"Invalid input: {e}. Using default values.")
+            N, chunk_size, seed = 10000000, 1000000, 42
+
+        start = time.perf_counter()
+        stats = propagate_uncertainties(N, chunk_size=chunk_size, seed=seed)
+        elapsed = time.perf_counter() - start
+
+        print("=== Projection Chain Results ===")
+        print(f"Samples: {N} in {elapsed:.2f} s ({N / elapsed:.3e} samples/s)")
+        print(f"{'Constant':<10} {'Mean':>16} {'Std':>12} {'Official':>16} {'Rel. dev. (%)':>14}  Unit")
+        for name, s in stats.items():
+            print(f"{name:<10} {s['mean']:>16.9e} {s['std']:>12.3e} {s['official']:>16.9e} "
+                  f"{s['rel_dev']:>14.5f}  {NODES[name][3]}")
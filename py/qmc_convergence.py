@@ -0,0 +1,155 @@
+# ========================================================
+# File: qmc_convergence.py
+# Purpose: Convergence benchmark of pseudo-random vs. quasi-Monte Carlo sampling
+# Method:
+#   - One estimator per sampling-based script with a known exact value:
+#       montecarlo_structural_simulation   E|θ| = 90° (symmetry of the square)
+#       lagrangian_density_simulation      κ S_mean σ E[χ₄], E[χ₄] = 3√(2π)/4
+#       entropy_vector_field_visualization E|A|² = κ² (S_mean² + 4σ²)
+#       susy_parameter_variation           exact mean of m_susy (susy_mass_moments)
+#   - For each sampler (pseudo, sobol, halton) and N = 2^k: relative RMSE of R
+#     independently seeded / scrambled replicates against the exact value
+#   - Power-law fit RMSE ∝ N^slope (pseudo: slope ≈ -0.5; QMC approaches -1), and the
+#     N needed to reach a target relative precision, with the saving against pseudo
+# Inputs:
+# - methods (default: all), preset quick/full (N = 2^8..2^14 / 2^8..2^20),
+#   replicates R (default: 16), target relative error (default: 1e-4), seed (default: 42)
+# Output:
+#   - Table of RMSE per N and sampler, fitted slopes and samples to target
+#   - JSON report img/qmc/qmc_convergence.json and log-log plot img/qmc/qmc_convergence.png
+# ========================================================
+
+import json
+import os
+import time
+
+import numpy as np
+
+from qmc_sampling import SAMPLERS, replicate_seeds
+
+S_MEAN, S_SIGMA = 2.74309, 0.05894
+
+
+def _lensing():
+    from montecarlo_structural_simulation import entropic_lensing
+    return lambda N, sampler, seed: np.abs(entropic_lensing(N, 1.0, seed, sampler)[4]).mean(), 90.0
+
+
+def _lagrangian():
+    from lagrangian_density_simulation import KAPPA, lagrangian_density
+    exact = KAPPA * S_MEAN * S_SIGMA * 3 * np.sqrt(2 * np.pi) / 4
+    return lambda N, sampler, seed: lagrangian_density(S_MEAN, S_SIGMA, N, 1, KAPPA, seed, sampler)[0], exact
+
+
+def _vector_field():
+    from entropy_vector_field_visualization import entropy_vector_field, kappa
+    exact = kappa**2 * (S_MEAN**2 + 4 * S_SIGMA**2)
+    return lambda N, sampler, seed: np.mean(np.sum(entropy_vector_field(S_MEAN, S_SIGMA, N, seed, sampler)**2,
+                                                   axis=1)), exact
+
+
+def _susy(alpha_S=0.1, omega=0.5, theta=0.3):
+    from susy_parameter_variation import susy_mass_moments, susy_mass_samples
+    exact = float(susy_mass_moments(alpha_S, omega, theta)[0])
+    return lambda N, sampler, seed: sum(m.sum() for m in susy_mass_samples(
+        alpha_S, omega, theta, N, seed=seed, sampler=sampler)) / N, exact
+
+
+ESTIMATORS = {
+    "montecarlo_structural_simulation": _lensing,
+    "lagrangian_density_simulation": _lagrangian,
+    "entropy_vector_field_visualization": _vector_field,
+    "susy_parameter_variation": _susy,
+}
+PRESETS = {"quick": range(8, 15, 2), "full": range(8, 21, 2)}
+
+
+def convergence(method, sizes, replicates=16, seed=42, samplers=SAMPLERS):
+    # Relative RMSE of the replicates per sampler and N -> {sampler: [rmse per size]}
+    estimate, exact = ESTIMATORS[method]()
+    seeds = replicate_seeds(seed, replicates)
+    rmse = {}
+    for sampler in samplers:
+        rmse[sampler] = [float(np.sqrt(np.mean([(estimate(N, sampler, s) / exact - 1)**2 for s in seeds])))
+                         for N in sizes]
+    return rmse
+
+
+def fit_power_law(sizes, rmse):
+    # log RMSE = a + slope log N
+    slope, a = np.polyfit(np.log(sizes), np.log(rmse), 1)
+    return slope, a
+
+
+def samples_to_target(slope, a, target):
+    return float(np.exp((np.log(target) - a) / slope)) if slope < 0 else float("inf")
+
+
+def plot_convergence(plt, sizes, methods, rmse):
+    # rmse: (methods, samplers, sizes)
+    fig, axes = plt.subplots(1, len(methods), figsize=(4.5 * len(methods), 4), squeeze=False)
+    for ax, method, errors in zip(axes[0], methods, rmse):
+        for sampler, err in zip(SAMPLERS, errors):
+            ax.loglog(sizes, err, 'o-', label=sampler)
+        ax.loglog(sizes, errors[0][0] * np.sqrt(sizes[0] / sizes), 'k:', label='N^-1/2')
+        ax.set_title(method.replace('_', ' '), fontsize=9)
+        ax.set_xlabel('Samples N')
+        ax.set_ylabel('Relative RMSE')
+        ax.grid(True, which='both', alpha=0.3)
+        ax.legend()
+    plt.tight_layout()
+
+
+if __name__ == "__main__":
+    from plot_backend import submit_figure, wait_for_figures
+
+    print("=== QMC Convergence Benchmark Configuration ===")
+    try:
+        methods = input("Enter methods, comma-separated [default all]: ").strip()
+        methods = [m.strip() for m in methods.split(",")] if methods else list(ESTIMATORS)
+        unknown = [m for m in methods if m not in ESTIMATORS]
+        if unknown:
+            raise ValueError(f"Unknown methods {unknown}.")
+        preset = input("Enter size preset quick/full [default quick]: ").strip().lower() or "quick"
+        if preset not in PRESETS:
+            raise ValueError("Preset must be quick or full.")
+        replicates = int(input("Enter randomized replicates R [default 16]: ") or 16)
+        target = float(input("Enter target relative error [default 1e-4]: ") or 1e-4)
+        seed = int(input("Enter random seed [default 42]: ") or 42)
+        if replicates < 2 or target <= 0:
+            raise ValueError("R must be at least 2 and the target positive.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        methods, preset, replicates, target, seed = list(ESTIMATORS), "quick", 16, 1e-4, 42
+
+    sizes = np.array([2**k for k in PRESETS[preset]])
+    report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "sizes": sizes.tolist(),
+              "replicates": replicates, "target": target, "seed": seed, "methods": {}}
+    all_rmse = []
+    for method in methods:
+        start = time.perf_counter()
+        rmse = convergence(method, sizes, replicates, seed)
+        all_rmse.append([rmse[s] for s in SAMPLERS])
+        print(f"\n=== {method} ({time.perf_counter() - start:.1f} s) ===")
+        print(f"{'N':>9} " + " ".join(f"{s:>12}" for s in SAMPLERS))
+        for i, N in enumerate(sizes):
+            print(f"{N:>9} " + " ".join(f"{rmse[s][i]:>12.3e}" for s in SAMPLERS))
+        entry = {}
+        for sampler in SAMPLERS:
+            slope, a = fit_power_law(sizes, rmse[sampler])
+            entry[sampler] = {"rmse": rmse[sampler], "slope": slope, "samples_to_target": samples_to_target(slope, a, target)}
+        base = entry["pseudo"]["samples_to_target"]
+        for sampler in SAMPLERS:
+            n_target = entry[sampler]["samples_to_target"]
+            entry[sampler]["saving"] = base / n_target
+            print(f"{sampler:>9}: slope {entry[sampler]['slope']:6.2f}, N for {target:.0e} ≈ {n_target:.3g}"
+                  f" ({base / n_target:.1f}x fewer than pseudo)")
+        report["methods"][method] = entry
+
+    os.makedirs("img/qmc", exist_ok=True)
+    with open("img/qmc/qmc_convergence.json", "w") as f:
+        json.dump(report, f, indent=2)
+    submit_figure(plot_convergence, "img/qmc/qmc_convergence.png",
+                  sizes=sizes, methods=np.array(methods), rmse=np.array(all_rmse))
+    wait_for_figures()
+    print("\nReport saved to img/qmc/qmc_convergence.json, plot to img/qmc/qmc_convergence.png")
@@ -0,0 +1,184 @@
+# ========================================================
+# File: result_cache.py
+# Purpose: Parameter-keyed memoization of expensive simulation results across runs
+# Method:
+#   - Key: SHA-256 of the method name, all parameters (including the seed) and the
+#     source version of the method (hash of its script and of every local module it
+#     imports, transitively), so any code change invalidates the stale entries automatically
+#   - Entry: one directory per key with meta.json and the output arrays; arrays up to
+#     COMPRESS_LIMIT bytes go into a compressed arrays.npz, larger ones are stored as
+#     .npy and memory-mapped on load so big hits also return in milliseconds
+#   - Entries are written to a temporary directory and renamed into place, so
+#     concurrent processes never see partial entries; the first writer wins
+#   - Size-bounded LRU: hits refresh the entry's modification time; after each write
+#     the oldest entries are removed until the cache fits in max_bytes (eviction is
+#     serialized across processes with a lock file where fcntl is available)
+#   - Runs with seed=None draw fresh entropy, are not reproducible and are never cached
+# Environment:
+# - RESULT_CACHE_DIR: cache directory (default: img/result_cache)
+# - RESULT_CACHE_MAX_BYTES: size bound (default: 2 GB); RESULT_CACHE=off disables caching
+# ========================================================
+
+import ast
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: eviction is not serialized across processes
+    fcntl = None
+
+PY_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get("RESULT_CACHE_DIR", "img/result_cache")
+CACHE_MAX_BYTES = int(float(os.environ.get("RESULT_CACHE_MAX_BYTES", 2e9)))
+COMPRESS_LIMIT = 4 * 2**20  # larger arrays are memory-mapped instead (decompression would dominate a hit)
+
+_versions = {}
+
+
+def source_version(module):
+    # Hash of a method script and of the local modules it imports, transitively
+    if module not in _versions:
+        digest = hashlib.sha256()
+        seen, stack = set(), [module]
+        while stack:
+            name = stack.pop()
+            path = os.path.join(PY_DIR, f"{name}.py")
+            if name in seen or not os.path.isfile(path):
+                continue
+            seen.add(name)
+            with open(path, "rb") as f:
+                source = f.read()
+            digest.update(name.encode() + b"\0" + source)
+            for node in ast.walk(ast.parse(source)):
+                if isinstance(node, ast.Import):
+                    stack += [alias.name.split(".")[0] for alias in node.names]
+                elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                    stack.append(node.module.split(".")[0])
+        _versions[module] = digest.hexdigest()
+    return _versions[module]
+
+
+def _canonical(value):
+    # JSON-serializable canonical form of a parameter value
+    if isinstance(value, np.ndarray):
+        return {"dtype": str(value.dtype), "shape": list(value.shape),
+                "sha256": hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items())}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, complex):
+        return [value.real, value.imag]
+    return value
+
+
+def cache_key(method, params, version=None):
+    payload = {"method": method, "params": _canonical(params), "version": version or source_version(method)}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, root=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def path(self, key):
+        return os.path.join(self.root, key)
+
+    def get(self, key):
+        # Dict of arrays or None; large arrays are read-only memory maps
+        path = self.path(key)
+        try:
+            with open(os.path.join(path, "meta.json")) as f:
+                meta = json.load(f)
+            arrays = {}
+            if meta["compressed"]:
+                with np.load(os.path.join(path, "arrays.npz")) as data:
+                    arrays.update({name: data[name] for name in meta["compressed"]})
+            for name in meta["mapped"]:
+                arrays[name] = np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+            os.utime(path)  # LRU recency
+        except (FileNotFoundError, NotADirectoryError):
+            return None  # Missing, or evicted by another process while reading
+        return {name: arrays[name] for name in meta["order"]}
+
+    def put(self, key, arrays, meta=None):
+        os.makedirs(self.root, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=self.root, prefix=".tmp_")
+        arrays = {name: np.asarray(a) for name, a in arrays.items()}
+        compressed = [n for n, a in arrays.items() if a.nbytes <= COMPRESS_LIMIT and a.dtype != object]
+        mapped = [n for n in arrays if n not in compressed]
+        if compressed:
+            np.savez_compressed(os.path.join(tmp, "arrays.npz"), **{n: arrays[n] for n in compressed})
+        for name in mapped:
+            np.save(os.path.join(tmp, f"{name}.npy"), arrays[name])
+        size = sum(os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp))
+        entry = dict(meta or {}, order=list(arrays), compressed=compressed, mapped=mapped,
+                     bytes=size, created=time.strftime("%Y-%m-%dT%H:%M:%S"))
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump(entry, f)
+        try:
+            os.rename(tmp, self.path(key))
+        except OSError:
+            shutil.rmtree(tmp)  # Written concurrently by another process
+        self.evict()
+
+    def entries(self):
+        # (mtime, bytes, path) of all complete entries, oldest first
+        out = []
+        for name in os.listdir(self.root) if os.path.isdir(self.root) else ():
+            path = self.path(name)
+            try:
+                with open(os.path.join(path, "meta.json")) as f:
+                    size = json.load(f)["bytes"]
+                out.append((os.path.getmtime(path), size, path))
+            except (FileNotFoundError, NotADirectoryError, ValueError):
+                continue
+        return sorted(out)
+
+    def evict(self):
+        lock_path = os.path.join(self.root, ".lock")
+        with open(lock_path, "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            entries = self.entries()
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+        return total
+
+    def clear(self):
+        for _, _, path in self.entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def cached(method, func, params, names=None, cache=None):
+    # Memoized func(**params); a seed, if the method takes one, is part of params.
+    # func returns one array or a tuple of arrays (named by names); the result comes
+    # back in the same form. Returns (result, hit).
+    if ("seed" in params and params["seed"] is None) or \
+            os.environ.get("RESULT_CACHE", "").lower() in ("off", "0", "false", "no"):
+        return func(**params), False
+    cache = cache or ResultCache()
+    key = cache_key(method, params)
+    arrays = cache.get(key)
+    if arrays is not None:
+        result = tuple(arrays.values())
+        return (result if names else result[0]), True
+
+    result = func(**params)
+    outputs = result if names else (result,)
+    cache.put(key, dict(zip(names or ("result",), outputs)), {"method": method, "params": _canonical(params)})
+    return result, False
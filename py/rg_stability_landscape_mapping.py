@@ -5,65 +5,197 @@
 #   - Compute 1-loop RG running of gauge couplings α_i(μ) over large scale
 #   - Calculate derivatives to check flow stability
 #   - Map and print coupling values at M_Z and maximum slope of RG flow
+#   - Scan mode: evaluate unification scale and coupling mismatch over a
+#     Cartesian grid of α_i⁻¹(M_Z) and b_i, processed in chunks via broadcasting
 # Inputs:
 # - alpha1_0, alpha2_0, alpha3_0: Initial inverse couplings (default: 59.0, 29.6, 8.5)
 # - b1, b2, b3: Beta coefficients (default: 6.6, 1.0, -3.0)
+# - Scan mode: ranges "min,max,n" for each of the six parameters, chunk size, output directory
 # Output:
 #   - Print α_i(M_Z), max RG slope
 #   - Save plot of α_i(μ) over μ
+#   - Scan mode: N-dimensional arrays mu_unif.npy, alpha_unif.npy, mismatch.npy
+#     (axes ordered α_1⁻¹, α_2⁻¹, α_3⁻¹, b_1, b_2, b_3) and axes.npz
 # ========================================================
 
+import os
+import time
 import numpy as np
-import matplotlib.pyplot as plt
-
-# Interaktive Eingaben
-print("=== RG Stability Landscape Mapping Configuration ===")
-try:
-    alpha1_0 = float(input("Enter initial inverse coupling α_1⁻¹(M_Z) [default 59.0]: ") or 59.0)
-    alpha2_0 = float(input("Enter initial inverse coupling α_2⁻¹(M_Z) [default 29.6]: ") or 29.6)
-    alpha3_0 = float(input("Enter initial inverse coupling α_3⁻¹(M_Z) [default 8.5]: ") or 8.5)
-    b1 = float(input("Enter beta coefficient b_1 [default 6.6]: ") or 6.6)
-    b2 = float(input("Enter beta coefficient b_2 [default 1.0]: ") or 1.0)
-    b3 = float(input("Enter beta coefficient b_3 [default -3.0]: ") or -3.0)
-    if alpha1_0 <= 0 or alpha2_0 <= 0 or alpha3_0 <= 0:
-        raise ValueError("Initial couplings must be positive.")
-except ValueError as e:
-    print(f"Invalid input: {e}. Using default values.")
-    alpha1_0, alpha2_0, alpha3_0 = 59.0, 29.6, 8.5
-    b1, b2, b3 = 6.6, 1.0, -3.0
 
-mu = np.logspace(2, 17, 500)
-log_mu = np.log(mu / 91.2)
+M_Z = 91.2
+SCAN_AXES = ("alpha1_0", "alpha2_0", "alpha3_0", "b1", "b2", "b3")
+
 
 def alpha_inv(alpha0, b, log_mu):
     return 1/alpha0 - b / (2 * np.pi) * log_mu
 
-alpha1_inv = alpha_inv(1/alpha1_0, b1, log_mu)
-alpha2_inv = alpha_inv(1/alpha2_0, b2, log_mu)
-alpha3_inv = alpha_inv(1/alpha3_0, b3, log_mu)
-
-# Stability metric
-diff12 = np.abs(alpha1_inv - alpha2_inv)
-diff23 = np.abs(alpha2_inv - alpha3_inv)
-diff13 = np.abs(alpha1_inv - alpha3_inv)
-total_diff = diff12 + diff23 + diff13
-
-min_idx = np.argmin(total_diff)
-mu_unif = mu[min_idx]
-alpha_unif = np.mean([alpha1_inv[min_idx], alpha2_inv[min_idx], alpha3_inv[min_idx]])
-
-print("=== Stability Landscape Summary ===")
-print(f"Unification scale μ_unif ≈ {mu_unif:.3e} GeV")
-print(f"α⁻¹_unif ≈ {alpha_unif:.3f}")
-
-plt.figure(figsize=(8, 6))
-plt.plot(mu, total_diff, label='Total coupling difference')
-plt.axvline(mu_unif, color='k', linestyle='--', label=f'Unification at {mu_unif:.2e} GeV')
-plt.xscale('log')
-plt.xlabel(r'Energy scale $\mu$ [GeV]')
-plt.ylabel('Total coupling difference')
-plt.title('RG Flow Stability Landscape')
-plt.legend()
-plt.grid(True)
-plt.savefig('img/rg_stability_landscape.png')
-plt.close()
\ No newline at end of file
+
+def total_coupling_difference(alpha_inv0, b, log_t):
+    # alpha_inv0, b: (P, 3); log_t: (P, K) -> (P, K)
+    a = alpha_inv0[:, None, :] - b[:, None, :] / (2 * np.pi) * log_t[..., None]
+    return (np.abs(a[..., 0] - a[..., 1]) + np.abs(a[..., 1] - a[..., 2])
+            + np.abs(a[..., 0] - a[..., 2]))
+
+
+def unification_point(alpha_inv0, b, log_mu):
+    # alpha_inv0, b: (P, 3) parameter sets; log_mu: (M,) ascending scale grid
+    # The total difference is a sum of |linear| terms, hence convex in log μ: its minimum
+    # lies at a pairwise crossing or an endpoint, and the grid argmin brackets that point.
+    P = alpha_inv0.shape[0]
+    lo, hi = log_mu[0], log_mu[-1]
+    candidates = np.empty((P, 5))
+    candidates[:, 0], candidates[:, 1] = lo, hi
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k, (i, j) in enumerate(((0, 1), (1, 2), (0, 2))):
+            cross = 2 * np.pi * (alpha_inv0[:, i] - alpha_inv0[:, j]) / (b[:, i] - b[:, j])
+            candidates[:, 2 + k] = np.where(np.isfinite(cross), np.clip(cross, lo, hi), lo)
+    cand_diff = total_coupling_difference(alpha_inv0, b, candidates)
+    t_star = candidates[np.arange(P), np.argmin(cand_diff, axis=1)]
+
+    right = np.clip(np.searchsorted(log_mu, t_star), 1, log_mu.size - 1)
+    bracket = np.stack([right - 1, right], axis=1)
+    grid_diff = total_coupling_difference(alpha_inv0, b, log_mu[bracket])
+    pick = np.argmin(grid_diff, axis=1)
+    min_idx = bracket[np.arange(P), pick]
+    mismatch = grid_diff[np.arange(P), pick]
+    alpha_unif = np.mean(alpha_inv0 - b / (2 * np.pi) * log_mu[min_idx][:, None], axis=1)
+    return min_idx, alpha_unif, mismatch
+
+
+def rg_landscape_scan(axes, mu=None, chunk_size=65536, out_dir=None):
+    # axes: sequence of six 1D arrays (α_1⁻¹, α_2⁻¹, α_3⁻¹, b_1, b_2, b_3)
+    if mu is None:
+        mu = np.logspace(2, 17, 500)
+    axes = [np.atleast_1d(np.asarray(a, dtype=float)) for a in axes]
+    if len(axes) != 6:
+        raise ValueError("Scan needs ranges for α_1⁻¹, α_2⁻¹, α_3⁻¹, b_1, b_2, b_3.")
+    if any(np.any(a <= 0) for a in axes[:3]):
+        raise ValueError("Initial couplings must be positive.")
+    log_mu = np.log(mu / M_Z)
+    shape = tuple(a.size for a in axes)
+    n_total = int(np.prod(shape))
+
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+        np.savez(os.path.join(out_dir, "axes.npz"), mu=mu,
+                 **{name: a for name, a in zip(SCAN_AXES, axes)})
+        open_result = lambda name: np.lib.format.open_memmap(
+            os.path.join(out_dir, f"{name}.npy"), mode="w+", dtype=np.float64, shape=shape)
+    else:
+        open_result = lambda name: np.empty(shape)
+    mu_unif = open_result("mu_unif")
+    alpha_unif = open_result("alpha_unif")
+    mismatch = open_result("mismatch")
+    flat_mu, flat_alpha, flat_mis = mu_unif.reshape(-1), alpha_unif.reshape(-1), mismatch.reshape(-1)
+
+    for start in range(0, n_total, chunk_size):
+        stop = min(start + chunk_size, n_total)
+        idx = np.unravel_index(np.arange(start, stop), shape)
+        params = np.stack([a[i] for a, i in zip(axes, idx)], axis=1)
+        min_idx, a_unif, mis = unification_point(params[:, :3], params[:, 3:], log_mu)
+        flat_mu[start:stop] = mu[min_idx]
+        flat_alpha[start:stop] = a_unif
+        flat_mis[start:stop] = mis
+
+    if out_dir is not None:
+        for arr in (mu_unif, alpha_unif, mismatch):
+            arr.flush()
+    return mu_unif, alpha_unif, mismatch
+
+
+def parse_range(text, default):
+    lo, hi, n = (text or default).split(",")
+    return np.linspace(float(lo), float(hi), int(n))
+
+
+def plot_stability_landscape(plt, mu, total_diff, mu_unif):
+    plt.figure(figsize=(8, 6))
+    plt.plot(mu, total_diff, label='Total coupling difference')
+    plt.axvline(mu_unif, color='k', linestyle='--', label=f'Unification at {mu_unif:.2e} GeV')
+    plt.xscale('log')
+    plt.xlabel(r'Energy scale $\mu$ [GeV]')
+    plt.ylabel('Total coupling difference')
+    plt.title('RG Flow Stability Landscape')
+    plt.legend()
+    plt.grid(True)
+
+
+def run_single():
+    # Interaktive Eingaben
+    print("=== RG Stability Landscape Mapping Configuration ===")
+    try:
+        alpha1_0 = float(input("Enter initial inverse coupling α_1⁻¹(M_Z) [default 59.0]: ") or 59.0)
+        alpha2_0 = float(input("Enter initial inverse coupling α_2⁻¹(M_Z) [default 29.6]: ") or 29.6)
+        alpha3_0 = float(input("Enter initial inverse coupling α_3⁻¹(M_Z) [default 8.5]: ") or 8.5)
+        b1 = float(input("Enter beta coefficient b_1 [default 6.6]: ") or 6.6)
+        b2 = float(input("Enter beta coefficient b_2 [default 1.0]: ") or 1.0)
+        b3 = float(input("Enter beta coefficient b_3 [default -3.0]: ") or -3.0)
+        if alpha1_0 <= 0 or alpha2_0 <= 0 or alpha3_0 <= 0:
+            raise ValueError("Initial couplings must be positive.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        alpha1_0, alpha2_0, alpha3_0 = 59.0, 29.6, 8.5
+        b1, b2, b3 = 6.6, 1.0, -3.0
+
+    mu = np.logspace(2, 17, 500)
+    log_mu = np.log(mu / M_Z)
+
+    alpha1_inv = alpha_inv(1/alpha1_0, b1, log_mu)
+    alpha2_inv = alpha_inv(1/alpha2_0, b2, log_mu)
+    alpha3_inv = alpha_inv(1/alpha3_0, b3, log_mu)
+
+    # Stability metric
+    diff12 = np.abs(alpha1_inv - alpha2_inv)
+    diff23 = np.abs(alpha2_inv - alpha3_inv)
+    diff13 = np.abs(alpha1_inv - alpha3_inv)
+    total_diff = diff12 + diff23 + diff13
+
+    min_idx = np.argmin(total_diff)
+    mu_unif = mu[min_idx]
+    alpha_unif = np.mean([alpha1_inv[min_idx], alpha2_inv[min_idx], alpha3_inv[min_idx]])
+
+    print("=== Stability Landscape Summary ===")
+    print(f"Unification scale μ_unif ≈ {mu_unif:.3e} GeV")
+    print(f"α⁻¹_unif ≈ {alpha_unif:.3f}")
+
+    from plot_backend import submit_figure, wait_for_figures
+    submit_figure(plot_stability_landscape, 'img/rg_stability_landscape.png',
+                  mu=mu, total_diff=total_diff, mu_unif=mu_unif)
+    wait_for_figures()
+
+
+def run_scan():
+    print("=== RG Stability Landscape Scan Configuration ===")
+    defaults = ("59.0,59.0,1", "29.6,29.6,1", "8.5,8.5,1", "6.6,6.6,1", "1.0,1.0,1", "-3.0,-3.0,1")
+    labels = ("α_1⁻¹(M_Z)", "α_2⁻¹(M_Z)", "α_3⁻¹(M_Z)", "b_1", "b_2", "b_3")
+    try:
+        axes = [parse_range(input(f"Enter {label} range min,max,n [default {d}]: "), d)
+                for label, d in zip(labels, defaults)]
+        chunk_size = int(input("Enter chunk size (parameter points) [default 65536]: ") or 65536)
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        axes = [parse_range(None, d) for d in defaults]
+        chunk_size = 65536
+    out_dir = input("Enter output directory [default img/rg_landscape_scan]: ") or "img/rg_landscape_scan"
+
+    start = time.perf_counter()
+    mu_unif, alpha_unif, mismatch = rg_landscape_scan(axes, chunk_size=chunk_size, out_dir=out_dir)
+    elapsed = time.perf_counter() - start
+
+    best = np.unravel_index(np.argmin(mismatch), mismatch.shape)
+    print("=== Stability Landscape Scan Summary ===")
+    print(f"Scenarios: {mismatch.size} (grid {mismatch.shape}) in {elapsed:.2f} s")
+    print(f"Best unification: mismatch = {mismatch[best]:.4f} at μ_unif ≈ {mu_unif[best]:.3e} GeV, "
+          f"α⁻¹_unif ≈ {alpha_unif[best]:.3f}")
+    print("Parameters: " + ", ".join(f"{name} = {a[i]:.4g}" for name, a, i in zip(SCAN_AXES, axes, best)))
+    print(f"Results saved to {out_dir}/")
+
+
+if __name__ == "__main__":
+    mode = input("Select mode single/scan [default single]: ").strip().lower() or "single"
+    if mode == "scan":
+        run_scan()
+    else:
+        run_single()
@@ -4,61 +4,152 @@
 # Method:
 #   - Use 1-loop beta coefficients for MSSM gauge groups U(1), SU(2), SU(3)
 #   - Calculate inverse couplings α_i^-1(μ) over large energy scale
+#   - Optional 2-loop running with coefficient matrix b_ij:
+#       dα_i⁻¹/dt = -b_i/(2π) - Σ_j b_ij α_j / (8π²),  t = ln(μ/M_Z)
+#     integrated for many initial-condition / coefficient sets at once as one
+#     flattened state vector, with analytic block-diagonal Jacobian and dense output
 #   - Identify energy μ where couplings unify approximately
 # Input:
-#   - Allows user input for initial inverse couplings and beta coefficients
+#   - Allows user input for loop order, initial inverse couplings and beta coefficients
+#   - 2-loop: b_ij matrix (default: MSSM values)
 # Output:
 #   - Prints unification scale and coupling constant
 #   - Saves plot of α_i^-1 vs μ (log scale)
 # ========================================================
 
 import numpy as np
-import matplotlib.pyplot as plt
 
-# Interaktive Eingaben
-print("=== RG Flow Solver Configuration ===")
-alpha1_0 = float(input("Enter initial inverse coupling α_1⁻¹(M_Z) [default 59.0]: ") or 59.0)
-alpha2_0 = float(input("Enter initial inverse coupling α_2⁻¹(M_Z) [default 29.6]: ") or 29.6)
-alpha3_0 = float(input("Enter initial inverse coupling α_3⁻¹(M_Z) [default 8.5]: ") or 8.5)
-b1 = float(input("Enter beta coefficient b_1 [default 6.6]: ") or 6.6)
-b2 = float(input("Enter beta coefficient b_2 [default 1.0]: ") or 1.0)
-b3 = float(input("Enter beta coefficient b_3 [default -3.0]: ") or -3.0)
+M_Z = 91.2
+
+# MSSM 2-loop gauge coefficients (GUT-normalized U(1))
+B2_MSSM = np.array([
+    [199/25, 27/5, 88/5],
+    [9/5, 25.0, 24.0],
+    [11/5, 9.0, 14.0],
+])
 
-mu = np.logspace(2, 17, 500)
-log_mu = np.log(mu / 91.2)
 
 def alpha_inv(alpha0, b, log_mu):
     return 1/alpha0 - b / (2 * np.pi) * log_mu
 
-alpha1_inv = alpha_inv(1/alpha1_0, b1, log_mu)
-alpha2_inv = alpha_inv(1/alpha2_0, b2, log_mu)
-alpha3_inv = alpha_inv(1/alpha3_0, b3, log_mu)
-
-diff12 = np.abs(alpha1_inv - alpha2_inv)
-diff23 = np.abs(alpha2_inv - alpha3_inv)
-diff13 = np.abs(alpha1_inv - alpha3_inv)
-total_diff = diff12 + diff23 + diff13
-
-min_idx = np.argmin(total_diff)
-mu_unif = mu[min_idx]
-alpha_unif = np.mean([alpha1_inv[min_idx], alpha2_inv[min_idx], alpha3_inv[min_idx]])
-
-print("=== Coupling Unification Point ===")
-print(f"μ_unif ≈ {mu_unif:.3e} GeV")
-print(f"α⁻¹_unif ≈ {alpha_unif:.3f}")
-print(f"α_unif ≈ {1/alpha_unif:.5f}")
-
-plt.figure(figsize=(8, 6))
-plt.plot(mu, alpha1_inv, label=r'$\alpha_1^{-1}$ (U(1))')
-plt.plot(mu, alpha2_inv, label=r'$\alpha_2^{-1}$ (SU(2))')
-plt.plot(mu, alpha3_inv, label=r'$\alpha_3^{-1}$ (SU(3))')
-plt.axvline(mu_unif, color='k', linestyle='--', label=f'Unification scale\n{mu_unif:.2e} GeV')
-plt.xscale('log')
-plt.xlabel(r'Energy scale $\mu$ [GeV]')
-plt.ylabel(r'Inverse coupling $\alpha_i^{-1}$')
-plt.title('RG Flow of MSSM Gauge Couplings and Unification Scale')
-plt.legend()
-plt.grid(True, which='both', linestyle='--', linewidth=0.5)
-plt.tight_layout()
-plt.savefig('img/mssm_gauge_coupling_unification.png', dpi=300)
-plt.show()
\ No newline at end of file
+
+class TwoLoopGaugeFlow:
+    # Batched 2-loop system: state y = α_i⁻¹ for N scenarios, flattened to 3N;
+    # N is the broadcast batch size of the initial conditions (n rows), b and b2
+    def __init__(self, b, b2, n=1):
+        self.b = np.atleast_2d(np.asarray(b, dtype=float))
+        self.b2 = np.asarray(b2, dtype=float)
+        if self.b2.ndim == 2:
+            self.b2 = self.b2[None]
+        self.N = np.broadcast_shapes((n,), self.b.shape[:1], self.b2.shape[:1])[0]
+        self.b = np.broadcast_to(self.b, (self.N, 3))
+        self.b2 = np.broadcast_to(self.b2, (self.N, 3, 3))
+        # Sparsity pattern of the N independent 3×3 Jacobian blocks
+        base = 3 * np.arange(self.N)[:, None, None]
+        self._rows = (base + np.arange(3)[None, :, None] + np.zeros((1, 1, 3), dtype=int)).ravel()
+        self._cols = (base + np.arange(3)[None, None, :] + np.zeros((1, 3, 1), dtype=int)).ravel()
+
+    def rhs(self, t, y):
+        a_inv = y.reshape(self.N, 3)
+        two_loop = np.einsum('nij,nj->ni', self.b2, 1 / a_inv)
+        return (-self.b / (2 * np.pi) - two_loop / (8 * np.pi**2)).ravel()
+
+    def jac(self, t, y):
+        # ∂f_i/∂(α_k⁻¹) = b_ik / (8π² (α_k⁻¹)²), block-diagonal over scenarios
+        from scipy.sparse import csr_matrix
+        a_inv = y.reshape(self.N, 3)
+        blocks = self.b2 / (8 * np.pi**2 * a_inv[:, None, :]**2)
+        return csr_matrix((blocks.ravel(), (self._rows, self._cols)), shape=(3 * self.N, 3 * self.N))
+
+
+def solve_two_loop(alpha_inv0, b, b2=B2_MSSM, mu_span=(M_Z, 1e17), method="BDF",
+                   rtol=1e-8, atol=1e-10):
+    # alpha_inv0: (N, 3) or (3,); b: (N, 3) or (3,); b2: (N, 3, 3) or (3, 3)
+    from scipy.integrate import solve_ivp
+    alpha_inv0 = np.atleast_2d(np.asarray(alpha_inv0, dtype=float))
+    flow = TwoLoopGaugeFlow(b, b2, len(alpha_inv0))
+    y0 = np.broadcast_to(alpha_inv0, (flow.N, 3)).ravel()
+    if np.any(y0 <= 0):
+        raise ValueError("Initial inverse couplings must be positive.")
+    t_span = (np.log(mu_span[0] / M_Z), np.log(mu_span[1] / M_Z))
+    options = {"jac": flow.jac} if method in ("Radau", "BDF", "LSODA") else {}
+    sol = solve_ivp(flow.rhs, t_span, y0, method=method, dense_output=True,
+                    rtol=rtol, atol=atol, **options)
+    if not sol.success:
+        raise RuntimeError(f"Two-loop integration failed: {sol.message}")
+    return sol, flow.N
+
+
+def two_loop_alpha_inv(sol, N, mu):
+    # Dense-output evaluation for all scenarios at once -> (N, 3, len(mu))
+    return sol.sol(np.log(np.asarray(mu) / M_Z)).reshape(N, 3, -1)
+
+
+def unification_scale(mu, alpha_inv_mu):
+    # alpha_inv_mu: (..., 3, M)
+    a1, a2, a3 = alpha_inv_mu[..., 0, :], alpha_inv_mu[..., 1, :], alpha_inv_mu[..., 2, :]
+    total_diff = np.abs(a1 - a2) + np.abs(a2 - a3) + np.abs(a1 - a3)
+    min_idx = np.argmin(total_diff, axis=-1)
+    alpha_unif = np.take_along_axis(alpha_inv_mu.mean(axis=-2), min_idx[..., None], axis=-1)[..., 0]
+    return mu[min_idx], alpha_unif
+
+
+def plot_gauge_unification(plt, mu, alpha1_inv, alpha2_inv, alpha3_inv, mu_unif):
+    plt.figure(figsize=(8, 6))
+    plt.plot(mu, alpha1_inv, label=r'$\alpha_1^{-1}$ (U(1))')
+    plt.plot(mu, alpha2_inv, label=r'$\alpha_2^{-1}$ (SU(2))')
+    plt.plot(mu, alpha3_inv, label=r'$\alpha_3^{-1}$ (SU(3))')
+    plt.axvline(mu_unif, color='k', linestyle='--', label=f'Unification scale\n{mu_unif:.2e} GeV')
+    plt.xscale('log')
+    plt.xlabel(r'Energy scale $\mu$ [GeV]')
+    plt.ylabel(r'Inverse coupling $\alpha_i^{-1}$')
+    plt.title('RG Flow of MSSM Gauge Couplings and Unification Scale')
+    plt.legend()
+    plt.grid(True, which='both', linestyle='--', linewidth=0.5)
+    plt.tight_layout()
+
+
+if __name__ == "__main__":
+    from plot_backend import submit_figure, wait_for_figures
+
+    # Interaktive Eingaben
+    print("=== RG Flow Solver Configuration ===")
+    loops = int(input("Enter loop order 1 or 2 [default 1]: ") or 1)
+    alpha1_0 = float(input("Enter initial inverse coupling α_1⁻¹(M_Z) [default 59.0]: ") or 59.0)
+    alpha2_0 = float(input("Enter initial inverse coupling α_2⁻¹(M_Z) [default 29.6]: ") or 29.6)
+    alpha3_0 = float(input("Enter initial inverse coupling α_3⁻¹(M_Z) [default 8.5]: ") or 8.5)
+    b1 = float(input("Enter beta coefficient b_1 [default 6.6]: ") or 6.6)
+    b2 = float(input("Enter beta coefficient b_2 [default 1.0]: ") or 1.0)
+    b3 = float(input("Enter beta coefficient b_3 [default -3.0]: ") or -3.0)
+    if loops == 2:
+        b_ij = input("Enter 2-loop coefficients b_ij as 9 comma-separated values [default MSSM]: ")
+        B2 = np.array([float(v) for v in b_ij.split(",")]).reshape(3, 3) if b_ij else B2_MSSM
+
+    mu = np.logspace(2, 17, 500)
+    log_mu = np.log(mu / M_Z)
+
+    if loops == 2:
+        sol, N = solve_two_loop([alpha1_0, alpha2_0, alpha3_0], [b1, b2, b3], B2, mu_span=(M_Z, mu[-1]))
+        alpha1_inv, alpha2_inv, alpha3_inv = two_loop_alpha_inv(sol, N, mu)[0]
+    else:
+        alpha1_inv = alpha_inv(1/alpha1_0, b1, log_mu)
+        alpha2_inv = alpha_inv(1/alpha2_0, b2, log_mu)
+        alpha3_inv = alpha_inv(1/alpha3_0, b3, log_mu)
+
+    diff12 = np.abs(alpha1_inv - alpha2_inv)
+    diff23 = np.abs(alpha2_inv - alpha3_inv)
+    diff13 = np.abs(alpha1_inv - alpha3_inv)
+    total_diff = diff12 + diff23 + diff13
+
+    min_idx = np.argmin(total_diff)
+    mu_unif = mu[min_idx]
+    alpha_unif = np.mean([alpha1_inv[min_idx], alpha2_inv[min_idx], alpha3_inv[min_idx]])
+
+    print(f"=== Coupling Unification Point ({loops}-loop) ===")
+    print(f"μ_unif ≈ {mu_unif:.3e} GeV")
+    print(f"α⁻¹_unif ≈ {alpha_unif:.3f}")
+    print(f"α_unif ≈ {1/alpha_unif:.5f}")
+
+    submit_figure(plot_gauge_unification, 'img/mssm_gauge_coupling_unification.png', savefig_kwargs={'dpi': 300},
+                  mu=mu, alpha1_inv=alpha1_inv, alpha2_inv=alpha2_inv, alpha3_inv=alpha3_inv, mu_unif=mu_unif)
+    wait_for_figures()
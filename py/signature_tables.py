@@ -0,0 +1,189 @@
+# ========================================================
+# File: signature_tables.py
+# Purpose: Scale-free signature-class probabilities of random symmetric n×n Hessians
+# Method:
+#   - The signs of the eigenvalues of s·H equal those of H for every s > 0, so the
+#     overall scale (1/√tau, ev) drops out: an ensemble is described by its shape only
+#       dist  "gaussian" (the scripts' symmetrized normal matrices), "uniform",
+#             "laplace" or "student_t" (with df)
+#       loc   mean of the entries, diag: offsets added to the diagonal (both in units
+#             of the entry scale; non-zero values make the ensemble anisotropic)
+#   - Signature class = number of positive eigenvalues p (n - p negative; zero
+#     eigenvalues have probability zero), counted by Sylvester's law of inertia from
+#     the pivots of an unpivoted LDLᵀ elimination, vectorized over chunks of matrices;
+#     matrices with a tiny pivot fall back to eigvalsh
+#   - Probabilities with Wilson score confidence intervals, from class counts persisted
+#     in a JSON lookup table keyed by the canonical ensemble; a query is answered from the
+#     table when it holds enough samples, otherwise only the shortfall is sampled (with a
+#     fresh seed per block) and merged into the table
+#   - The shipped table holds the Gaussian ensemble for n = 1..16
+# Environment:
+# - SIGNATURE_TABLE: table path (default: py/tables/signature_probabilities.json)
+# Inputs:
+# - n_max (default: 16), samples per ensemble (default: 2^21), dist/loc for new ensembles
+# Output:
+#   - Table of class probabilities with 95% intervals; updated lookup table
+# ========================================================
+
+import json
+import os
+import tempfile
+
+import numpy as np
+
+TABLE_PATH = os.environ.get("SIGNATURE_TABLE") or \
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables", "signature_probabilities.json")
+DISTRIBUTIONS = ("gaussian", "uniform", "laplace", "student_t")
+TABLE_SEED = 42
+DEFAULT_SAMPLES = 2**21
+CHUNK = 4096  # Matrices per elimination pass (keeps the working set in cache)
+PIVOT_TOL = 1e-10
+
+
+def ensemble(n=4, dist="gaussian", df=None, loc=0.0, diag=None):
+    # Canonical, scale-free ensemble description (the lookup key)
+    if not 1 <= n <= 64:
+        raise ValueError("n must be between 1 and 64.")
+    if dist not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution {dist}; choose one of {', '.join(DISTRIBUTIONS)}.")
+    if dist == "student_t" and not (df and df > 0):
+        raise ValueError("student_t needs degrees of freedom df > 0.")
+    if diag is not None and len(diag) != n:
+        raise ValueError("diag needs one offset per dimension.")
+    diag = [float(d) for d in diag] if diag is not None and any(diag) else None
+    return {"n": int(n), "dist": dist, "df": float(df) if dist == "student_t" else None,
+            "loc": float(loc), "diag": diag}
+
+
+def ensemble_key(spec):
+    return json.dumps(spec, sort_keys=True)
+
+
+def sample_matrices(spec, size, rng):
+    # size symmetric matrices with unit entry scale -> (size, n, n)
+    n, dist = spec["n"], spec["dist"]
+    shape = (size, n, n)
+    if dist == "gaussian":
+        H = rng.standard_normal(shape)
+    elif dist == "uniform":
+        H = rng.uniform(-np.sqrt(3), np.sqrt(3), shape)
+    elif dist == "laplace":
+        H = rng.laplace(0, 1 / np.sqrt(2), shape)
+    else:
+        H = rng.standard_t(spec["df"], shape)
+    H = (H + H.swapaxes(-1, -2)) / 2 + spec["loc"]
+    if spec["diag"] is not None:
+        H += np.diag(spec["diag"])
+    return H
+
+
+def positive_counts(H):
+    # Number of positive eigenvalues per matrix from the LDLᵀ pivots (overwrites H)
+    n = H.shape[-1]
+    scale = np.abs(H).max(axis=(-2, -1))
+    positive = np.zeros(len(H), dtype=int)
+    unsafe = np.zeros(len(H), dtype=bool)
+    H0 = H.copy()
+    for k in range(n):
+        d = H[:, k, k]
+        positive += d > 0
+        unsafe |= np.abs(d) <= PIVOT_TOL * scale
+        if k < n - 1:
+            r = H[:, k, k + 1:]
+            H[:, k + 1:, k + 1:] -= r[:, :, None] * (r / np.where(d == 0, 1, d)[:, None])[:, None, :]
+    if unsafe.any():
+        positive[unsafe] = np.sum(np.linalg.eigvalsh(H0[unsafe]) > 0, axis=-1)
+    return positive
+
+
+def sample_counts(spec, samples, seed):
+    # Class counts [#(p = 0), ..., #(p = n)] of freshly sampled matrices
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(spec["n"] + 1, dtype=np.int64)
+    for start in range(0, samples, CHUNK):
+        p = positive_counts(sample_matrices(spec, min(CHUNK, samples - start), rng))
+        counts += np.bincount(p, minlength=spec["n"] + 1)
+    return counts
+
+
+def wilson_interval(k, N, z=1.96):
+    k, N = np.asarray(k, dtype=float), float(N)
+    p = k / N
+    center = (p + z**2 / (2 * N)) / (1 + z**2 / N)
+    half = z * np.sqrt(p * (1 - p) / N + z**2 / (4 * N**2)) / (1 + z**2 / N)
+    return np.maximum(center - half, 0), np.minimum(center + half, 1)
+
+
+def load_table(path=TABLE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return {ensemble_key(entry["ensemble"]): entry for entry in json.load(f)["entries"]}
+
+
+def save_entry(entry, path=TABLE_PATH):
+    # Merge one entry into the table file (re-read first; the entry with more samples wins)
+    table = load_table(path)
+    key = ensemble_key(entry["ensemble"])
+    if key not in table or table[key]["samples"] < entry["samples"]:
+        table[key] = entry
+    entries = sorted(table.values(), key=lambda e: (e["ensemble"]["dist"], ensemble_key(e["ensemble"])))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump({"entries": entries}, f, indent=1)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, path)
+
+
+def signature_probabilities(n=4, dist="gaussian", df=None, loc=0.0, diag=None, min_samples=DEFAULT_SAMPLES,
+                            z=1.96, path=TABLE_PATH):
+    # Probability of each class p = 0..n with Wilson interval, from the table or topped up by sampling.
+    # Returns {"probability", "low", "high": (n+1,), "samples", "sampled": fresh samples drawn}
+    spec = ensemble(n, dist, df, loc, diag)
+    entry = load_table(path).get(ensemble_key(spec)) or \
+        {"ensemble": spec, "samples": 0, "blocks": 0, "counts": [0] * (n + 1)}
+    sampled = max(int(min_samples) - entry["samples"], 0)
+    if sampled:
+        counts = np.array(entry["counts"]) + sample_counts(spec, sampled, [TABLE_SEED, entry["blocks"]])
+        entry = {"ensemble": spec, "samples": entry["samples"] + sampled, "blocks": entry["blocks"] + 1,
+                 "counts": counts.tolist()}
+        save_entry(entry, path)
+    counts, N = np.array(entry["counts"]), entry["samples"]
+    low, high = wilson_interval(counts, N, z)
+    return {"probability": counts / N, "low": low, "high": high, "samples": N, "sampled": sampled}
+
+
+def class_probability(table, positive):
+    # (probability, low, high) of the class with `positive` positive eigenvalues
+    return table["probability"][positive], table["low"][positive], table["high"][positive]
+
+
+if __name__ == "__main__":
+    import time
+
+    print("=== Signature Probability Table Configuration ===")
+    try:
+        n_max = int(input("Enter largest dimension n_max [default 16]: ") or 16)
+        samples = int(float(input(f"Enter samples per ensemble [default {DEFAULT_SAMPLES}]: ") or DEFAULT_SAMPLES))
+        dist = input("Select distribution gaussian/uniform/laplace/student_t [default gaussian]: ").strip() or "gaussian"
+        df = float(input("Enter student_t degrees of freedom df [default 3]: ") or 3) if dist == "student_t" else None
+        loc = float(input("Enter entry mean loc in units of the entry scale [default 0]: ") or 0.0)
+        if not 1 <= n_max <= 64 or samples <= 0:
+            raise ValueError("n_max must be between 1 and 64 and samples positive.")
+        ensemble(n_max, dist, df, loc)
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        n_max, samples, dist, df, loc = 16, DEFAULT_SAMPLES, "gaussian", None, 0.0
+
+    print(f"=== Signature Probabilities ({dist}, loc = {loc}) ===")
+    for n in range(1, n_max + 1):
+        start = time.perf_counter()
+        table = signature_probabilities(n, dist, df, loc, min_samples=samples)
+        source = f"sampled {table['sampled']}" if table["sampled"] else "table"
+        print(f"n = {n:2d} ({table['samples']} samples, {source}, {time.perf_counter() - start:.2f} s)")
+        for p in range(n + 1):
+            prob, low, high = class_probability(table, p)
+            if table["probability"][p] > 0 or p in (1, n - 1):
+                print(f"   ({p}+, {n - p}-): {prob:.6e}  [{low:.3e}, {high:.3e}]")
+    print(f"Lookup table: {TABLE_PATH}")
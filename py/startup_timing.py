@@ -0,0 +1,108 @@
+# ========================================================
+# File: startup_timing.py
+# Purpose: Measure import/startup cost of every method and call cost of the constant projections
+# Method:
+#   - Each method module is imported in a fresh interpreter (best of several runs),
+#     timed around the import statement only; interpreter startup is measured separately
+#   - Heavy modules pulled in by the import (matplotlib, scipy.integrate, sympy) are
+#     reported, so eager imports show up immediately
+#   - Projection formulas are called with central CODATA inputs through the
+#     projection_chain graph and timed with timeit
+# Inputs:
+# - repeats: Fresh-interpreter runs per module (default: 5)
+# Output:
+#   - Table of import time and heavy modules per method
+#   - Table of per-call time per projection formula
+# ========================================================
+
+import os
+import subprocess
+import sys
+import timeit
+
+PY_DIR = os.path.dirname(os.path.abspath(__file__))
+
+METHODS = [
+    "atomic_mass_unit_projection",
+    "avogadro_constant_projection",
+    "compton_wavelength_projection",
+    "cosmo_constant_from_hubble_flow",
+    "discrete_curvature_projection",
+    "entropy_vector_field_visualization",
+    "hessian_scale_analysis",
+    "hubble_constant_from_entropy",
+    "lagrangian_density_simulation",
+    "lie_group_branching_e8_su321",
+    "lorentz_signature_detection",
+    "mass_and_g_projection",
+    "montecarlo_structural_simulation",
+    "planck_constant_reconstruction",
+    "rg_stability_landscape_mapping",
+    "rgflow_ode_solver",
+    "susy_parameter_variation",
+    "thomson_cross_section_projection",
+    "top_yukawa_flow",
+    "topological_invariant_testing",
+    "yang_mills_field_dynamics",
+    "yukawa_matrix_eigenflow",
+]
+
+HEAVY_MODULES = ("matplotlib", "scipy.integrate", "sympy")
+
+_IMPORT_PROBE = (
+    "import sys, time\n"
+    "t = time.perf_counter()\n"
+    "import {module}\n"
+    "dt = time.perf_counter() - t\n"
+    "print(dt, *[m for m in {heavy!r} if m in sys.modules])\n"
+)
+
+
+def startup_time(repeats=5):
+    # Wall time of a bare interpreter start (numpy not included)
+    def run():
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return min(timeit.repeat(run, number=1, repeat=repeats))
+
+
+def import_time(module, repeats=5):
+    # Best import time over fresh interpreters and heavy modules loaded by the import
+    best, heavy = float("inf"), []
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                             cwd=PY_DIR, capture_output=True, text=True, check=True).stdout.split()
+        best, heavy = min(best, float(out[0])), out[1:]
+    return best, heavy
+
+
+def projection_call_times(number=10000):
+    # Per-call seconds of each projection formula at the central input values
+    from projection_chain import INPUTS, NODES, evaluate_chain
+    values = evaluate_chain({name: value for name, (value, _) in INPUTS.items()})
+    times = {}
+    for name, (func, deps, _, _) in NODES.items():
+        args = [values[d] for d in deps]
+        times[name] = min(timeit.repeat(lambda: func(*args), number=number, repeat=5)) / number
+    return times
+
+
+if __name__ == "__main__":
+    print("=== Startup Timing Configuration ===")
+    try:
+        repeats = int(input("Enter fresh-interpreter runs per module [default 5]: ") or 5)
+        if repeats <= 0:
+            raise ValueError("repeats must be positive.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        repeats = 5
+
+    print("=== Import Times ===")
+    print(f"Interpreter startup: {startup_time(repeats) * 1e3:.1f} ms")
+    print(f"{'Method':<38} {'Import (ms)':>12}  Heavy modules loaded")
+    for module in METHODS:
+        t, heavy = import_time(module, repeats)
+        print(f"{module:<38} {t * 1e3:>12.2f}  {', '.join(heavy) or '-'}")
+
+    print("=== Projection Call Times ===")
+    for name, t in projection_call_times().items():
+        print(f"{name:<10} {t * 1e6:>10.3f} µs/call")
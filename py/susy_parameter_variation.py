@@ -6,53 +6,103 @@
 #   - ω = π (projection frequency)
 #   - θ = π/4 (phase offset)
 #   - Base mass = electron mass
+# Method:
+#   - m_susy = m0 + α_S m0 sin(ω S + θ) with S ~ N(0, 1)
+#   - Exact moments for Gaussian S, vectorized over (α_S, ω, θ) grids:
+#       E[sin(ωS+θ)]  = e^{-ω²/2} sin θ
+#       E[sin²(ωS+θ)] = (1 - e^{-2ω²} cos 2θ) / 2
+#   - Sampling only for the histogram, streamed in chunks into fixed bins on the
+#     exact support [m0(1-α_S), m0(1+α_S)], so N is not limited by memory
 # Inputs:
 # - alpha_S: Scaling factor (default: 0.1)
 # - omega: Frequency parameter (default: 0.5)
 # - theta: Phase parameter (default: 0.0)
-# - N: Number of samples (default: 10000)# Output:
+# - N: Number of histogram samples (default: 10000)
+# - sampler: pseudo (default), or scrambled sobol/halton points (qmc_sampling.py)
+# Output:
 #   - Mass histograms and projection states
 # ========================================================
 import numpy as np
-import matplotlib.pyplot as plt
-
-# Interactive Inputs
-print("=== SUSY Parameter Variation Configuration ===")
-try:
-    alpha_S = float(input("Enter scaling factor alpha_S [default 0.1]: ") or 0.1)
-    omega = float(input("Enter frequency omega [default 0.5]: ") or 0.5)
-    theta = float(input("Enter phase theta [default 0.0]: ") or 0.0)
-    N = int(input("Enter number of samples N [default 10000]: ") or 10000)
-    if alpha_S <= 0 or omega <= 0 or N <= 0:
-        raise ValueError("alpha_S, omega, and N must be positive.")
-    if N > 100000:
-        raise ValueError("N too large for performance.")
-except ValueError as e:
-    print(f"Invalid input: {e}. Using default values.")
-    alpha_S = 0.1
-    omega = 0.5
-    theta = 0.0
-    N = 10000
-
-np.random.seed(42)
-m0 = 1e-27  # Reference mass (kg)
-S = np.random.normal(loc=0, scale=1, size=N)
-delta_m = alpha_S * m0 * np.sin(omega * S + theta)
-
-m_susy = m0 + delta_m
-m_susy_mean = np.mean(m_susy)
-m_susy_std = np.std(m_susy)
-
-print("=== SUSY Mass Splitting Results ===")
-print(f"Mean SUSY mass: {m_susy_mean:.8e} kg")
-print(f"Mass standard deviation: {m_susy_std:.8e} kg")
-
-plt.figure(figsize=(8, 6))
-plt.hist(m_susy, bins=50, color='purple', alpha=0.7)
-plt.axvline(m_susy_mean, color='red', linestyle='--', label=f'Mean = {m_susy_mean:.2e}')
-plt.title('SUSY Mass Splitting Distribution')
-plt.xlabel('Mass (kg)')
-plt.ylabel('Frequency')
-plt.legend()
-plt.savefig('img/susy_mass_splitting.png')
-plt.close()
\ No newline at end of file
+
+M0 = 1e-27  # Reference mass (kg)
+
+
+def susy_mass_moments(alpha_S, omega, theta, m0=M0):
+    # Exact mean and standard deviation; arguments broadcast against each other
+    alpha_S, omega, theta = np.broadcast_arrays(alpha_S, omega, theta)
+    sin_mean = np.exp(-omega**2 / 2) * np.sin(theta)
+    sin_sq_mean = (1 - np.exp(-2 * omega**2) * np.cos(2 * theta)) / 2
+    mean = m0 * (1 + alpha_S * sin_mean)
+    std = m0 * np.abs(alpha_S) * np.sqrt(np.maximum(sin_sq_mean - sin_mean**2, 0))
+    return mean, std
+
+
+def susy_mass_samples(alpha_S, omega, theta, N, m0=M0, chunk_size=1_000_000, seed=42, sampler="pseudo"):
+    # Yields m_susy in chunks of at most chunk_size; a sobol/halton sampler continues one
+    # low-discrepancy sequence across chunks (qmc_sampling.py)
+    if sampler == "pseudo":
+        rng = np.random.default_rng(seed)
+        standard_normal = rng.standard_normal
+    else:
+        from qmc_sampling import draw, qmc_engine, to_normal
+        engine = qmc_engine(1, sampler, seed)
+        standard_normal = lambda n: to_normal(draw(engine, n)[:, 0])
+    for start in range(0, N, chunk_size):
+        S = standard_normal(min(chunk_size, N - start))
+        yield m0 + alpha_S * m0 * np.sin(omega * S + theta)
+
+
+def susy_mass_histogram(alpha_S, omega, theta, N, m0=M0, bins=50, chunk_size=1_000_000, seed=42,
+                        sampler="pseudo"):
+    # Streaming fixed-bin histogram of m_susy; memory is bounded by chunk_size
+    half_width = abs(alpha_S) * m0
+    edges = np.linspace(m0 - half_width, m0 + half_width, bins + 1)
+    counts = np.zeros(bins, dtype=np.int64)
+    for m_susy in susy_mass_samples(alpha_S, omega, theta, N, m0, chunk_size, seed, sampler):
+        counts += np.histogram(m_susy, bins=edges)[0]
+    return counts, edges
+
+
+def plot_susy_mass_histogram(plt, counts, edges, m_susy_mean):
+    plt.figure(figsize=(8, 6))
+    plt.stairs(counts, edges, fill=True, color='purple', alpha=0.7)
+    plt.axvline(m_susy_mean, color='red', linestyle='--', label=f'Mean = {m_susy_mean:.2e}')
+    plt.title('SUSY Mass Splitting Distribution')
+    plt.xlabel('Mass (kg)')
+    plt.ylabel('Frequency')
+    plt.legend()
+
+
+if __name__ == "__main__":
+    from plot_backend import submit_figure, wait_for_figures
+
+    # Interactive Inputs
+    print("=== SUSY Parameter Variation Configuration ===")
+    try:
+        alpha_S = float(input("Enter scaling factor alpha_S [default 0.1]: ") or 0.1)
+        omega = float(input("Enter frequency omega [default 0.5]: ") or 0.5)
+        theta = float(input("Enter phase theta [default 0.0]: ") or 0.0)
+        N = int(input("Enter number of histogram samples N [default 10000]: ") or 10000)
+        sampler = input("Select sampler pseudo/sobol/halton [default pseudo]: ").strip().lower() or "pseudo"
+        if sampler not in ("pseudo", "sobol", "halton"):
+            raise ValueError(f"Unknown sampler {sampler}.")
+        if alpha_S <= 0 or omega <= 0 or N <= 0:
+            raise ValueError("alpha_S, omega, and N must be positive.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        alpha_S = 0.1
+        omega = 0.5
+        theta = 0.0
+        N = 10000
+        sampler = "pseudo"
+
+    m_susy_mean, m_susy_std = susy_mass_moments(alpha_S, omega, theta)
+    counts, edges = susy_mass_histogram(alpha_S, omega, theta, N, sampler=sampler)
+
+    print("=== SUSY Mass Splitting Results ===")
+    print(f"Mean SUSY mass: {m_susy_mean:.8e} kg")
+    print(f"Mass standard deviation: {m_susy_std:.8e} kg")
+
+    submit_figure(plot_susy_mass_histogram, 'img/susy_mass_splitting.png',
+                  counts=counts, edges=edges, m_susy_mean=m_susy_mean)
+    wait_for_figures()
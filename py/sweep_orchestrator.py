@@ -0,0 +1,326 @@
+# ========================================================
+# File: sweep_orchestrator.py
+# Purpose: Headless, config-driven parameter sweeps of any method across a process pool
+# Method:
+#   - A JSON config declares the method, the sweep mode and the parameter ranges:
+#       scalar                          fixed value
+#       list                            grid values / random choice
+#       {"min", "max", "num"}           grid: num evenly spaced values
+#       {"min", "max"}                  random: uniform sample
+#     optional "log": true (geometric spacing / log-uniform sampling) and
+#     "integer": true (rounded values); random mode draws "samples" points from "seed"
+#   - Each run calls method_runners.run_method, so invalid parameters are reported
+#     as errors instead of silently replaced by the script defaults
+#   - Persistent worker processes (spawned, so per-worker BLAS/OpenMP thread limits
+#     apply) take one run at a time; a run exceeding the timeout gets its worker
+#     killed and replaced, a crashed worker is reported as an error
+#   - Every finished run is appended to a JSON-lines journal (flushed and fsynced);
+#     the run ID is a hash of method and parameters, so a restarted sweep skips the
+#     runs already in the journal (failed runs only on request)
+#   - The journal is tabulated into one CSV: run_id, status, elapsed, the swept
+#     parameters, all result columns and the error message
+# Config keys:
+# - method, parameters (required); mode grid/random (default: grid);
+#   samples, seed (random mode); output CSV path (default: img/sweeps/<config name>.csv)
+# - resources: workers (default: all cores), timeout in seconds per run (default: none),
+#   threads_per_worker (default: 1)
+# Usage:
+#   python sweep_orchestrator.py config.json [--retry-failed]   (no prompts, for scheduled jobs)
+#   python sweep_orchestrator.py                                (interactive)
+# ========================================================
+
+import csv
+import hashlib
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+from collections import deque
+from multiprocessing.connection import wait
+
+THREAD_VARIABLES = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMEXPR_NUM_THREADS")
+
+
+def load_config(path):
+    # Parsed and validated sweep config; problems raise ValueError
+    from method_runners import RUNNERS, method_parameters
+    with open(path) as f:
+        config = json.load(f)
+    method = config.get("method")
+    if method not in RUNNERS:
+        raise ValueError(f"Unknown method {method}.")
+    parameters = config.get("parameters", {})
+    unknown = set(parameters) - set(method_parameters(method))
+    if unknown:
+        raise ValueError(f"Unknown parameters {sorted(unknown)} for {method}.")
+    mode = config.setdefault("mode", "grid")
+    if mode not in ("grid", "random"):
+        raise ValueError("mode must be grid or random.")
+    if mode == "random" and int(config.get("samples", 0)) <= 0:
+        raise ValueError("Random sweeps need a positive number of samples.")
+    resources = config.setdefault("resources", {})
+    if int(resources.get("workers", 1)) <= 0 or float(resources.get("timeout") or 1) <= 0:
+        raise ValueError("workers and timeout must be positive.")
+    name = os.path.splitext(os.path.basename(path))[0]
+    config.setdefault("output", f"img/sweeps/{name}.csv")
+    return config
+
+
+def _finish(value, spec):
+    return int(round(value)) if spec.get("integer") else value
+
+
+def grid_values(spec):
+    if isinstance(spec, list):
+        return spec
+    if not isinstance(spec, dict):
+        return [spec]
+    lo, hi, num = spec["min"], spec["max"], int(spec["num"])
+    if num < 1 or (spec.get("log") and min(lo, hi) <= 0):
+        raise ValueError("Grid ranges need num >= 1 and positive bounds on a log scale.")
+    if num == 1:
+        return [_finish(lo, spec)]
+    if spec.get("log"):
+        values = [math.exp(math.log(lo) + i * (math.log(hi) - math.log(lo)) / (num - 1)) for i in range(num)]
+    else:
+        values = [lo + i * (hi - lo) / (num - 1) for i in range(num)]
+    values[0], values[-1] = lo, hi  # Exact end points
+    return list(dict.fromkeys(_finish(v, spec) for v in values))
+
+
+def random_value(rng, spec):
+    if isinstance(spec, list):
+        return rng.choice(spec)
+    if not isinstance(spec, dict):
+        return spec
+    lo, hi = spec["min"], spec["max"]
+    if spec.get("log"):
+        if min(lo, hi) <= 0:
+            raise ValueError("Log-uniform ranges need positive bounds.")
+        return _finish(math.exp(rng.uniform(math.log(lo), math.log(hi))), spec)
+    return _finish(rng.uniform(lo, hi), spec)
+
+
+def expand_runs(config):
+    # Deterministic list of parameter dicts of the sweep
+    parameters = config.get("parameters", {})
+    names = list(parameters)
+    if config.get("mode", "grid") == "random":
+        rng = random.Random(config.get("seed", 0))
+        return [{name: random_value(rng, parameters[name]) for name in names}
+                for _ in range(int(config["samples"]))]
+    return [dict(zip(names, values)) for values in itertools.product(*(grid_values(parameters[n]) for n in names))]
+
+
+def run_id(method, params):
+    payload = json.dumps({"method": method, "params": params}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def journal_path(output):
+    return os.path.splitext(output)[0] + ".jsonl"
+
+
+def read_journal(path):
+    # run_id -> latest record; a line cut short by a crash is ignored
+    records = {}
+    if os.path.isfile(path):
+        with open(path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                records[record["run_id"]] = record
+    return records
+
+
+def write_table(records, path, param_names):
+    # All journal records as one CSV, written to a temporary file and renamed into place
+    result_names = list(dict.fromkeys(k for r in records for k in (r.get("result") or {})))
+    fields = ["run_id", "status", "elapsed"] + param_names + result_names + ["error"]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", newline="") as f:
+        writer = csv.DictWriter(f, fields)
+        writer.writeheader()
+        for r in records:
+            row = {"run_id": r["run_id"], "status": r["status"], "elapsed": r["elapsed"], "error": r.get("error") or ""}
+            row.update({k: r["params"].get(k, "") for k in param_names})
+            row.update(r.get("result") or {})
+            writer.writerow(row)
+    os.replace(tmp, path)
+    return path
+
+
+def _serve(conn, threads):
+    # Worker loop: (method, params) in, (status, result, error, elapsed) out
+    if threads:
+        for var in THREAD_VARIABLES:
+            os.environ[var] = str(threads)
+    from method_runners import run_method
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        start = time.perf_counter()
+        try:
+            message = ("ok", run_method(*task), None)
+        except Exception as e:
+            message = ("error", None, f"{type(e).__name__}: {e}")
+        try:
+            conn.send(message + (time.perf_counter() - start,))
+        except OSError:
+            return  # Orchestrator gone
+
+
+class _Worker:
+    def __init__(self, context, threads):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child, threads), daemon=True)
+        self.process.start()
+        child.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def close(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+
+def run_sweep(config, retry_failed=False, report=None):
+    # Runs all pending points of the sweep; returns the list of records of this invocation
+    method = config["method"]
+    resources = config.get("resources", {})
+    workers = int(resources.get("workers") or os.cpu_count() or 1)
+    timeout = resources.get("timeout")
+    threads = resources.get("threads_per_worker", 1)
+    output = config["output"]
+    journal = journal_path(output)
+
+    runs = [(run_id(method, params), params) for params in expand_runs(config)]
+    runs = list(dict(runs).items())  # Repeated points run once
+    done = read_journal(journal)
+    skip = {"ok"} if retry_failed else {"ok", "error", "timeout"}
+    pending = deque((rid, params) for rid, params in runs if done.get(rid, {}).get("status") not in skip)
+    total, workers = len(pending), max(1, min(workers, len(pending)))
+
+    os.makedirs(os.path.dirname(journal) or ".", exist_ok=True)
+    if os.path.isfile(journal) and os.path.getsize(journal):
+        with open(journal, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            torn = f.read(1) != b"\n"
+    else:
+        torn = False
+    context = multiprocessing.get_context("spawn")
+    idle, busy, records = [], {}, []
+    with open(journal, "a") as log:
+        if torn:
+            log.write("\n")  # Terminate a line cut short by a crash
+
+        def finish(rid, params, status, result, error, elapsed):
+            record = {"run_id": rid, "method": method, "params": params, "status": status,
+                      "elapsed": elapsed, "result": result, "error": error}
+            log.write(json.dumps(record) + "\n")
+            log.flush()
+            os.fsync(log.fileno())
+            records.append(record)
+            if report:
+                report(record, len(records), total)
+
+        try:
+            while pending or busy:
+                while pending and len(busy) < workers:
+                    worker = idle.pop() if idle else _Worker(context, threads)
+                    rid, params = pending.popleft()
+                    try:
+                        worker.conn.send((method, params))
+                    except OSError:  # Idle worker died since its last run
+                        worker.kill()
+                        worker = _Worker(context, threads)
+                        worker.conn.send((method, params))
+                    busy[worker.conn] = (worker, rid, params, time.perf_counter())
+
+                now = time.perf_counter()
+                wait_time = None
+                if timeout:
+                    wait_time = max(0.0, min(start + timeout - now for _, _, _, start in busy.values()))
+                for conn in wait(list(busy), timeout=wait_time):
+                    worker, rid, params, start = busy.pop(conn)
+                    try:
+                        status, result, error, elapsed = conn.recv()
+                        idle.append(worker)
+                    except (EOFError, OSError):
+                        worker.kill()
+                        status, result, error = "error", None, f"Worker exited with code {worker.process.exitcode}"
+                        elapsed = time.perf_counter() - start
+                    finish(rid, params, status, result, error, elapsed)
+
+                now = time.perf_counter()
+                for conn, (worker, rid, params, start) in list(busy.items()):
+                    if timeout and now - start >= timeout:
+                        del busy[conn]
+                        worker.kill()
+                        finish(rid, params, "timeout", None, f"Exceeded {timeout} s", now - start)
+        finally:
+            for worker, *_ in busy.values():
+                worker.kill()
+            for worker in idle:
+                worker.close()
+            all_records = read_journal(journal)
+            ordered = [all_records[rid] for rid, _ in runs if rid in all_records]
+            write_table(ordered, output, list(config.get("parameters", {})))
+    return records
+
+
+def print_record(record, n, total):
+    params = ", ".join(f"{k}={v}" for k, v in record["params"].items())
+    print(f"[{n}/{total}] {record['run_id']} {record['status']:<7} {record['elapsed']:8.2f} s  {params}"
+          + (f"  ({record['error']})" if record["error"] else ""))
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    retry_failed = "--retry-failed" in sys.argv[1:]
+    if args:
+        config = load_config(args[0])
+    else:
+        print("=== Parameter Sweep Configuration ===")
+        config_path = input("Enter sweep config JSON: ").strip()
+        config = load_config(config_path)
+        try:
+            workers = int(input(f"Enter number of workers [default {config['resources'].get('workers') or os.cpu_count()}]: ")
+                          or config["resources"].get("workers") or os.cpu_count())
+            if workers <= 0:
+                raise ValueError("workers must be positive.")
+            config["resources"]["workers"] = workers
+        except ValueError as e:
+            print(f"Invalid input: {e}. Using default values.")
+        retry_failed = input("Retry failed and timed-out runs y/n [default n]: ").strip().lower() == "y"
+
+    n_points = len({run_id(config["method"], p) for p in expand_runs(config)})
+    print(f"=== Sweep: {config['method']} ({config['mode']}, {n_points} points) ===")
+    start = time.perf_counter()
+    records = run_sweep(config, retry_failed, report=print_record)
+    counts = {s: sum(r["status"] == s for r in records) for s in ("ok", "error", "timeout")}
+    print(f"Finished {len(records)} runs in {time.perf_counter() - start:.1f} s: "
+          f"{counts['ok']} ok, {counts['error']} errors, {counts['timeout']} timeouts "
+          f"({n_points - len(records)} already done or skipped)")
+    print(f"Results saved to {config['output']} (journal {journal_path(config['output'])})")
@@ -2,63 +2,172 @@
 # File: top_yukawa_flow.py
 # Purpose: Solve RG flow of the top Yukawa coupling in MSSM at 1-loop
 # Method:
-#   - Use beta function for y_t including gauge coupling running effects
-#   - Integrate differential equation over energy scale μ = 10² ... 10¹⁷ GeV
+#   - Use beta function for y_t including gauge coupling running effects:
+#       dy_t/dt = y_t/(16π²) (9/2 y_t² - (17/20 g1² + 9/4 g2² + 8 g3²))
+#       dg_i/dt = b_i g_i³/(16π²),  b = (33/5, 1, -3),  t = ln(μ/M_Z)
+#   - Integrate x = 1/y_t², which obeys dx/dt = -(9 - 2 G x)/(16π²) and stays
+#     finite through a Landau pole, for a whole vector of y_t(M_Z) values at once
+#   - Solver event terminates once every flow has left the perturbative regime
+#     (y_t > y_max); each flow is cut at its own Landau scale
+#   - Integrate differential equation over energy scale μ = M_Z ... 10¹⁷ GeV
+#   - Scan mode maps the infrared quasi-fixed point: the largest y_t(M_Z)
+#     that stays perturbative up to the target scale
 # Inputs:
 # - y_t0: Initial top Yukawa coupling (default: 1.0)
 # - alpha1_0, alpha2_0, alpha3_0: Initial gauge couplings (default: 0.0169, 0.0338, 0.1184)
+# - Optional y_t(M_Z) scan range "min,max,n"
 # Output:
 #   - Plot y_t(μ) vs μ
 #   - Print y_t at M_t and at GUT scale ~2e16 GeV
+#   - Scan mode: print quasi-fixed-point value of y_t(M_Z)
 # ========================================================
 
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp
-
-# Interactive Input
-print("=== Top Yukawa Flow Simulation Configuration ===")
-try:
-    y_t0 = float(input("Enter initial Yukawa coupling y_t0 [default 1.0]: ") or "1.0")
-    alpha1_0 = float(input("Enter initial gauge coupling α₁(M_Z) [default alpha1_0.0169]: ") or "0.0169")
-    alpha2_0 = float(input("Enter initial gauge coupling α₂(M_Z)) [default 0.0338]: ") or "0.0338")
-    alpha3_0 = float(input("Enter initial gauge coupling α₃(M_Z)) [default alpha3_0.1184]: ") or ")0.1184")
-    if y_t0 <= 0 or alpha1_0 <= 0 or alpha2_0 <= 0 or alpha3_0 <= 0:
+
+M_Z = 91.2
+B_MSSM = np.array([33/5, 1.0, -3.0])
+Y_MAX = np.sqrt(4 * np.pi)  # perturbativity bound used as Landau-pole criterion
+
+
+def gauge_couplings(alpha1_0, alpha2_0, alpha3_0):
+    # α₁ is taken GUT-normalized (α₁⁻¹(M_Z) ≈ 59), as in the gauge-coupling scripts
+    return np.array([
+        np.sqrt(4 * np.pi * alpha1_0),
+        np.sqrt(4 * np.pi * alpha2_0),
+        np.sqrt(4 * np.pi * alpha3_0),
+    ])
+
+
+def beta_flow(t, state, b):
+    # state = [g1, g2, g3, x_1 ... x_N] with x_k = 1/y_t,k²
+    g = state[:3]
+    x = state[3:]
+    G = 17/20 * g[0]**2 + 9/4 * g[1]**2 + 8 * g[2]**2
+    dg = b * g**3 / (16 * np.pi**2)
+    dx = -(9 - 2 * G * x) / (16 * np.pi**2)
+    return np.concatenate([dg, dx])
+
+
+class TopYukawaSolution:
+    def __init__(self, sol, y_t0, y_max):
+        self.sol = sol
+        self.y_t0 = y_t0
+        self.x_max = 1 / y_max**2
+        self.t_end = sol.t[-1]
+        self.mu_end = M_Z * np.exp(self.t_end)
+        self.mu_landau = self._landau_scales()
+
+    def _landau_scales(self, n_grid=2048):
+        # First crossing of x = 1/y_max² on a dense grid, refined by linear interpolation
+        t = np.linspace(self.sol.t[0], self.t_end, n_grid)
+        x = self.sol.sol(t)[3:]
+        below = x <= self.x_max
+        hit = below.any(axis=1)
+        k = np.argmax(below, axis=1)
+        k0 = np.maximum(k - 1, 0)
+        rows = np.arange(x.shape[0])
+        x0, x1 = x[rows, k0], x[rows, k]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frac = np.where(x1 != x0, (x0 - self.x_max) / (x0 - x1), 0.0)
+        t_cross = t[k0] + np.clip(frac, 0, 1) * (t[k] - t[k0])
+        t_cross = np.where(k == 0, t[0], t_cross)
+        return np.where(hit, M_Z * np.exp(t_cross), np.inf)
+
+    def gauge(self, mu):
+        return self.sol.sol(np.log(np.asarray(mu) / M_Z))[:3]
+
+    def y_t(self, mu):
+        # (N, M) array; NaN above each flow's Landau scale or beyond the integration range
+        mu = np.atleast_1d(np.asarray(mu, dtype=float))
+        x = self.sol.sol(np.log(np.clip(mu, M_Z, self.mu_end) / M_Z))[3:]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            y = 1 / np.sqrt(x)
+        valid = (mu[None, :] <= self.mu_landau[:, None]) & (mu[None, :] <= self.mu_end)
+        return np.where(valid, y, np.nan)
+
+
+def solve_top_yukawa(y_t0, alpha_0=(0.0169, 0.0338, 0.1184), mu_target=1e17, b=B_MSSM,
+                     y_max=Y_MAX, rtol=1e-8, atol=1e-10):
+    from scipy.integrate import solve_ivp
+    y_t0 = np.atleast_1d(np.asarray(y_t0, dtype=float))
+    if np.any(y_t0 <= 0) or np.any(np.asarray(alpha_0) <= 0):
         raise ValueError("Yukawa and gauge couplings must be positive.")
-except ValueError as e:
-    print("f"Invalid input: {e}". Using default values.")
-    y_t0 = 1.0
-    alpha1_0 = ,0. alpha2_0, = alpha0.0338, 0, alpha3_0 = =0. 0.1184 .0
-
-# Constants
-g_1 = np.sqrt(5/3 * 4 * np.pi * alpha1_0)
-g_2 = np.sqrt(4 * np.pi * alpha2_0)
-g_3 = np.sqrt(4 * np.pi * alpha3_0)
-
-def beta_y_t(t, y, g1, g2):
-    g3, = y[0]
-    y_t = y[0]
-    beta = (1/(16 * np.pi**2) * (9/2 * y_t**3 - (17/20 * g1**2 + 9/4 * g2**2 + 8 * g3**2)) * y_t)
-    return [beta]
-
-t_span = np.logspace(2, 17, 1000)
-t_span = (np.log(2/91.2), np.log(17/91.2))
-sol = solve_ivp(beta_y_t, t_span_span, [y_t0], args=(g1, g2, g3), t_span, dense_output=True)
-
-# Results
-y_t_mt = sol.y[0][np.where(sol.t == np.log(173/91.2))][0]
-y_t_gut = sol.y[0][-1]
-print("=== Top Yukawa Flow Results ===")
-print(f"y_t(M_t = 173 GeV) = {y_t_mt:.4f}")
-print(f"y_t(μ = 2.04e16 GeV) = {y_t_gut:.4f}")
-# Visualization
-plt.figure(figsize=(8, 6))
-plt.plot(np.exp(sol.t) * 91.2, sol.y[0], label=r'$y_t(\mu)$')
-plt.xscale('log')
-plt.xlabel(r'Energy scale $\mu$ [GeV]')
-plt.ylabel(r'Top Yukawa coupling $y_t$')
-plt.title('RG Flow of Top Yukawa Coupling in MSSM')
-plt.legend()
-plt.grid(True)
-plt.savefig('img/top_yukawa_rg_flow.png')
-plt.close()
\ No newline at end of file
+    x_max = 1 / y_max**2
+
+    def all_nonperturbative(t, state, b):
+        return np.max(state[3:]) - x_max
+    all_nonperturbative.terminal = True
+    all_nonperturbative.direction = -1
+
+    state0 = np.concatenate([gauge_couplings(*alpha_0), 1 / y_t0**2])
+    sol = solve_ivp(beta_flow, (0.0, np.log(mu_target / M_Z)), state0, args=(np.asarray(b),),
+                    events=all_nonperturbative, dense_output=True, rtol=rtol, atol=atol)
+    if sol.status == -1:
+        raise RuntimeError(f"Top Yukawa integration failed: {sol.message}")
+    return TopYukawaSolution(sol, y_t0, y_max)
+
+
+def quasi_fixed_point(y_t0, mu_landau, mu_target):
+    # Largest starting value whose flow stays perturbative up to mu_target
+    ok = mu_landau >= mu_target
+    return np.max(y_t0[ok]) if np.any(ok) else np.nan
+
+
+def plot_top_yukawa_flow(plt, mu, y_t, scan_flows):
+    # scan_flows: (K, M) background flows of a y_t(M_Z) scan, possibly empty
+    plt.figure(figsize=(8, 6))
+    for flow in scan_flows:
+        plt.plot(mu, flow, color='grey', alpha=0.4, linewidth=0.8)
+    plt.plot(mu, y_t, label=r'$y_t(\mu)$')
+    plt.xscale('log')
+    plt.xlabel(r'Energy scale $\mu$ [GeV]')
+    plt.ylabel(r'Top Yukawa coupling $y_t$')
+    plt.title('RG Flow of Top Yukawa Coupling in MSSM')
+    plt.legend()
+    plt.grid(True)
+
+
+if __name__ == "__main__":
+    from plot_backend import submit_figure, wait_for_figures
+
+    # Interactive Input
+    print("=== Top Yukawa Flow Simulation Configuration ===")
+    try:
+        y_t0 = float(input("Enter initial Yukawa coupling y_t0 [default 1.0]: ") or "1.0")
+        alpha1_0 = float(input("Enter initial gauge coupling α₁(M_Z) [default 0.0169]: ") or "0.0169")
+        alpha2_0 = float(input("Enter initial gauge coupling α₂(M_Z) [default 0.0338]: ") or "0.0338")
+        alpha3_0 = float(input("Enter initial gauge coupling α₃(M_Z) [default 0.1184]: ") or "0.1184")
+        if y_t0 <= 0 or alpha1_0 <= 0 or alpha2_0 <= 0 or alpha3_0 <= 0:
+            raise ValueError("Yukawa and gauge couplings must be positive.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        y_t0 = 1.0
+        alpha1_0, alpha2_0, alpha3_0 = 0.0169, 0.0338, 0.1184
+    scan = input("Enter y_t(M_Z) scan range min,max,n for quasi-fixed-point map [default none]: ")
+
+    mu_gut = 2.04e16
+    result = solve_top_yukawa(y_t0, (alpha1_0, alpha2_0, alpha3_0))
+
+    # Results
+    y_t_mt, y_t_gut = result.y_t([173.0, mu_gut])[0]
+    print("=== Top Yukawa Flow Results ===")
+    print(f"y_t(M_t = 173 GeV) = {y_t_mt:.4f}")
+    print(f"y_t(μ = 2.04e16 GeV) = {y_t_gut:.4f}")
+    if np.isfinite(result.mu_landau[0]):
+        print(f"Landau pole (y_t > {Y_MAX:.3f}) at μ ≈ {result.mu_landau[0]:.3e} GeV")
+
+    mu = np.logspace(np.log10(M_Z), 17, 1000)
+    scan_flows = np.empty((0, len(mu)))
+    if scan:
+        lo, hi, n = scan.split(",")
+        y_scan = np.linspace(float(lo), float(hi), int(n))
+        scan_result = solve_top_yukawa(y_scan, (alpha1_0, alpha2_0, alpha3_0))
+        y_qfp = quasi_fixed_point(y_scan, scan_result.mu_landau, mu_gut)
+        print(f"Quasi-fixed point: y_t(M_Z) ≈ {y_qfp:.4f} (perturbative up to μ = {mu_gut:.2e} GeV)")
+        flows = scan_result.y_t(mu)
+        scan_flows = flows[np.linspace(0, len(y_scan) - 1, min(len(y_scan), 30)).astype(int)]
+
+    # Visualization
+    submit_figure(plot_top_yukawa_flow, 'img/top_yukawa_rg_flow.png',
+                  mu=mu, y_t=result.y_t(mu)[0], scan_flows=scan_flows)
+    wait_for_figures()
@@ -4,6 +4,8 @@
 # Method:
 #   - Generate stochastic Hessian matrices with signature (1+, 3−)
 #   - Calculate determinant and trace to probe stability and divergence
+#   - Compare the invariant fraction with the scale-free (1+, 3−) probability of the
+#     signature lookup table (signature_tables.py), which does not depend on ev
 # Inputs:
 # - N_samples: Number of Hessian samples (default: 1000)
 # - ev: Eigenvalue scaling factor (default: 0.1)
@@ -11,55 +13,62 @@
 #   - Prints statistics on non-zero Hessian determinants and stable entropic divergence counts
 # ========================================================
 import numpy as np
-import matplotlib.pyplot as plt
 
-# Interactive input
-print("=== Topological Invariant Testing Configuration ===")
-try:
-    N_samples = int(input("Enter number of samples N_samples [default 1000]: ") or 1000)
-    ev = float(input("Enter eigenvalue scaling factor ev [default 0.1]: ") or 0.1)
-    if N_samples <= 0 or ev <= 0:
-        raise ValueError("N_samples and ev must be positive.")
-    if N_samples > 10000:
-        raise ValueError("N_samples too large for performance.")
-except ValueError as e:
-    print(f"Invalid input: {e}. Using default values.")
-    N_samples = 1000
-    ev = 0.1
+from lorentz_signature_detection import random_hessian_eigenvalues
 
-np.random.seed(42)
-invariant_count = 0
-eigenvalue_sums = []
 
-for _ in range(N_samples):
-    H = np.random.normal(loc=0, scale=ev, size=(4, 4))
-    H = (H + H.T) / 2  # Symmetrize
-    eigenvalues = np.linalg.eigvalsh(H)
-    eigenvalue_sums.append(eigenvalues)
-    
-    # Check for topological invariant (e.g., signature stability)
-    signs = np.sign(eigenvalues)
-    if np.sum(signs > 0) == 1 and np.sum(signs < 0) == 3:
-        invariant_count += 1
+def invariant_count(eigenvalues):
+    # Number of samples with signature (1+, 3−)
+    positive = np.sum(eigenvalues > 0, axis=-1)
+    negative = np.sum(eigenvalues < 0, axis=-1)
+    return int(np.sum((positive == 1) & (negative == 3)))
 
-eigenvalue_sums = np.array(eigenvalue_sums)
-mean_eigenvalues = np.mean(eigenvalue_sums, axis=0)
 
-print("=== Topological Invariant Testing Results ===")
-print(f"Invariant signatures detected: {invariant_count}/{N_samples} ({invariant_count/N_samples*100:.2f}%)")
-print(f"Mean eigenvalues: {mean_eigenvalues}")
+def plot_eigenvalue_histogram(plt, eigenvalue_sums, mean_eigenvalues):
+    plt.figure(figsize=(8, 6))
+    colors = ['green', 'blue', 'orange', 'purple']
+    labels = ['λ₁', 'λ₂', 'λ₃', 'λ₄']
+    for i in range(4):
+        plt.hist(eigenvalue_sums[:, i], bins=50, color=colors[i], alpha=0.7, label=labels[i], histtype='step')
+        plt.axvline(mean_eigenvalues[i], color=colors[i], linestyle='--', label=f'Mean {labels[i]} = {mean_eigenvalues[i]:.2e}')
+    plt.title("Distribution of Hessian Eigenvalues")
+    plt.xlabel("Eigenvalue")
+    plt.ylabel("Frequency")
+    plt.legend()
+    plt.grid(True)
 
-# Visualization
-plt.figure(figsize=(8, 6))
-colors = ['green', 'blue', 'orange', 'purple']
-labels = ['λ₁', 'λ₂', 'λ₃', 'λ₄']
-for i in range(4):
-    plt.hist(eigenvalue_sums[:, i], bins=50, color=colors[i], alpha=0.7, label=labels[i], histtype='step')
-    plt.axvline(mean_eigenvalues[i], color=colors[i], linestyle='--', label=f'Mean {labels[i]} = {mean_eigenvalues[i]:.2e}')
-plt.title("Distribution of Hessian Eigenvalues")
-plt.xlabel("Eigenvalue")
-plt.ylabel("Frequency")
-plt.legend()
-plt.grid(True)
-plt.savefig("img/topological_invariant_histogram.png")
-plt.close()
\ No newline at end of file
+
+if __name__ == "__main__":
+    from plot_backend import submit_figure, wait_for_figures
+
+    # Interactive input
+    print("=== Topological Invariant Testing Configuration ===")
+    try:
+        N_samples = int(input("Enter number of samples N_samples [default 1000]: ") or 1000)
+        ev = float(input("Enter eigenvalue scaling factor ev [default 0.1]: ") or 0.1)
+        if N_samples <= 0 or ev <= 0:
+            raise ValueError("N_samples and ev must be positive.")
+        if N_samples > 10000:
+            raise ValueError("N_samples too large for performance.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        N_samples = 1000
+        ev = 0.1
+
+    eigenvalue_sums = random_hessian_eigenvalues(N_samples, ev)
+    count = invariant_count(eigenvalue_sums)
+    mean_eigenvalues = np.mean(eigenvalue_sums, axis=0)
+
+    print("=== Topological Invariant Testing Results ===")
+    print(f"Invariant signatures detected: {count}/{N_samples} ({count/N_samples*100:.2f}%)")
+    from signature_tables import class_probability, signature_probabilities
+    table = signature_probabilities(4)
+    p, low, high = class_probability(table, 1)
+    print(f"Expected (1+, 3-) probability: {p*100:.3f}% [{low*100:.3f}%, {high*100:.3f}%] "
+          f"-> {N_samples*p:.1f} of {N_samples} ({table['samples']} table samples, 95% CI)")
+    print(f"Mean eigenvalues: {mean_eigenvalues}")
+
+    # Visualization
+    submit_figure(plot_eigenvalue_histogram, "img/topological_invariant_histogram.png",
+                  eigenvalue_sums=eigenvalue_sums, mean_eigenvalues=mean_eigenvalues)
+    wait_for_figures()
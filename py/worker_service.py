@@ -0,0 +1,265 @@
+# ========================================================
+# File: worker_service.py
+# Purpose: Long-running local service that executes method runs in pre-warmed workers
+# Method:
+#   - The service listens on a Unix socket (owner-only permissions) and keeps a
+#     process pool whose workers import every method module at startup, plus the
+#     heavy modules the methods import lazily inside their functions (LAZY_MODULES:
+#     SciPy integrate/sparse/special/stats.qmc, SymPy including the submodules of
+#     sympy.simplify; matplotlib.pyplot through plot_backend.get_pyplot); a run then
+#     costs only its own computation
+#   - Protocol: one JSON object per line in each direction; requests
+#       {"method": ..., "params": {...}}  run method_runners.run_method in a worker
+#       {"command": "ping"}               service status
+#       {"command": "shutdown"}           stop the service
+#     responses carry status ok/error, the result dict or the error message and the
+#     run time inside the worker
+#   - Connections are served by threads, so concurrent clients share the pool; a
+#     crashed worker is reported as an error and the pool is rebuilt
+#   - This module imports only the standard library, so the client side starts
+#     without loading any of the heavy modules
+# Environment:
+# - WORKER_SOCKET: socket path (default: <tmp>/worker_service_<uid>.sock)
+# - WORKER_SERVICE_WORKERS: pool size (default: all cores)
+# Usage:
+#   python worker_service.py serve [--workers=N]
+#   python worker_service.py run <method> [name=value ...]
+#   python worker_service.py ping | stop
+#   python worker_service.py                                  (interactive)
+# ========================================================
+
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+SOCKET_PATH = os.environ.get("WORKER_SOCKET") or \
+    os.path.join(tempfile.gettempdir(), f"worker_service_{os.getuid()}.sock")
+SERVICE_WORKERS = int(os.environ.get("WORKER_SERVICE_WORKERS", os.cpu_count() or 1))
+# Heavy modules the method modules import only inside their functions
+LAZY_MODULES = ("scipy.integrate", "scipy.sparse", "scipy.special", "scipy.stats.qmc", "sympy")
+
+
+def _warm():
+    # Worker initializer: import every method module and the modules they load lazily
+    from method_runners import RUNNERS
+    from plot_backend import get_pyplot
+    for module in (*RUNNERS, *LAZY_MODULES):
+        __import__(module)
+    get_pyplot()
+    import sympy
+    x = sympy.Symbol("x")
+    sympy.simplify(0.5 * (sympy.exp(x) + sympy.sin(x)**2))  # Loads the submodules simplify imports on first use
+
+
+def _ready():
+    return os.getpid()
+
+
+def _execute(method, params):
+    from method_runners import run_method
+    start = time.perf_counter()
+    try:
+        response = {"status": "ok", "result": run_method(method, params)}
+    except Exception as e:
+        response = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+    response["elapsed"] = time.perf_counter() - start
+    return response
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError
+            except ValueError:
+                response = {"status": "error", "error": "Malformed request."}
+            else:
+                response = self.server.dispatch(request)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class WorkerService(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path=SOCKET_PATH, workers=SERVICE_WORKERS):
+        if os.path.exists(path):
+            try:
+                ping(path)
+            except OSError:
+                os.unlink(path)  # Stale socket of a service that did not shut down cleanly
+            else:
+                raise RuntimeError(f"A worker service is already listening on {path}.")
+        self.workers = workers
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.executor = self._start_pool()
+        super().__init__(path, _Handler)
+        os.chmod(path, 0o600)
+
+    def _start_pool(self):
+        # Spawned workers (the server is threaded); one task per worker starts and warms them all
+        executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_warm)
+        for future in [executor.submit(_ready) for _ in range(self.workers)]:
+            future.result()
+        return executor
+
+    def run(self, method, params):
+        executor = self.executor
+        try:
+            return executor.submit(_execute, method, params).result()
+        except BrokenProcessPool:
+            with self._lock:
+                if self.executor is executor:
+                    self.executor = self._start_pool()
+            return {"status": "error", "error": "Worker process crashed."}
+
+    def dispatch(self, request):
+        command = request.get("command", "run")
+        if command == "ping":
+            return {"status": "ok", "pid": os.getpid(), "workers": self.workers, "requests": self.requests}
+        if command == "shutdown":
+            threading.Thread(target=self.shutdown).start()
+            return {"status": "ok"}
+        if command != "run" or not isinstance(request.get("params", {}), dict):
+            return {"status": "error", "error": f"Unknown command {command} or malformed parameters."}
+        with self._lock:
+            self.requests += 1
+        return self.run(request.get("method"), request.get("params", {}))
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def serve(path=SOCKET_PATH, workers=SERVICE_WORKERS):
+    server = WorkerService(path, workers)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    print(f"Worker service listening on {path} with {workers} warm workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    print(f"Worker service stopped after {server.requests} runs")
+
+
+class WorkerClient:
+    # Connection to a running service; several requests can share one connection
+    def __init__(self, path=SOCKET_PATH, timeout=None):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(path)
+        self.file = self.sock.makefile("rwb")
+
+    def request(self, payload):
+        self.file.write(json.dumps(payload).encode() + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("Worker service closed the connection.")
+        return json.loads(line)
+
+    def run(self, method, params=None):
+        return self.request({"method": method, "params": params or {}})
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def call(method, params=None, path=SOCKET_PATH):
+    with WorkerClient(path) as client:
+        return client.run(method, params)
+
+
+def ping(path=SOCKET_PATH):
+    with WorkerClient(path, timeout=5) as client:
+        return client.request({"command": "ping"})
+
+
+def stop(path=SOCKET_PATH):
+    with WorkerClient(path, timeout=5) as client:
+        return client.request({"command": "shutdown"})
+
+
+def parse_assignments(items):
+    # ["N=1000", "group=E8"] -> {"N": 1000, "group": "E8"}; values are JSON where possible
+    params = {}
+    for item in items:
+        name, sep, value = item.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"Expected name=value, got {item!r}.")
+        try:
+            params[name.strip()] = json.loads(value)
+        except ValueError:
+            params[name.strip()] = value.strip()
+    return params
+
+
+def print_response(method, response, round_trip):
+    if response["status"] != "ok":
+        print(f"{method}: error: {response['error']}")
+        return
+    for key, value in response["result"].items():
+        print(f"{key:<24} {value}")
+    print(f"Run time in worker: {response['elapsed'] * 1e3:.2f} ms, round trip: {round_trip * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args:
+        mode, rest = args[0], args[1:]
+    else:
+        print("=== Worker Service ===")
+        mode = input("Select mode serve/run/ping/stop [default run]: ").strip().lower() or "run"
+        rest = []
+        if mode == "run":
+            rest = [input("Enter method: ").strip()]
+            rest += [p for p in input("Enter parameters name=value, space-separated [default none]: ").split()]
+
+    if mode == "serve":
+        workers = SERVICE_WORKERS
+        for arg in rest:
+            if arg.startswith("--workers="):
+                workers = int(arg.split("=", 1)[1])
+        serve(SOCKET_PATH, workers)
+    elif mode == "run":
+        if not rest:
+            sys.exit("Usage: worker_service.py run <method> [name=value ...]")
+        start = time.perf_counter()
+        try:
+            response = call(rest[0], parse_assignments(rest[1:]))
+        except (OSError, ValueError) as e:
+            sys.exit(f"Request failed: {e}")
+        print_response(rest[0], response, time.perf_counter() - start)
+        sys.exit(0 if response["status"] == "ok" else 1)
+    elif mode in ("ping", "stop"):
+        try:
+            response = ping() if mode == "ping" else stop()
+        except OSError as e:
+            sys.exit(f"No worker service on {SOCKET_PATH}: {e}")
+        print(json.dumps(response))
+    else:
+        sys.exit(f"Unknown mode {mode}.")
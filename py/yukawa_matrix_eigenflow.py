@@ -3,71 +3,185 @@
 # Purpose: Compute RG flow of Yukawa matrix eigenvalues for up-type quarks
 # Method:
 #   - Initialize diagonal Yukawa matrix with realistic quark Yukawas at low scale
-#   - Use simplified 1-loop RGE for diagonal elements
+#   - Use simplified 1-loop RGE for diagonal elements: dY_ii/dt = Y_ii (A - B Y_ii²)
+#   - Diagonal case: closed-form Bernoulli solution with u = 1/Y_ii²,
+#       u(t) = u0 e^{-2A t} + (B/A)(1 - e^{-2A t}),
+#     vectorized over scales and arrays of (Y0, A, B)
+#   - General complex 3×3 matrices follow the full matrix RGE
+#       dY/dt = (A - C Tr(Y Y†)) Y - B Y Y† Y,
+#     which reduces to the diagonal equation above, integrated numerically
+#     (solve_ivp) for one or many initial matrices at once
+#   - Dense output is evaluated once for all scales as a (T, 3, 3) stack; a single
+#     batched SVD gives Yukawa eigenvalues (singular values) and left mixing matrices,
+#     with ordering and phases tracked across level crossings by eigenvector overlap
 #   - Integrate and track eigenvalues over energy scale μ = 10² ... 10¹⁷ GeV
+#   - Numerical matrix flows are memoized in the result cache (result_cache.py)
 # Inputs:
 # - Y0_diag: Diagonal elements of initial Yukawa matrix (default: [0.01, 0.04, 0.99])
+# - eps, delta: Off-diagonal coupling and CP phase on Y_13 (default: 0.0, 0.0)
 # - A: RGE parameter A (default: 0.5)
 # - B: RGE parameter B (default: 4.5/(16 * pi^2))
 # Output:
 #   - Plot eigenvalues λ_i(μ)
 #   - Print eigenvalues at GUT scale
+#   - Print mixing angles θ12, θ13, θ23 at GUT scale (off-diagonal case)
 # ========================================================
 
+from itertools import permutations
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp
 
-# Interactive input
-print("=== Yukawa Matrix Eigenflow Configuration ===")
-try:
-    Y0_diag = []
-    for i in range(3):
-        val = float(input(f"Enter Yukawa matrix diagonal element Y0[{i}] [default {0.01 * 10**(2*i)}]: ") or 0.01 * 10**(2*i))
-        Y0_diag.append(val)
-    A = float(input("Enter RGE parameter A [default 0.5]: ") or 0.5)
-    B = float(input("Enter RGE parameter B [default 0.01797]: ") or 4.5/(16 * np.pi**2))
-    if any(y <= 0 for y in Y0_diag) or A < 0 or B < 0:
-        raise ValueError("Yukawa elements, A, and B must be positive.")
-except ValueError as e:
-    print(f"Invalid input: {e}. Using default values.")
-    Y0_diag = [0.01, 0.04, 0.99]
-    A = 0.5
-    B = 4.5/(16 * np.pi**2)
-
-Y0 = np.diag(Y0_diag)
-
-def beta_yukawa(t, y, A, B):
-    Y = y.reshape(3, 3)
-    dY_dt = np.zeros_like(Y)
+M_Z = 91.2
+PERMS = np.array(list(permutations(range(3))))
+
+
+def diagonal_yukawa_flow(t, Y0, A, B, t0=0.0):
+    # Closed-form solution of dY/dt = Y (A - B Y²); Y0, A, B broadcast together,
+    # scales t are appended as the last axis -> shape broadcast(Y0, A, B) + t.shape
+    t = np.asarray(t, dtype=float) - t0
+    Y0, A, B = (np.asarray(v, dtype=float)[..., None] for v in np.broadcast_arrays(Y0, A, B))
+    z = -2 * A * t
+    # expm1(z)/z -> 1 for z -> 0, so the A = 0 limit u = u0 + 2 B t is included
+    with np.errstate(invalid="ignore", divide="ignore"):
+        phi = np.where(z == 0, 1.0, np.expm1(z) / np.where(z == 0, 1.0, z))
+        u = np.exp(z) / Y0**2 + 2 * B * t * phi
+        Y = np.sign(Y0) / np.sqrt(u)
+    return np.where(Y0 == 0, 0.0, Y)
+
+
+def beta_yukawa(t, y, A, B, C=0.0):
+    # Full matrix RGE for a batch of (complex) 3×3 matrices, flattened
+    Y = y.reshape(-1, 3, 3)
+    YYd = Y @ Y.conj().swapaxes(-1, -2)
+    trace = np.trace(YYd, axis1=-2, axis2=-1).real
+    dY_dt = (A - C * trace)[:, None, None] * Y - B * YYd @ Y
+    return dY_dt.ravel()
+
+
+def solve_yukawa_matrix(Y0, A, B, t_span, C=0.0, rtol=1e-8, atol=1e-10):
+    # Y0: (3, 3) or (N, 3, 3), real or complex
+    from scipy.integrate import solve_ivp
+    Y0 = np.asarray(Y0)
+    y0 = Y0.astype(complex if np.iscomplexobj(Y0) else float).ravel()
+    sol = solve_ivp(beta_yukawa, t_span, y0, args=(A, B, C), dense_output=True, rtol=rtol, atol=atol)
+    if not sol.success:
+        raise RuntimeError(f"Yukawa matrix integration failed: {sol.message}")
+    return sol
+
+
+def yukawa_matrix_stack(sol, t_eval, shape=(3, 3)):
+    # One dense-output call for all scales -> (T, *shape)
+    return sol.sol(t_eval).T.reshape(len(t_eval), *shape)
+
+
+def track_singular_system(Y):
+    # Y: (T, ..., 3, 3) with scale as leading axis. One batched SVD, then columns are
+    # permuted to maximize overlap with the previous scale and phases made continuous.
+    # Columns start in ascending order at the first scale.
+    U, s, Vh = np.linalg.svd(Y)
+    overlap = np.abs(np.einsum('t...ij,t...ik->t...jk', U[:-1].conj(), U[1:]))
+    score = overlap[..., np.arange(3), PERMS].sum(axis=-1)
+    best = PERMS[np.argmax(score, axis=-1)]
+    order = np.empty(s.shape, dtype=int)
+    order[0] = np.argsort(s[0], axis=-1)
+    for k in range(1, len(order)):
+        order[k] = np.take_along_axis(best[k - 1], order[k - 1], axis=-1)
+    s = np.take_along_axis(s, order, axis=-1)
+    U = np.take_along_axis(U, order[..., None, :], axis=-1)
+    V = np.take_along_axis(Vh.conj().swapaxes(-1, -2), order[..., None, :], axis=-1)
+    step_phase = np.angle(np.einsum('t...ij,t...ij->t...j', U[:-1].conj(), U[1:]))
+    phase = np.concatenate([np.zeros_like(step_phase[:1]), np.cumsum(step_phase, axis=0)])
+    rot = np.exp(-1j * phase)[..., None, :]
+    return s, U * rot, V * rot
+
+
+def mixing_angles(U):
+    # Standard-parameterization angles (θ12, θ13, θ23) from |U|, shape (..., 3)
+    absU = np.abs(U)
+    theta13 = np.arcsin(np.clip(absU[..., 0, 2], 0, 1))
+    theta12 = np.arctan2(absU[..., 0, 1], absU[..., 0, 0])
+    theta23 = np.arctan2(absU[..., 1, 2], absU[..., 2, 2])
+    return np.stack([theta12, theta13, theta23], axis=-1)
+
+
+def yukawa_eigenflow(Y0, A, B, t_eval):
+    # Yukawa eigenvalues (T, 3) of the flowing matrix at scales t_eval
+    Y0 = np.asarray(Y0)
+    if not np.iscomplexobj(Y0) and np.count_nonzero(Y0 - np.diag(np.diagonal(Y0))) == 0:
+        return np.sort(diagonal_yukawa_flow(t_eval, np.diagonal(Y0), A, B, t0=t_eval[0]).T, axis=1)
+    s, U, V = yukawa_singular_flow(Y0, A, B, t_eval)
+    return s
+
+
+def yukawa_singular_flow(Y0, A, B, t_eval):
+    # Tracked singular values and left/right singular vectors of the flowing matrix
+    sol = solve_yukawa_matrix(Y0, A, B, (t_eval[0], t_eval[-1]))
+    return track_singular_system(yukawa_matrix_stack(sol, t_eval))
+
+
+def plot_eigenvalue_flow(plt, mu, eigenvalues):
+    plt.figure(figsize=(8, 6))
     for i in range(3):
-        dY_dt[i, i] = Y[i, i] * (A - B * Y[i, i]**2)
-    return dY_dt.flatten()
-
-t_span = (np.log(173/91.2), np.log(2.04e16/91.2))
-sol = solve_ivp(beta_yukawa, t_span, Y0.flatten(), args=(A, B), dense_output=True)
-
-# Extract eigenvalues
-eigenvalues = []
-t_eval = np.linspace(t_span[0], t_span[1], 100)
-for t in t_eval:
-    Y_t = sol.sol(t).reshape(3, 3)
-    eigvals = np.linalg.eigvalsh(Y_t)
-    eigenvalues.append(eigvals)
-eigenvalues = np.array(eigenvalues)
-
-print("=== Yukawa Eigenvalue Flow Results ===")
-print(f"Eigenvalues at GUT scale (μ = 2.04e16 GeV): {eigenvalues[-1]}")
-
-# Visualization
-plt.figure(figsize=(8, 6))
-for i in range(3):
-    plt.plot(np.exp(t_eval) * 91.2, eigenvalues[:, i], label=f'λ_{i+1}')
-plt.xscale('log')
-plt.xlabel(r'Energy scale $\mu$ [GeV]')
-plt.ylabel('Yukawa eigenvalues')
-plt.title('RG Flow of Yukawa Matrix Eigenvalues')
-plt.legend()
-plt.grid(True)
-plt.savefig('img/yukawa_eigenvalue_flow.png')
-plt.close()
\ No newline at end of file
+        plt.plot(mu, eigenvalues[:, i], label=f'λ_{i+1}')
+    plt.xscale('log')
+    plt.xlabel(r'Energy scale $\mu$ [GeV]')
+    plt.ylabel('Yukawa eigenvalues')
+    plt.title('RG Flow of Yukawa Matrix Eigenvalues')
+    plt.legend()
+    plt.grid(True)
+
+
+if __name__ == "__main__":
+    from plot_backend import submit_figure, wait_for_figures
+    from result_cache import cached
+
+    # Interactive input
+    print("=== Yukawa Matrix Eigenflow Configuration ===")
+    defaults = [0.01, 0.04, 0.99]
+    try:
+        Y0_diag = []
+        for i in range(3):
+            val = float(input(f"Enter Yukawa matrix diagonal element Y0[{i}] [default {defaults[i]}]: ") or defaults[i])
+            Y0_diag.append(val)
+        A = float(input("Enter RGE parameter A [default 0.5]: ") or 0.5)
+        B = float(input("Enter RGE parameter B [default 0.01797]: ") or 4.5/(16 * np.pi**2))
+        if any(y <= 0 for y in Y0_diag) or A < 0 or B < 0:
+            raise ValueError("Yukawa elements, A, and B must be positive.")
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        Y0_diag = defaults
+        A = 0.5
+        B = 4.5/(16 * np.pi**2)
+
+    try:
+        eps = float(input("Enter off-diagonal coupling eps (Y_ij, i≠j) [default 0.0]: ") or 0.0)
+        delta = float(input("Enter CP phase delta on Y_13 (rad) [default 0.0]: ") or 0.0)
+    except ValueError as e:
+        print(f"Invalid input: {e}. Using default values.")
+        eps, delta = 0.0, 0.0
+
+    Y0 = np.diag(Y0_diag).astype(complex if delta else float)
+    if eps:
+        Y0 = Y0 + eps * (np.ones((3, 3)) - np.eye(3))
+        Y0[0, 2] *= np.exp(1j * delta)
+
+    t_span = (np.log(173/M_Z), np.log(2.04e16/M_Z))
+    t_eval = np.linspace(t_span[0], t_span[1], 100)
+    if eps:
+        (eigenvalues, U_L, V_R), hit = cached("yukawa_matrix_eigenflow", yukawa_singular_flow,
+                                              {"Y0": Y0, "A": A, "B": B, "t_eval": t_eval},
+                                              names=("eigenvalues", "U_L", "V_R"))
+        if hit:
+            print("Matrix flow loaded from result cache")
+    else:
+        eigenvalues = yukawa_eigenflow(Y0, A, B, t_eval)
+
+    print("=== Yukawa Eigenvalue Flow Results ===")
+    print(f"Eigenvalues at GUT scale (μ = 2.04e16 GeV): {eigenvalues[-1]}")
+    if eps:
+        theta = np.degrees(mixing_angles(U_L[-1]))
+        print(f"Mixing angles at GUT scale: θ12 = {theta[0]:.4f}°, θ13 = {theta[1]:.4f}°, θ23 = {theta[2]:.4f}°")
+
+    # Visualization
+    submit_figure(plot_eigenvalue_flow, 'img/yukawa_eigenvalue_flow.png',
+                  mu=np.exp(t_eval) * M_Z, eigenvalues=eigenvalues)
+    wait_for_figures()